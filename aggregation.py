@@ -0,0 +1,182 @@
+from constants import WEATHER_ATTRIBUTES
+from quantiles import QuantileSketch
+from reading_store import WeatherReadingStore
+
+
+class AttributeAggregate:
+    """Running count, sum, maximum and minimum of one weather attribute."""
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max_value = None
+        self.max_position = None
+        self.min_value = None
+        self.min_position = None
+
+    def add(self, attribute_value, position):
+        """
+        Add a valid attribute value to the running statistics.
+
+        The first occurrence of the maximum and the minimum is kept, as max() and min() do.
+
+        Args:
+            attribute_value (int | float): A present, non-zero attribute value.
+            position (int): Position of the reading the value belongs to.
+        """
+        self.count += 1
+        self.total += attribute_value
+
+        if self.max_value is None or attribute_value > self.max_value:
+            self.max_value = attribute_value
+            self.max_position = position
+
+        if self.min_value is None or attribute_value < self.min_value:
+            self.min_value = attribute_value
+            self.min_position = position
+
+
+class WeatherAggregate:
+    """
+    Statistics of every weather attribute, gathered in a single pass over the readings.
+
+    Values are validated with the same truthiness check WeatherReadingValidator uses,
+    so missing and zero values are skipped.
+    """
+    def __init__(self, weather_readings, weather_attributes=WEATHER_ATTRIBUTES):
+        self.weather_readings = weather_readings
+        self.attribute_aggregates = {
+            weather_attribute: AttributeAggregate()
+            for weather_attribute in weather_attributes
+        }
+
+        self.aggregate_readings()
+
+    def iter_value_rows(self):
+        """
+        Iterate over the aggregated attribute values of every reading.
+
+        Yields:
+            tuple[int | None, ...]: Attribute values of one reading, in attribute_aggregates order.
+        """
+        weather_attributes = list(self.attribute_aggregates)
+
+        if isinstance(self.weather_readings, WeatherReadingStore) and weather_attributes == WEATHER_ATTRIBUTES:
+            yield from self.weather_readings.iter_value_rows()
+        else:
+            for weather_reading in self.weather_readings:
+                yield tuple(
+                    getattr(weather_reading, weather_attribute)
+                    for weather_attribute in weather_attributes
+                )
+
+    def aggregate_readings(self):
+        """Read every reading once and update the statistics of all attributes."""
+        attribute_aggregates = list(self.attribute_aggregates.values())
+
+        for position, attribute_values in enumerate(self.iter_value_rows()):
+            for attribute_aggregate, attribute_value in zip(attribute_aggregates, attribute_values):
+                if attribute_value:
+                    attribute_aggregate.add(attribute_value, position)
+
+    def get_max_readings(self):
+        """
+        Return the reading holding the maximum value of each attribute.
+
+        Returns:
+            dict[str, WeatherReading]: Mapping of attribute to its maximum reading.
+            Attributes without any valid value are left out, like find_max_reading_per_attribute does.
+        """
+        return {
+            weather_attribute: self.weather_readings[attribute_aggregate.max_position]
+            for weather_attribute, attribute_aggregate in self.attribute_aggregates.items()
+            if attribute_aggregate.count
+        }
+
+    def get_totals(self, weather_attribute):
+        """
+        Return the sum and count of the valid values of an attribute.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            tuple[int | float, int]: Sum and count of the valid values.
+        """
+        attribute_aggregate = self.attribute_aggregates[weather_attribute]
+
+        return attribute_aggregate.total, attribute_aggregate.count
+
+    def get_percentiles(self, weather_attribute, percentiles):
+        """
+        Return exact percentiles of the valid values of an attribute.
+
+        The values are read again from the readings, only when percentiles are requested.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+            percentiles (Iterable[int]): Percentiles between 0 and 100.
+
+        Returns:
+            list[int] | None: One value per percentile, or None if there is no valid value.
+        """
+        if isinstance(self.weather_readings, WeatherReadingStore):
+            attribute_values = self.weather_readings.get_present_values(weather_attribute)
+        else:
+            attribute_values = [
+                getattr(weather_reading, weather_attribute)
+                for weather_reading in self.weather_readings
+                if getattr(weather_reading, weather_attribute)
+            ]
+
+        return QuantileSketch.from_values(attribute_values).get_percentiles(percentiles)
+
+
+class IndexedWeatherAggregates:
+    """
+    Period aggregates computed on demand from a WeatherReadingIndex.
+
+    Offers the get_year_rollup and get_month_rollup interface of WeatherRollups, so
+    reports can be answered by any WeatherCalculator backend instead of ingest-time rollups.
+    """
+    def __init__(self, weather_index, weather_calculator):
+        self.weather_index = weather_index
+        self.weather_calculator = weather_calculator
+
+    def get_year_rollup(self, year):
+        """
+        Aggregate the readings of a year.
+
+        Args:
+            year (int): The year.
+
+        Returns:
+            WeatherAggregate: Statistics of the year's readings, empty if it has none.
+        """
+        return self.weather_calculator.aggregate_weather_readings(self.weather_index.get_readings(year))
+
+    def get_months(self):
+        """
+        Return the months of the indexed readings.
+
+        Returns:
+            list[tuple[int, int]]: (year, month) pairs in ascending order.
+        """
+        return sorted(self.weather_index.month_buckets)
+
+    def get_month_rollup(self, year, month):
+        """
+        Aggregate the readings of a month.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+
+        Returns:
+            WeatherAggregate | None: Statistics of the month's readings, or None if it has none.
+        """
+        monthly_weather_readings = self.weather_index.get_readings(year, month)
+
+        if not monthly_weather_readings:
+            return None
+
+        return self.weather_calculator.aggregate_weather_readings(monthly_weather_readings)
@@ -0,0 +1,156 @@
+"""
+Generate a synthetic weather archive in the CSV layout WeatherDataParser reads.
+
+Each station-year is written as twelve monthly files named like the real archive
+(e.g. Station003_weather_2004_Aug.txt). Stations alternate between the PKT and PKST
+date columns, and a share of the values is left blank to exercise the validators.
+
+Usage:
+    python benchmarks/generate_weather_archive.py DIRECTORY [--station-years N] [--seed SEED]
+"""
+import argparse
+import calendar
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from constants import (  # noqa: E402
+    DATE_COLUMNS,
+    MAX_TEMPERATURE,
+    MEAN_HUMIDITY,
+    MIN_TEMPERATURE,
+)
+
+ARCHIVE_FIRST_YEAR = 1996
+ARCHIVE_YEARS_PER_STATION = 20
+MAX_STATION_YEARS = 1000
+MISSING_VALUE_RATIO = 0.02
+OTHER_COLUMNS = [
+    "Mean TemperatureC", "Max Dew PointC", "MeanDew PointC", "Min DewpointC", "Max Humidity",
+    " Min Humidity", " Max Sea Level PressurehPa", " Mean Sea Level PressurehPa",
+    " Min Sea Level PressurehPa", " Max VisibilityKm", " Mean VisibilityKm", " Min VisibilitykM",
+    " Max Wind SpeedKm/h", " Mean Wind SpeedKm/h", " Max Gust SpeedKm/h", "Precipitationmm",
+    " CloudCover", " Events", "WindDirDegrees",
+]
+
+
+def format_value(value, random_generator, missing_value_ratio):
+    """
+    Format a generated value, leaving it blank for a share of the rows.
+
+    Args:
+        value (int): Generated value.
+        random_generator (random.Random): Source of randomness.
+        missing_value_ratio (float): Probability of a blank value.
+
+    Returns:
+        str: The value as written to the CSV file.
+    """
+    return "" if random_generator.random() < missing_value_ratio else str(value)
+
+
+def generate_month_rows(year, month, random_generator, missing_value_ratio):
+    """
+    Generate the CSV rows of one month with a seasonal temperature curve.
+
+    Args:
+        year (int): Year of the month.
+        month (int): Month (1–12).
+        random_generator (random.Random): Source of randomness.
+        missing_value_ratio (float): Probability of a blank value.
+
+    Yields:
+        list[str]: Date, max temperature, min temperature and mean humidity of one day.
+    """
+    seasonal_temp = 18 - 14 * math.cos((month - 1) / 12 * 2 * math.pi)
+
+    for day in range(1, calendar.monthrange(year, month)[1] + 1):
+        max_temp = round(seasonal_temp + random_generator.gauss(6, 3))
+        min_temp = max_temp - random_generator.randint(4, 14)
+        mean_humidity = random_generator.randint(15, 100)
+
+        yield [
+            f"{year}-{month}-{day}",
+            format_value(max_temp, random_generator, missing_value_ratio),
+            format_value(min_temp, random_generator, missing_value_ratio),
+            format_value(mean_humidity, random_generator, missing_value_ratio),
+        ]
+
+
+def generate_weather_archive(
+        directory, station_years=1, seed=0, first_year=ARCHIVE_FIRST_YEAR,
+        years_per_station=ARCHIVE_YEARS_PER_STATION, missing_value_ratio=MISSING_VALUE_RATIO
+):
+    """
+    Write a synthetic weather archive.
+
+    Args:
+        directory (str | Path): Directory the weather files are written to.
+        station_years (int): Number of station-years to generate (1–1000).
+        seed (int): Seed of the random generator, so archives can be regenerated exactly.
+        first_year (int): First year of every station.
+        years_per_station (int): Years generated per station before the next station starts.
+        missing_value_ratio (float): Probability of a blank value.
+
+    Returns:
+        list[Path]: The written weather files.
+
+    Raises:
+        ValueError: If station_years is outside 1–1000.
+    """
+    if not 1 <= station_years <= MAX_STATION_YEARS:
+        raise ValueError(f"Station-years must be between 1 and {MAX_STATION_YEARS}, got {station_years}.")
+
+    random_generator = random.Random(seed)
+    archive_directory = Path(directory)
+    archive_directory.mkdir(parents=True, exist_ok=True)
+    weather_files = []
+
+    for station_year in range(station_years):
+        station_number, year_offset = divmod(station_year, years_per_station)
+        year = first_year + year_offset
+        header = ",".join([
+            DATE_COLUMNS[station_number % len(DATE_COLUMNS)], MAX_TEMPERATURE, MIN_TEMPERATURE, MEAN_HUMIDITY,
+            *OTHER_COLUMNS,
+        ])
+
+        for month in range(1, 13):
+            weather_file = archive_directory / (
+                f"Station{station_number + 1:03d}_weather_{year}_{calendar.month_abbr[month]}.txt"
+            )
+            file_lines = [header]
+
+            for date_str, max_temp, min_temp, mean_humidity in generate_month_rows(
+                year, month, random_generator, missing_value_ratio
+            ):
+                file_lines.append(",".join([
+                    date_str, max_temp, min_temp, mean_humidity,
+                    *([""] * len(OTHER_COLUMNS)),
+                ]))
+
+            weather_file.write_text("\n".join(file_lines) + "\n", encoding="utf-8")
+            weather_files.append(weather_file)
+
+    return weather_files
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="Generate a synthetic WeatherMan archive")
+    argument_parser.add_argument("directory")
+    argument_parser.add_argument("--station-years", type=int, default=1)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    args = argument_parser.parse_args()
+
+    try:
+        weather_files = generate_weather_archive(args.directory, args.station_years, args.seed)
+    except ValueError as station_years_error:
+        argument_parser.error(str(station_years_error))
+
+    print(f"Wrote {len(weather_files)} weather files to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
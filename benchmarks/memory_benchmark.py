@@ -0,0 +1,100 @@
+"""
+Measure the memory held per WeatherReading, before and after the compact representation.
+
+"before" is the original reading class: a plain object with an instance __dict__ and
+its own datetime.date. "after" is the current __slots__ WeatherReading. Both are
+rebuilt, date objects included, from a parsed archive (a generated one by default) and
+measured with tracemalloc.
+
+Usage:
+    python benchmarks/memory_benchmark.py [DIRECTORY] [--station-years N]
+"""
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from generate_weather_archive import generate_weather_archive  # noqa: E402
+from parser import WeatherDataParser  # noqa: E402
+from weather_reading import WeatherReading  # noqa: E402
+
+
+class DictWeatherReading:
+    """The original WeatherReading layout, kept here as the baseline."""
+    def __init__(self, date, max_temp, min_temp, mean_humidity):
+        self.date = date
+        self.max_temp = max_temp
+        self.min_temp = min_temp
+        self.mean_humidity = mean_humidity
+
+
+def measure_bytes_per_reading(build_reading, reading_values):
+    """
+    Measure the memory allocated per reading built from parsed values.
+
+    Args:
+        build_reading (Callable): Builds one reading from (date ordinal, max, min, humidity).
+        reading_values (list[tuple]): Values of the readings to build.
+
+    Returns:
+        float: Allocated bytes per reading, excluding the list holding them.
+    """
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    weather_readings = [None] * len(reading_values)
+    allocated_before = tracemalloc.get_traced_memory()[0]
+
+    for reading_index, values in enumerate(reading_values):
+        weather_readings[reading_index] = build_reading(*values)
+
+    allocated_bytes = tracemalloc.get_traced_memory()[0] - allocated_before
+    tracemalloc.stop()
+
+    return allocated_bytes / len(weather_readings)
+
+
+def build_dict_reading(date_ordinal, max_temp, min_temp, mean_humidity):
+    return DictWeatherReading(date.fromordinal(date_ordinal), max_temp, min_temp, mean_humidity)
+
+
+def build_slots_reading(date_ordinal, max_temp, min_temp, mean_humidity):
+    return WeatherReading(date.fromordinal(date_ordinal), max_temp, min_temp, mean_humidity)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="WeatherReading memory benchmark")
+    argument_parser.add_argument(
+        "directory", nargs="?",
+        help="Archive to read readings from; a synthetic archive is generated when omitted."
+    )
+    argument_parser.add_argument("--station-years", type=int, default=20)
+    args = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="weatherman_benchmark_") as synthetic_directory:
+        directory = args.directory or synthetic_directory
+
+        if not args.directory:
+            generate_weather_archive(directory, args.station_years)
+
+        reading_values = [
+            (reading.date_ordinal, reading.max_temp, reading.min_temp, reading.mean_humidity)
+            for reading in WeatherDataParser.parse_directory_to_readings(directory)
+        ]
+
+    print(f"{len(reading_values)} readings")
+
+    for representation, build_reading in [
+        ("before (__dict__ + date)", build_dict_reading),
+        ("after (__slots__ + date)", build_slots_reading),
+    ]:
+        print(f"{representation:>24}: {measure_bytes_per_reading(build_reading, reading_values):6.1f} bytes/reading")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare the csv.DictReader based WeatherDataParser with the faster parser backends.
+
+Usage:
+    python benchmarks/parser_benchmark.py [DIRECTORY] [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from constants import DEFAULT_WEATHER_DIR_PATH  # noqa: E402
+from parser import WEATHER_DATA_PARSERS  # noqa: E402
+
+
+def time_parser(weather_data_parser, directory, repeat):
+    """
+    Time parsing a directory with a parser, keeping the best of several runs.
+
+    Args:
+        weather_data_parser (type[WeatherDataParser]): Parser class to time.
+        directory (str | Path): Directory of weather files.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        tuple[float, list[WeatherReading]]: Best wall time in seconds and the parsed readings.
+    """
+    best_seconds = float("inf")
+    weather_readings = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        weather_readings = weather_data_parser.parse_directory_to_readings(directory)
+        best_seconds = min(best_seconds, time.perf_counter() - start_time)
+
+    return best_seconds, weather_readings
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="WeatherMan parser benchmark")
+    argument_parser.add_argument("directory", nargs="?", default=DEFAULT_WEATHER_DIR_PATH)
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    args = argument_parser.parse_args()
+
+    parsed_readings = {}
+
+    for parser_name, weather_data_parser in sorted(WEATHER_DATA_PARSERS.items()):
+        best_seconds, weather_readings = time_parser(weather_data_parser, args.directory, args.repeat)
+        parsed_readings[parser_name] = [reading.as_tuple() for reading in weather_readings]
+
+        print(
+            f"{parser_name:>6}: {best_seconds * 1000:9.2f} ms, {len(weather_readings)} readings, "
+            f"{len(weather_readings) / best_seconds:,.0f} readings/s"
+        )
+
+    if any(weather_readings != parsed_readings["csv"] for weather_readings in parsed_readings.values()):
+        sys.exit("Parsers returned different readings.")
+
+
+if __name__ == "__main__":
+    main()
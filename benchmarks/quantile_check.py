@@ -0,0 +1,127 @@
+"""
+Check that the quantile reports of the python and numpy calculators agree.
+
+The python calculator answers -q from the rollups built while parsing, falling back to
+the indexed readings for years and for months whose quantile sketch was compacted; the
+numpy calculator reads every reading of the period. Both must print the same exact
+percentiles. Every year and month of a small archive is reported with the numpy
+calculator and with the python calculator in each execution mode (rollups, --batch and
+--stream), for every station and for all stations together, and the outputs are
+compared line by line.
+
+Usage:
+    python benchmarks/quantile_check.py [DIRECTORY] [--station-years N] [--seed N]
+
+Exits with status 1 and prints the differing lines when an output disagrees with numpy.
+"""
+import argparse
+import difflib
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from constants import ALL_STATIONS  # noqa: E402
+from generate_weather_archive import generate_weather_archive  # noqa: E402
+from main import WeatherMan  # noqa: E402
+from numpy_calculations import numpy  # noqa: E402
+from report_benchmark import (  # noqa: E402
+    BENCHMARK_MODES,
+    get_archive_months
+)
+
+
+def render_quantile_reports(directory, archive_months, stations, calculator_name, mode_arguments=()):
+    """
+    Run the CLI once with a quantile report for every year and month of an archive.
+
+    Args:
+        directory (str | Path): Directory of weather files.
+        archive_months (list[tuple[int, int]]): Months of the archive.
+        stations (list[str]): Stations to report, including ALL_STATIONS.
+        calculator_name (str): Name of the calculator backend.
+        mode_arguments (Iterable[str]): Arguments selecting the execution mode.
+
+    Returns:
+        list[str]: The printed report lines.
+    """
+    report_years = sorted({str(year) for year, _ in archive_months})
+    report_months = [f"{year}/{month}" for year, month in archive_months]
+    report_output = io.StringIO()
+
+    with redirect_stdout(report_output):
+        WeatherMan().run([
+            str(directory),
+            "-q", *report_years, *report_months,
+            "-s", *stations,
+            "--calculator", calculator_name,
+            "--no-cache",
+            *mode_arguments,
+        ])
+
+    return report_output.getvalue().splitlines()
+
+
+def compare_quantile_reports(directory):
+    """
+    Compare the quantile reports of the python calculator in every execution mode with numpy's.
+
+    Args:
+        directory (str | Path): Directory of weather files.
+
+    Returns:
+        list[str]: Unified diffs of the outputs that differ from numpy's; empty when all agree.
+    """
+    archive_months = get_archive_months(directory)
+    stations = [*WeatherMan().get_station_names(directory), ALL_STATIONS]
+    numpy_reports = render_quantile_reports(directory, archive_months, stations, "numpy")
+    report_differences = []
+
+    for mode, mode_arguments in BENCHMARK_MODES.items():
+        report_differences.extend(difflib.unified_diff(
+            numpy_reports,
+            render_quantile_reports(directory, archive_months, stations, "python", mode_arguments),
+            "numpy", f"python ({mode})", lineterm=""
+        ))
+
+    return report_differences
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="WeatherMan quantile calculator check")
+    argument_parser.add_argument(
+        "directory", nargs="?",
+        help="Archive to check; a synthetic archive is generated when omitted."
+    )
+    argument_parser.add_argument("--station-years", type=int, default=40)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    args = argument_parser.parse_args()
+
+    if numpy is None:
+        argument_parser.error("numpy is required to compare the calculators")
+
+    with tempfile.TemporaryDirectory(prefix="weatherman_quantile_check_") as synthetic_directory:
+        if args.directory:
+            directory = args.directory
+        else:
+            directory = synthetic_directory
+
+            try:
+                generate_weather_archive(directory, args.station_years, args.seed)
+            except ValueError as station_years_error:
+                argument_parser.error(str(station_years_error))
+
+        report_differences = compare_quantile_reports(directory)
+
+    if report_differences:
+        print("\n".join(report_differences))
+        sys.exit(1)
+
+    print("python quantile reports match numpy in every mode")
+
+
+if __name__ == "__main__":
+    main()
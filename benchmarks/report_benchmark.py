@@ -0,0 +1,213 @@
+"""
+Time every stage of the report pipeline the CLI runs, on a real or synthetic weather archive.
+
+Every year of the archive gets a yearly report and every month a monthly report and
+both temperature charts. The reports are run through WeatherMan.run with --profile in
+each execution mode: "rollups" (the default, answered from rollups built while parsing),
+"batch" (--batch) and "stream" (--stream). The wall time of every stage is read from
+WeatherMan's StageProfiler, and the reports are written to an in-memory buffer so the
+terminal does not skew the result. Results are written as JSON so runs can be compared.
+
+Usage:
+    python benchmarks/report_benchmark.py [DIRECTORY] [--station-years N] [--repeat N] [--mode MODE ...]
+        [--output FILE]
+"""
+import argparse
+import io
+import json
+import platform
+import re
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from constants import (  # noqa: E402
+    DEFAULT_PARSER_BACKEND,
+    DEFAULT_PARSER_WORKERS,
+    FILE_NAME_PERIOD_PATTERN,
+    MONTH_ABBREVIATIONS,
+    PROFILE_STAGES,
+)
+from generate_weather_archive import generate_weather_archive  # noqa: E402
+from main import WeatherMan  # noqa: E402
+from parser import (  # noqa: E402
+    WEATHER_DATA_PARSERS,
+    WeatherDataParser
+)
+
+BENCHMARK_MODES = {
+    "rollups": [],
+    "batch": ["--batch"],
+    "stream": ["--stream"],
+}
+
+
+def get_archive_months(directory):
+    """
+    List the months of an archive from its file names, or from the first and last row dates.
+
+    Args:
+        directory (str | Path): Directory of weather files.
+
+    Returns:
+        list[tuple[int, int]]: Sorted (year, month) pairs.
+    """
+    archive_months = set()
+
+    for weather_data_file in WeatherDataParser.select_weather_files(directory):
+        file_name_period = re.search(FILE_NAME_PERIOD_PATTERN, weather_data_file.name)
+        file_month = file_name_period and MONTH_ABBREVIATIONS.get((file_name_period.group(2) or "").lower())
+
+        if file_month:
+            archive_months.add((int(file_name_period.group(1)), file_month))
+            continue
+
+        boundary_dates = WeatherDataParser.read_boundary_dates(weather_data_file)
+
+        if boundary_dates:
+            first_date, last_date = sorted(boundary_dates)
+            first_month_index = first_date.year * 12 + first_date.month - 1
+            last_month_index = last_date.year * 12 + last_date.month - 1
+
+            for month_index in range(first_month_index, last_month_index + 1):
+                archive_months.add((month_index // 12, month_index % 12 + 1))
+
+    return sorted(archive_months)
+
+
+def run_report_pipeline(directory, archive_months, parser_name, workers, mode):
+    """
+    Run the CLI once over every year and month of an archive and read its stage profile.
+
+    Args:
+        directory (str | Path): Directory of weather files.
+        archive_months (list[tuple[int, int]]): Months of the archive.
+        parser_name (str): Name of the parser backend.
+        workers (int): Number of processes used to parse the weather files.
+        mode (str): Execution mode, a key of BENCHMARK_MODES.
+
+    Returns:
+        tuple[dict[str, float], int]: Seconds per stage, and the number of parsed readings.
+    """
+    report_years = sorted({str(year) for year, _ in archive_months})
+    report_months = [f"{year}/{month}" for year, month in archive_months]
+    weather_man = WeatherMan()
+
+    with redirect_stdout(io.StringIO()):
+        weather_man.run([
+            str(directory),
+            "-e", *report_years,
+            "-a", *report_months,
+            "-c", *report_months,
+            "-b", *report_months,
+            "--parser", parser_name,
+            "-w", str(workers),
+            "--no-cache",
+            "--profile",
+            *BENCHMARK_MODES[mode],
+        ])
+
+    stage_statistics = weather_man.stage_profiler.stage_statistics
+
+    return (
+        {stage: stage_statistics[stage].seconds for stage in PROFILE_STAGES},
+        stage_statistics["parse"].rows,
+    )
+
+
+def benchmark_report_pipeline(directory, parser_name, workers, repeat, modes):
+    """
+    Run the report pipeline several times per mode and keep the best time of each stage.
+
+    Args:
+        directory (str | Path): Directory of weather files.
+        parser_name (str): Name of the parser backend.
+        workers (int): Number of processes used to parse the weather files.
+        repeat (int): Number of timed runs per mode.
+        modes (list[str]): Execution modes to time, keys of BENCHMARK_MODES.
+
+    Returns:
+        dict: Best seconds per stage and their total for every mode, and the processed counts.
+    """
+    archive_months = get_archive_months(directory)
+    mode_results = {}
+    parsed_readings = 0
+
+    for mode in modes:
+        best_stage_seconds = dict.fromkeys(PROFILE_STAGES, float("inf"))
+
+        for _ in range(repeat):
+            stage_seconds, parsed_readings = run_report_pipeline(
+                directory, archive_months, parser_name, workers, mode
+            )
+
+            for stage, seconds in stage_seconds.items():
+                best_stage_seconds[stage] = min(best_stage_seconds[stage], seconds)
+
+        mode_results[mode] = {
+            "stages": best_stage_seconds,
+            "total_seconds": sum(best_stage_seconds.values()),
+        }
+
+    return {
+        "modes": mode_results,
+        "readings": parsed_readings,
+        "years": len({year for year, _ in archive_months}),
+        "months": len(archive_months),
+    }
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description="WeatherMan report pipeline benchmark")
+    argument_parser.add_argument(
+        "directory", nargs="?",
+        help="Archive to benchmark; a synthetic archive is generated when omitted."
+    )
+    argument_parser.add_argument("--station-years", type=int, default=10)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--parser", choices=sorted(WEATHER_DATA_PARSERS), default=DEFAULT_PARSER_BACKEND)
+    argument_parser.add_argument("-w", "--workers", type=int, default=DEFAULT_PARSER_WORKERS)
+    argument_parser.add_argument(
+        "--mode", nargs="+", choices=list(BENCHMARK_MODES), default=list(BENCHMARK_MODES),
+        help="Execution modes to time (default: all)."
+    )
+    argument_parser.add_argument("--output", help="JSON file the results are written to (default: stdout).")
+    args = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="weatherman_benchmark_") as synthetic_directory:
+        if args.directory:
+            directory = args.directory
+        else:
+            directory = synthetic_directory
+
+            try:
+                generate_weather_archive(directory, args.station_years, args.seed)
+            except ValueError as station_years_error:
+                argument_parser.error(str(station_years_error))
+
+        benchmark_results = {
+            "benchmark": "report_pipeline",
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "archive": args.directory or f"synthetic ({args.station_years} station-years, seed {args.seed})",
+            "parser": args.parser,
+            "workers": args.workers,
+            "repeat": args.repeat,
+            **benchmark_report_pipeline(directory, args.parser, args.workers, args.repeat, args.mode),
+        }
+
+    benchmark_json = json.dumps(benchmark_results, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(benchmark_json + "\n", encoding="utf-8")
+    else:
+        print(benchmark_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
+from datetime import date
+
+from aggregation import WeatherAggregate
 from constants import (
     AVERAGE_DEFAULT_VALUE,
     ROUNDED_AVERAGE_PRECISION,
+    WEATHER_ATTRIBUTES,
 )
+from reading_store import WeatherReadingStore
 
 
 class WeatherCalculator:
@@ -24,6 +29,121 @@ class WeatherCalculator:
 
         return average_weather_readings
 
+    @staticmethod
+    def calculate_average_from_totals(readings_total, readings_count):
+        """
+        Calculate the average of weather readings from their sum and count.
+
+        Args:
+            readings_total (float | int): Sum of the valid readings.
+            readings_count (int): Number of valid readings.
+
+        Returns:
+            float: Rounded average if there are valid readings else AVERAGE_DEFAULT_VALUE
+        """
+        average_readings = (
+            readings_total / readings_count
+            if readings_count else AVERAGE_DEFAULT_VALUE
+        )
+
+        return round(average_readings, ROUNDED_AVERAGE_PRECISION)
+
+    @staticmethod
+    def aggregate_weather_readings(weather_readings, weather_attributes=WEATHER_ATTRIBUTES):
+        """
+        Gather sum, count, maximum and minimum of every attribute in one pass over the readings.
+
+        Args:
+            weather_readings (list[WeatherReading] | WeatherReadingStore): Readings to aggregate.
+            weather_attributes (list[str]): Attribute names to aggregate.
+
+        Returns:
+            WeatherAggregate: Statistics of every requested attribute.
+        """
+        return WeatherAggregate(weather_readings, weather_attributes)
+
+    def calculate_monthly_averages_from_aggregate(self, weather_aggregate, weather_attributes):
+        """
+        Calculate monthly averages from single-pass aggregated statistics.
+
+        Gives the same result as validate_monthly_weather_readings followed by
+        calculate_monthly_averages, without building a list of values per attribute.
+
+        Args:
+            weather_aggregate (WeatherAggregate): Statistics of the month's readings.
+            weather_attributes (dict[str, str]): Dictionary mapping average keys (e.g.,
+                "highest_average_temp") to WeatherReading attribute names.
+
+        Returns:
+            dict[str, float]: A dictionary mapping each average key to its rounded average.
+        """
+        return {
+            monthly_average_key: self.calculate_average_from_totals(
+                *weather_aggregate.get_totals(weather_attribute)
+            )
+            for monthly_average_key, weather_attribute in weather_attributes.items()
+        }
+
+    def calculate_moving_averages(self, range_index, first_date, last_date, window_days, weather_attributes):
+        """
+        Calculate trailing moving averages for every reading date in a date range.
+
+        The window of a date covers it and the window_days - 1 calendar days before it,
+        and each window's sum and count are read from the range index's prefix sums.
+
+        Args:
+            range_index (WeatherRangeIndex): Range index over the date-sorted readings.
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+            window_days (int): Length of the windows in days.
+            weather_attributes (list[str]): Attribute names to average (e.g., ['max_temp']).
+
+        Returns:
+            list[tuple[date, dict[str, float]]]: Each reading date with the moving average of every attribute.
+        """
+        attribute_window_totals = [
+            range_index.iter_window_totals(first_date, last_date, window_days, weather_attribute)
+            for weather_attribute in weather_attributes
+        ]
+
+        return [
+            (
+                date.fromordinal(attribute_windows[0][0]),
+                {
+                    weather_attribute: self.calculate_average_from_totals(*window_totals)
+                    for weather_attribute, (_, window_totals) in zip(weather_attributes, attribute_windows)
+                }
+            )
+            for attribute_windows in zip(*attribute_window_totals)
+        ]
+
+    @staticmethod
+    def calculate_percentiles(weather_rollup, weather_attributes, percentiles):
+        """
+        Calculate percentiles of the valid values of each attribute of a period.
+
+        Args:
+            weather_rollup (WeatherRollup | WeatherAggregate | None): Statistics of the period's readings.
+            weather_attributes (Iterable[str]): Attribute names (e.g., ['max_temp']).
+            percentiles (dict[str, int]): Mapping of percentile names (e.g., "median") to percentiles.
+
+        Returns:
+            dict[str, dict[str, int]]: Percentile values by name for each attribute; attributes
+            without valid values are left out.
+        """
+        attribute_percentiles = {}
+
+        if weather_rollup is None:
+            return attribute_percentiles
+
+        for weather_attribute in weather_attributes:
+            percentile_values = weather_rollup.get_percentiles(weather_attribute, percentiles.values())
+
+            if percentile_values is not None:
+                attribute_percentiles[weather_attribute] = dict(zip(percentiles, percentile_values))
+
+        return attribute_percentiles
+
     def calculate_monthly_averages(self, validated_attribute_values):
         """
         Calculate the average value for each weather attribute in a monthly dataset.
@@ -49,18 +169,26 @@ class WeatherCalculator:
         Find the maximum reading for each weather attribute.
 
         Args:
-            attribute_readings (dict[str, list[WeatherReading]]):
+            attribute_readings (dict[str, list[WeatherReading] | WeatherReadingStore]):
                 Dictionary mapping weather attributes (e.g., "temperature", "humidity")
-                to lists of WeatherReading objects.
+                to the readings valid for that attribute.
 
         Returns:
             dict[str, WeatherReading | None]: Dictionary mapping each attribute to the WeatherReading
-            object that has the maximum value for that attribute.
+            object that has the maximum value for that attribute. Missing and zero values of a
+            store are skipped.
         """
         max_reading_per_attribute = {}
 
         for weather_attribute, weather_readings_for_attribute in attribute_readings.items():
-            if weather_readings_for_attribute:
+            if isinstance(weather_readings_for_attribute, WeatherReadingStore):
+                max_reading_index = weather_readings_for_attribute.find_max_index(weather_attribute)
+
+                if max_reading_index is not None:
+                    max_reading_per_attribute[weather_attribute] = weather_readings_for_attribute.get_reading(
+                        max_reading_index
+                    )
+            elif weather_readings_for_attribute:
                 max_reading = max(
                     weather_readings_for_attribute,
                     key=lambda reading: getattr(reading, weather_attribute)
@@ -0,0 +1,127 @@
+from constants import (
+    MONTHLY_ATTRIBUTE_MAP,
+    ROUNDED_AVERAGE_PRECISION,
+)
+
+
+class MonthlyClimatology:
+    """
+    Per-calendar-month baselines across every year of the loaded readings.
+
+    The monthly averages of every (year, month) are read in a single pass over the
+    monthly rollups, and the averages of each calendar month are then reduced across
+    years to a baseline mean (with the logic of calculate_monthly_averages), minimum
+    and maximum. Anomalies of any month are answered from these baselines without
+    touching the readings again.
+    """
+    def __init__(self, weather_rollups, weather_calculator, weather_attributes=MONTHLY_ATTRIBUTE_MAP):
+        self.weather_calculator = weather_calculator
+        self.weather_attributes = weather_attributes
+        self.monthly_averages = {}
+        self.calendar_month_years = {month: [] for month in range(1, 13)}
+        self.baselines = {}
+
+        self.aggregate_months(weather_rollups)
+
+    def aggregate_months(self, weather_rollups):
+        """
+        Read the averages of every month once and reduce them to calendar month baselines.
+
+        Attributes without valid values in a month are left out of that month's averages,
+        so they do not pull the baselines towards AVERAGE_DEFAULT_VALUE.
+
+        Args:
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+        """
+        calendar_month_values = {
+            month: {monthly_average_key: [] for monthly_average_key in self.weather_attributes}
+            for month in range(1, 13)
+        }
+
+        for year, month in weather_rollups.get_months():
+            monthly_weather_rollup = weather_rollups.get_month_rollup(year, month)
+
+            if not monthly_weather_rollup:
+                continue
+
+            monthly_averages = {}
+
+            for monthly_average_key, weather_attribute in self.weather_attributes.items():
+                readings_total, readings_count = monthly_weather_rollup.get_totals(weather_attribute)
+
+                if readings_count:
+                    monthly_averages[monthly_average_key] = self.weather_calculator.calculate_average_from_totals(
+                        readings_total, readings_count
+                    )
+                    calendar_month_values[month][monthly_average_key].append(monthly_averages[monthly_average_key])
+
+            self.monthly_averages[(year, month)] = monthly_averages
+            self.calendar_month_years[month].append(year)
+
+        for month, attribute_values in calendar_month_values.items():
+            if self.calendar_month_years[month]:
+                baseline_means = self.weather_calculator.calculate_monthly_averages(attribute_values)
+
+                self.baselines[month] = {
+                    monthly_average_key: {
+                        "mean": baseline_means[monthly_average_key],
+                        "min": min(yearly_values),
+                        "max": max(yearly_values),
+                    }
+                    for monthly_average_key, yearly_values in attribute_values.items()
+                    if yearly_values
+                }
+
+    def get_baseline(self, month):
+        """
+        Return the baseline of a calendar month.
+
+        Args:
+            month (int): Calendar month (1–12).
+
+        Returns:
+            dict[str, dict[str, float]] | None: Mean, min and max of every monthly average
+            key across years, or None if no year has readings of the month.
+        """
+        return self.baselines.get(month)
+
+    def get_year_span(self, month):
+        """
+        Return the first and last year with readings of a calendar month.
+
+        Args:
+            month (int): Calendar month (1–12).
+
+        Returns:
+            tuple[int, int] | None: First and last year, or None if the month has no readings.
+        """
+        month_years = self.calendar_month_years[month]
+
+        return (min(month_years), max(month_years)) if month_years else None
+
+    def get_anomalies(self, year, month):
+        """
+        Compare the averages of a month with the baseline of its calendar month.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+
+        Returns:
+            dict[str, tuple[float, float]] | None: Average and its difference from the
+            baseline mean per monthly average key, or None if the month has no readings.
+        """
+        monthly_averages = self.monthly_averages.get((year, month))
+
+        if not monthly_averages:
+            return None
+
+        baseline = self.baselines[month]
+
+        return {
+            monthly_average_key: (
+                monthly_average,
+                round(monthly_average - baseline[monthly_average_key]["mean"], ROUNDED_AVERAGE_PRECISION)
+            )
+            for monthly_average_key, monthly_average in monthly_averages.items()
+        }
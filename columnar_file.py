@@ -0,0 +1,272 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import date
+
+from constants import (
+    COLUMNAR_FILE_MAGIC,
+    COLUMNAR_FOOTER_SIZE_FORMAT,
+    COLUMNAR_FORMAT_VERSION,
+    READING_DATE_TYPECODE,
+    READING_MASK_TYPECODE,
+    READING_VALUE_TYPECODE,
+    WEATHER_ATTRIBUTES,
+)
+from reading_store import WeatherReadingStore
+
+
+class ColumnarWeatherFile:
+    """
+    Parsed weather readings stored in a single columnar binary file.
+
+    The file starts and ends with COLUMNAR_FILE_MAGIC. Readings are split into one row
+    group per station and year; every row group holds the date ordinals, each attribute's
+    values and each attribute's missing-value mask as raw typed arrays, one after the
+    other. A JSON footer, followed by its size, lists the row groups with the offsets of
+    their columns and the min/max statistics of their dates and attributes, so a reader
+    can skip row groups of other stations or periods without touching their columns.
+
+    Files are read through a memory map: only the columns of the selected row groups
+    are paged in.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+        with open(file_path, "rb") as columnar_file:
+            try:
+                self.file_map = mmap.mmap(columnar_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Not a weather columnar file: {file_path}")
+
+        try:
+            self.footer = self.read_footer()
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release the memory map of the file."""
+        self.file_map.close()
+
+    @staticmethod
+    def build_column_statistics(attribute_values, missing_value_mask):
+        """
+        Return the minimum and maximum present value of a column.
+
+        Args:
+            attribute_values (array): Values of the column.
+            missing_value_mask (array): Whether each value is missing.
+
+        Returns:
+            list[int] | None: Minimum and maximum, or None if every value is missing.
+        """
+        present_values = [
+            attribute_value
+            for attribute_value, is_missing in zip(attribute_values, missing_value_mask)
+            if not is_missing
+        ]
+
+        return [min(present_values), max(present_values)] if present_values else None
+
+    @classmethod
+    def write(cls, file_path, station_reading_stores):
+        """
+        Write the readings of every station to a columnar file, one row group per station and year.
+
+        Args:
+            file_path (str | Path): File to write.
+            station_reading_stores (dict[str, WeatherReadingStore]): Date-sorted readings of each station.
+
+        Returns:
+            list[dict]: Metadata of the written row groups.
+        """
+        row_groups = []
+
+        with open(file_path, "wb") as columnar_file:
+            columnar_file.write(COLUMNAR_FILE_MAGIC)
+
+            for station in sorted(station_reading_stores):
+                reading_store = station_reading_stores[station]
+                date_ordinals = reading_store.date_ordinals
+                start_index = 0
+
+                while start_index < len(reading_store):
+                    year = date.fromordinal(date_ordinals[start_index]).year
+                    stop_index = bisect_left(date_ordinals, date(year + 1, 1, 1).toordinal(), start_index)
+                    row_group_store = reading_store.get_slice(start_index, stop_index)
+                    row_group_columns = {"date_ordinals": row_group_store.date_ordinals}
+                    row_group_statistics = {
+                        "date_ordinals": [row_group_store.date_ordinals[0], row_group_store.date_ordinals[-1]]
+                    }
+
+                    for weather_attribute in WEATHER_ATTRIBUTES:
+                        row_group_columns[weather_attribute] = row_group_store.attribute_values[weather_attribute]
+                        row_group_columns[f"{weather_attribute}_missing"] = (
+                            row_group_store.missing_value_masks[weather_attribute]
+                        )
+                        row_group_statistics[weather_attribute] = cls.build_column_statistics(
+                            row_group_store.attribute_values[weather_attribute],
+                            row_group_store.missing_value_masks[weather_attribute]
+                        )
+
+                    column_offsets = {}
+
+                    for column_name, column_values in row_group_columns.items():
+                        column_offsets[column_name] = columnar_file.tell()
+                        column_values.tofile(columnar_file)
+
+                    row_groups.append({
+                        "station": station,
+                        "year": year,
+                        "rows": len(row_group_store),
+                        "columns": column_offsets,
+                        "statistics": row_group_statistics,
+                    })
+                    start_index = stop_index
+
+            footer = json.dumps({
+                "version": COLUMNAR_FORMAT_VERSION,
+                "byteorder": sys.byteorder,
+                "typecodes": {
+                    "date": READING_DATE_TYPECODE,
+                    "value": READING_VALUE_TYPECODE,
+                    "mask": READING_MASK_TYPECODE,
+                },
+                "row_groups": row_groups,
+            }).encode()
+
+            columnar_file.write(footer)
+            columnar_file.write(struct.pack(COLUMNAR_FOOTER_SIZE_FORMAT, len(footer)))
+            columnar_file.write(COLUMNAR_FILE_MAGIC)
+
+        return row_groups
+
+    def read_footer(self):
+        """
+        Check the magic markers of the file and parse its footer.
+
+        Returns:
+            dict: The footer, with the byte order, typecodes and row groups of the file.
+
+        Raises:
+            ValueError: If the file is not a columnar weather file of a supported version.
+        """
+        magic_size = len(COLUMNAR_FILE_MAGIC)
+        footer_size_size = struct.calcsize(COLUMNAR_FOOTER_SIZE_FORMAT)
+        file_size = len(self.file_map)
+
+        if (
+            file_size < 2 * magic_size + footer_size_size
+            or self.file_map[:magic_size] != COLUMNAR_FILE_MAGIC
+            or self.file_map[-magic_size:] != COLUMNAR_FILE_MAGIC
+        ):
+            raise ValueError(f"Not a weather columnar file: {self.file_path}")
+
+        footer_end = file_size - magic_size - footer_size_size
+        footer_size, = struct.unpack(
+            COLUMNAR_FOOTER_SIZE_FORMAT, self.file_map[footer_end:footer_end + footer_size_size]
+        )
+
+        try:
+            footer = json.loads(self.file_map[footer_end - footer_size:footer_end])
+        except ValueError:
+            raise ValueError(f"Corrupted weather columnar file: {self.file_path}")
+
+        if footer.get("version") != COLUMNAR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported weather columnar file version {footer.get('version')}: {self.file_path}")
+
+        return footer
+
+    def get_stations(self):
+        """
+        List the stations stored in the file.
+
+        Returns:
+            list[str]: Sorted station names.
+        """
+        return sorted({row_group["station"] for row_group in self.footer["row_groups"]})
+
+    def select_row_groups(self, stations=None, period_predicate=None):
+        """
+        Select the row groups that may hold readings of the requested stations and periods.
+
+        Args:
+            stations (Collection[str] | None): Stations to read, or None for every station.
+            period_predicate (ReportPeriodPredicate | None): Requested periods, or None for all.
+
+        Returns:
+            list[dict]: Metadata of the selected row groups, in file order.
+        """
+        return [
+            row_group
+            for row_group in self.footer["row_groups"]
+            if (stations is None or row_group["station"] in stations)
+            and (period_predicate is None or period_predicate.matches_date_range(
+                *(date.fromordinal(date_ordinal) for date_ordinal in row_group["statistics"]["date_ordinals"])
+            ))
+        ]
+
+    def read_column(self, file_view, column_offset, typecode, row_count):
+        """
+        Copy one column of a row group out of the memory map into a typed array.
+
+        Args:
+            file_view (memoryview): View of the memory-mapped file.
+            column_offset (int): Offset of the column in the file.
+            typecode (str): Typecode of the column's values.
+            row_count (int): Number of values in the column.
+
+        Returns:
+            array: The column values, in native byte order.
+        """
+        column_values = array(typecode)
+        column_values.frombytes(file_view[column_offset:column_offset + row_count * column_values.itemsize])
+
+        if self.footer["byteorder"] != sys.byteorder:
+            column_values.byteswap()
+
+        return column_values
+
+    def read_station_stores(self, stations=None, period_predicate=None):
+        """
+        Read the readings of the selected row groups into one store per station.
+
+        Args:
+            stations (Collection[str] | None): Stations to read, or None for every station.
+            period_predicate (ReportPeriodPredicate | None): Requested periods; row groups whose
+                date statistics fall outside them are skipped.
+
+        Returns:
+            dict[str, WeatherReadingStore]: Date-sorted readings of each station with a selected row group.
+        """
+        typecodes = self.footer["typecodes"]
+        station_reading_stores = {}
+
+        with memoryview(self.file_map) as file_view:
+            for row_group in self.select_row_groups(stations, period_predicate):
+                reading_store = station_reading_stores.setdefault(row_group["station"], WeatherReadingStore())
+                column_offsets = row_group["columns"]
+                row_count = row_group["rows"]
+
+                reading_store.date_ordinals.extend(
+                    self.read_column(file_view, column_offsets["date_ordinals"], typecodes["date"], row_count)
+                )
+
+                for weather_attribute in WEATHER_ATTRIBUTES:
+                    reading_store.attribute_values[weather_attribute].extend(self.read_column(
+                        file_view, column_offsets[weather_attribute], typecodes["value"], row_count
+                    ))
+                    reading_store.missing_value_masks[weather_attribute].extend(self.read_column(
+                        file_view, column_offsets[f"{weather_attribute}_missing"], typecodes["mask"], row_count
+                    ))
+
+        return station_reading_stores
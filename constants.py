@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 WEATHER_DIRECTORY = "weatherfiles"
@@ -5,20 +6,87 @@ CURRENT_SCRIPT_DIRECTORY = Path(__file__).resolve().parent
 WEATHER_PROJECT_DIRECTORY = CURRENT_SCRIPT_DIRECTORY.parents[1]
 DEFAULT_WEATHER_DIR_PATH = WEATHER_PROJECT_DIRECTORY / WEATHER_DIRECTORY
 
+ALL_STATIONS = "all"
 AVERAGE_DEFAULT_VALUE = 0.0
+COLUMNAR_FILE_MAGIC = b"WXCOLUMN"
+COLUMNAR_FOOTER_SIZE_FORMAT = "<Q"
+COLUMNAR_FORMAT_VERSION = 1
+CONTENT_HASH_CHUNK_BYTES = 1 << 20
+CSV_REPORT_FIELDS = ["station", "report", "year", "month", "metric", "value", "date"]
 DATE_COLUMNS = ["PKT", "PKST"]
+DATE_INPUT_FORMAT = "%Y-%m-%d"
+DEFAULT_CALCULATOR_BACKEND = "python"
+DEFAULT_OUTPUT_FORMAT = "text"
+DEFAULT_PARSER_BACKEND = "csv"
+DEFAULT_PARSER_WORKERS = 1
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+FILE_BOUNDARY_READ_BYTES = 4096
+FILE_NAME_PERIOD_PATTERN = r"_(\d{4})(?:_([A-Za-z]{3}))?(?:\.\w+)?$"
+INCREMENTAL_CHECK_BYTES = 4096
 LOG_FILE = "weatherman_log_errors.log"
 MAX_TEMPERATURE = "Max TemperatureC"
 MEAN_HUMIDITY = " Mean Humidity"
 MIN_TEMPERATURE = "Min TemperatureC"
+PARALLEL_FILES_PER_WORKER_CHUNK = 4
+PARSER_LOGGER_NAME = "weatherman.parser"
+MONTHLY_AVERAGE_LABELS = {
+    "highest_average_temp": ("Highest Average", "C"),
+    "lowest_average_temp": ("Lowest Average", "C"),
+    "average_mean_humidity": ("Average Mean Humidity", "%"),
+}
+MOVING_AVERAGE_ATTRIBUTES = ["max_temp", "min_temp"]
+PROFILE_STAGES = ["plan", "parse", "filter", "calculate", "format", "display"]
+QUANTILE_PERCENTILES = {"median": 50, "p90": 90, "p99": 99}
+QUANTILE_SKETCH_CAPACITY = 200
+QUANTILE_SKETCH_CAPACITY_DECAY = 2 / 3
+RANGE_PREFIX_SUM_TYPECODE = "q"
+RANGE_REPORT_DATE_FORMAT = "%B %d, %Y"
+READING_CACHE_DIRECTORY = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "weatherman"
+READING_CACHE_FORMAT_VERSION = 9
+READING_DATE_TYPECODE = "i"
+READING_MASK_TYPECODE = "B"
+READING_VALUE_MAX = 2 ** 31 - 1
+READING_VALUE_MIN = -2 ** 31
+READING_VALUE_TYPECODE = "i"
+REPORT_CACHE_SIZE = 128
 ROUNDED_AVERAGE_PRECISION = 2
+SERVER_RELOAD_INTERVAL_SECONDS = 5.0
+SERVER_REQUEST_ENCODING = "utf-8"
+SERVER_REQUEST_FLAG_FIELDS = ["climatology", "cache_stats"]
+SERVER_REQUEST_LIST_FIELDS = ["yearly", "monthly", "chart", "hchart", "rolling", "anomaly", "quantiles", "station"]
+SERVER_REQUEST_TEXT_FIELDS = ["from", "to"]
+TEMP_BAR_CACHE_SIZE = 256
+STATION_FILE_NAME_PATTERN = r"^(.+)_weather_"
 WEATHER_ATTRIBUTES = ["max_temp", "min_temp", "mean_humidity"]
+WEATHER_FILE_NAME_FORMAT = "{station}_weather_{year}_{month_abbr}.txt"
+
+YEARLY_REPORT = "yearly"
+MONTHLY_REPORT = "monthly"
+CHART_REPORT = "chart"
+HORIZONTAL_CHART_REPORT = "hchart"
+RANGE_REPORT = "range"
+ROLLING_REPORT = "rolling"
+CLIMATOLOGY_REPORT = "climatology"
+ANOMALY_REPORT = "anomaly"
+QUANTILE_REPORT = "quantile"
 
 RED = "\033[91m"
 BLUE = "\033[94m"
 PURPLE = "\033[95m"
 RESET = "\033[0m"
 
+MONTH_ABBREVIATIONS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
+QUANTILE_ATTRIBUTE_LABELS = {
+    "max_temp": ("Max Temperature", "C"),
+    "min_temp": ("Min Temperature", "C"),
+    "mean_humidity": ("Mean Humidity", "%"),
+}
+
 MONTHLY_ATTRIBUTE_MAP = {
     "highest_average_temp": "max_temp",
     "lowest_average_temp": "min_temp",
@@ -1,21 +1,74 @@
 import argparse
+import asyncio
+import calendar
+import cProfile
+import csv
+import io
+import sys
+import weakref
+from contextlib import redirect_stdout
+from pathlib import Path
 
+from aggregation import IndexedWeatherAggregates
 from calculations import WeatherCalculator
+from climatology import MonthlyClimatology
+from columnar_file import ColumnarWeatherFile
 from constants import (
+    ALL_STATIONS,
+    ANOMALY_REPORT,
+    CHART_REPORT,
+    CLIMATOLOGY_REPORT,
+    DATE_COLUMNS,
+    DEFAULT_CALCULATOR_BACKEND,
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_PARSER_BACKEND,
+    DEFAULT_PARSER_WORKERS,
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
     DEFAULT_WEATHER_DIR_PATH,
+    HORIZONTAL_CHART_REPORT,
+    MAX_TEMPERATURE,
+    MEAN_HUMIDITY,
+    MIN_TEMPERATURE,
     MONTHLY_ATTRIBUTE_MAP,
+    MONTHLY_REPORT,
+    MOVING_AVERAGE_ATTRIBUTES,
+    QUANTILE_PERCENTILES,
+    QUANTILE_REPORT,
+    RANGE_REPORT,
+    READING_CACHE_DIRECTORY,
+    REPORT_CACHE_SIZE,
+    ROLLING_REPORT,
+    SERVER_RELOAD_INTERVAL_SECONDS,
     WEATHER_ATTRIBUTES,
+    WEATHER_FILE_NAME_FORMAT,
+    YEARLY_ATTRIBUTE_MAP,
+    YEARLY_REPORT,
 )
+from numpy_calculations import WEATHER_CALCULATORS
 from parser import (
+    WEATHER_DATA_PARSERS,
     InputDateParser,
     WeatherDataParser
 )
+from profiling import StageProfiler
+from reading_cache import WeatherReadingCache
+from report_cache import ReportResultCache
+from report_serializers import REPORT_SERIALIZERS
+from query_planner import ReportQueryPlanner
+from rollups import WeatherRollups
+from stations import WeatherStationShards
+from streaming import StreamingWeatherReports
 from validations import WeatherReadingValidator
 from weather_reading_helpers import (
     WeatherReadingFilter,
     WeatherReadingFormatter
 )
 from weather_report_console_view import WeatherReportConsoleView
+from weather_server import (
+    WeatherReportClient,
+    WeatherReportServer
+)
 
 
 class WeatherMan:
@@ -27,156 +80,1264 @@ class WeatherMan:
         self.report = WeatherReportConsoleView()
         self.weather_calculator = WeatherCalculator()
         self.weather_data_parser = WeatherDataParser()
+        self.query_planner = ReportQueryPlanner(self.date_parser)
+        self.report_cache = None
+        self.stage_profiler = StageProfiler()
+        self.weather_climatologies = weakref.WeakKeyDictionary()
 
-    def run(self):
+    @staticmethod
+    def add_report_arguments(parser):
         """
-        Parse Command-Line Arguments and execute requested weather reports or temperature charts.
+        Add the report selection arguments (-e, -a, -c, -b, --from, --to, --rolling, --climatology,
+        --anomaly, -q, -s) to an argument parser.
+
+        Args:
+            parser (argparse.ArgumentParser): Parser to add the arguments to.
+        """
+        parser.add_argument(
+            "-e", "--yearly",
+            type=int,
+            nargs="+",
+            help="Generate yearly reports. Provide YEAR(s)."
+        )
+
+        parser.add_argument(
+            "-a", "--monthly",
+            type=str,
+            nargs="+",
+            help="Generate monthly averages. Provide YEAR(s)/MONTH(s) (e.g: 2006/3)."
+        )
+
+        parser.add_argument(
+            "-c", "--chart",
+            type=str,
+            nargs="+",
+            help="Generate vertical monthly charts. Provide YEAR(s)/MONTH(s)."
+        )
+
+        parser.add_argument(
+            "-b", "--hchart",
+            type=str,
+            nargs="+",
+            help="Generate horizontal monthly charts. Provide YEAR/MONTH."
+        )
+
+        parser.add_argument(
+            "--from",
+            dest="from_date",
+            metavar="YYYY-MM-DD",
+            help="First date of a date range report (used with --to)."
+        )
+
+        parser.add_argument(
+            "--to",
+            dest="to_date",
+            metavar="YYYY-MM-DD",
+            help="Last date of a date range report, included (used with --from)."
+        )
+
+        parser.add_argument(
+            "--rolling",
+            type=int,
+            nargs="+",
+            metavar="DAYS",
+            help="Print moving averages of the max/min temperatures over trailing windows of DAYS "
+                 "days (e.g: 7 30) for each date of the --from/--to range."
+        )
+
+        parser.add_argument(
+            "--climatology",
+            action="store_true",
+            help="Print the average, lowest and highest monthly averages of each calendar month "
+                 "across all years."
+        )
+
+        parser.add_argument(
+            "--anomaly",
+            type=str,
+            nargs="+",
+            metavar="YEAR/MONTH",
+            help="Compare the averages of YEAR(s)/MONTH(s) with the climatology of their calendar month."
+        )
+
+        parser.add_argument(
+            "-q", "--quantiles",
+            type=str,
+            nargs="+",
+            metavar="PERIOD",
+            help="Print the median, p90 and p99 of the temperatures and humidity. Provide YEAR(s) "
+                 "or YEAR(s)/MONTH(s)."
+        )
+
+        parser.add_argument(
+            "-s", "--station",
+            nargs="+",
+            default=[ALL_STATIONS],
+            help=f"Stations to report on, or '{ALL_STATIONS}' for fleet-wide reports (default: {ALL_STATIONS}). "
+                 "Stations are named by weather file prefix (Murree_weather_...) or subdirectory."
+        )
+
+    def display_yearly_report(self, year, weather_rollups):
+        """
+        Display the yearly report of a year.
+
+        Args:
+            year (int): The year.
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+        """
+        max_values_per_attribute = weather_rollups.get_year_rollup(year).get_max_readings()
+
+        yearly_report = self.reading_filter.get_yearly_max_weather_values(
+            max_values_per_attribute
+        )
+
+        formatted_weather_report = self.reading_formatters.format_yearly_weather_report(
+            yearly_report
+        )
+
+        self.report.display_weather_report(
+            self.report.display_yearly_report,
+            formatted_weather_report,
+            year=year
+        )
+
+    def display_monthly_report(self, year, month, weather_rollups):
+        """
+        Display the monthly averages of a month, if it has readings.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+        """
+        monthly_weather_rollup = weather_rollups.get_month_rollup(year, month)
+
+        if monthly_weather_rollup:
+            monthly_averages = self.weather_calculator.calculate_monthly_averages_from_aggregate(
+                monthly_weather_rollup,
+                MONTHLY_ATTRIBUTE_MAP
+            )
+
+            self.report.display_weather_report(
+                self.report.display_monthly_report,
+                monthly_averages,
+                year=year,
+                month=month
+            )
+
+    def display_temp_chart(self, year, month, weather_readings, horizontal=False):
+        """
+        Display the temperature chart of a month, if it has readings.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+            weather_readings (WeatherReadingIndex): Indexed readings.
+            horizontal (bool): Whether to draw horizontal bars.
+        """
+        monthly_weather_readings = self.reading_filter.get_sorted_readings_by_year_and_month(
+            weather_readings,
+            year,
+            month
+        )
+
+        if monthly_weather_readings:
+            formatted_temp_bars = self.reading_formatters.format_temp_chart(
+                monthly_weather_readings, horizontal
+            )
+
+            self.report.display_weather_report(
+                self.report.display_temp_chart,
+                formatted_temp_bars,
+                year=year,
+                month=month
+            )
+
+    def display_range_report(self, first_date, last_date, weather_readings):
+        """
+        Display the extremes and averages of the readings between two dates, both included.
+
+        Args:
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+            weather_readings (WeatherReadingIndex): Indexed readings.
+        """
+        range_aggregate = weather_readings.get_range_index().get_range_aggregate(first_date, last_date)
+        formatted_weather_report = []
+
+        if range_aggregate:
+            range_report = self.reading_filter.get_range_extreme_weather_values(
+                range_aggregate.get_max_readings(),
+                range_aggregate.get_min_readings()
+            )
+
+            formatted_weather_report = self.reading_formatters.format_range_weather_report(
+                first_date, last_date, range_report
+            )
+
+        self.report.display_weather_report(self.report.display_report_lines, formatted_weather_report)
+
+        if range_aggregate:
+            range_averages = self.weather_calculator.calculate_monthly_averages_from_aggregate(
+                range_aggregate,
+                MONTHLY_ATTRIBUTE_MAP
+            )
+
+            self.report.display_weather_report(self.report.display_monthly_report, range_averages)
+
+    def display_moving_averages(self, first_date, last_date, window_days, weather_readings):
+        """
+        Display the moving averages of the max/min temperatures for each reading date of a range.
+
+        Args:
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+            window_days (int): Length of the trailing windows in days.
+            weather_readings (WeatherReadingIndex): Indexed readings.
+        """
+        moving_averages = self.weather_calculator.calculate_moving_averages(
+            weather_readings.get_range_index(), first_date, last_date, window_days, MOVING_AVERAGE_ATTRIBUTES
+        )
+        formatted_moving_averages = []
+
+        if moving_averages:
+            formatted_moving_averages = self.reading_formatters.format_moving_averages(window_days, moving_averages)
+
+        self.report.display_weather_report(self.report.display_report_lines, formatted_moving_averages)
+
+    def get_climatology(self, weather_rollups):
+        """
+        Return the climatology of some weather data, computing it the first time it is requested.
+
+        Args:
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+
+        Returns:
+            MonthlyClimatology: Per-calendar-month baselines of the data.
+        """
+        weather_climatology = self.weather_climatologies.get(weather_rollups)
+
+        if weather_climatology is None:
+            weather_climatology = self.weather_climatologies[weather_rollups] = MonthlyClimatology(
+                weather_rollups, self.weather_calculator
+            )
+
+        return weather_climatology
+
+    def display_climatology_report(self, weather_rollups):
+        """
+        Display the baseline of every calendar month.
+
+        Args:
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+        """
+        formatted_climatology = self.reading_formatters.format_climatology_report(
+            self.get_climatology(weather_rollups)
+        )
+
+        self.report.display_weather_report(self.report.display_report_lines, formatted_climatology)
+
+    def display_anomaly_report(self, year, month, weather_rollups):
+        """
+        Display the averages of a month and their differences from its climatology.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+        """
+        weather_climatology = self.get_climatology(weather_rollups)
+        monthly_anomalies = weather_climatology.get_anomalies(year, month)
+        formatted_anomalies = []
+
+        if monthly_anomalies:
+            formatted_anomalies = self.reading_formatters.format_anomaly_report(
+                year, month, monthly_anomalies, weather_climatology.get_year_span(month)
+            )
+
+        self.report.display_weather_report(
+            self.report.display_report_lines,
+            formatted_anomalies,
+            year=year,
+            month=month
+        )
+
+    def display_quantile_report(self, report_period, weather_rollups, weather_readings):
+        """
+        Display the percentiles of a year or month.
+
+        Rollups only keep small monthly quantile sketches. A month whose sketch is still
+        exact is answered from it; years and compacted months are aggregated again from
+        the indexed readings, so the percentiles are always exact.
+
+        Args:
+            report_period (int | tuple[int, int]): A year, or a (year, month) pair.
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+            weather_readings (WeatherReadingIndex): Indexed readings, holding those of the period.
+        """
+        exact_aggregates = weather_rollups
+
+        if isinstance(weather_rollups, WeatherRollups):
+            exact_aggregates = IndexedWeatherAggregates(weather_readings, self.weather_calculator)
+
+        if isinstance(report_period, int):
+            year, month = report_period, None
+            period_rollup = exact_aggregates.get_year_rollup(year)
+        else:
+            year, month = report_period
+            period_rollup = weather_rollups.get_month_rollup(year, month)
+
+            if exact_aggregates is not weather_rollups and period_rollup and not period_rollup.has_exact_percentiles():
+                period_rollup = exact_aggregates.get_month_rollup(year, month)
+
+        attribute_percentiles = self.weather_calculator.calculate_percentiles(
+            period_rollup, WEATHER_ATTRIBUTES, QUANTILE_PERCENTILES
+        )
+        formatted_percentiles = []
+
+        if attribute_percentiles:
+            formatted_percentiles = self.reading_formatters.format_quantile_report(report_period, attribute_percentiles)
+
+        self.report.display_weather_report(
+            self.report.display_report_lines,
+            formatted_percentiles,
+            year=year,
+            month=month
+        )
+
+    def display_report_query(self, report_query, weather_rollups, weather_readings):
+        """
+        Display one planned report, or the error of its invalid period.
+
+        Args:
+            report_query (ReportQuery): The planned report.
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+            weather_readings (WeatherReadingIndex): Indexed readings, for charts, date ranges and quantiles.
+        """
+        if report_query.error is not None:
+            print(report_query.error)
+        elif report_query.report_type == YEARLY_REPORT:
+            self.display_yearly_report(report_query.period, weather_rollups)
+        elif report_query.report_type == MONTHLY_REPORT:
+            self.display_monthly_report(*report_query.period, weather_rollups)
+        elif report_query.report_type == CLIMATOLOGY_REPORT:
+            self.display_climatology_report(weather_rollups)
+        elif report_query.report_type == ANOMALY_REPORT:
+            self.display_anomaly_report(*report_query.period, weather_rollups)
+        elif report_query.report_type == QUANTILE_REPORT:
+            self.display_quantile_report(report_query.period, weather_rollups, weather_readings)
+        elif report_query.report_type == RANGE_REPORT:
+            self.display_range_report(*report_query.period, weather_readings)
+        elif report_query.report_type == ROLLING_REPORT:
+            self.display_moving_averages(*report_query.period, weather_readings)
+        else:
+            self.display_temp_chart(
+                *report_query.period,
+                weather_readings,
+                horizontal=report_query.report_type == HORIZONTAL_CHART_REPORT
+            )
+
+    def render_report_query(
+            self, report_query, weather_rollups, weather_readings, data_version=None, station=ALL_STATIONS
+    ):
+        """
+        Render one planned report to text, answering repeated reports from the report cache.
+
+        Args:
+            report_query (ReportQuery): The planned report.
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+            weather_readings (WeatherReadingIndex): Indexed readings, for charts.
+            data_version (Hashable): Version of the data behind the report's period; cached
+                reports rendered from another version are rendered again.
+            station (str): Station the data belongs to, or ALL_STATIONS.
+
+        Returns:
+            str: The text display_report_query prints for the report.
+        """
+        report_key = (station, report_query.report_type, report_query.period)
+        use_report_cache = self.report_cache is not None and report_query.error is None
+
+        if use_report_cache:
+            rendered_report = self.report_cache.get(report_key, data_version)
+
+            if rendered_report is not None:
+                return rendered_report
+
+        with redirect_stdout(io.StringIO()) as report_output:
+            self.display_report_query(report_query, weather_rollups, weather_readings)
+
+        rendered_report = report_output.getvalue()
+
+        if use_report_cache:
+            self.report_cache.store(report_key, rendered_report, data_version)
+
+        return rendered_report
+
+    def build_report_record(self, report_query, weather_rollups, weather_readings, station=ALL_STATIONS):
+        """
+        Compute one planned yearly, monthly or chart report as a machine-readable record.
+
+        The record holds the computed values themselves, not the strings WeatherReadingFormatter
+        would print, so it can be serialized as JSON or CSV directly.
+
+        Args:
+            report_query (ReportQuery): The planned report.
+            weather_rollups (WeatherRollups | IndexedWeatherAggregates): Source of period statistics.
+            weather_readings (WeatherReadingIndex): Indexed readings, for charts.
+            station (str): Station the data belongs to, or ALL_STATIONS.
+
+        Returns:
+            dict: "station", "report", "year" and "month", then either the "error" message of
+            an invalid period or the report's "values", each with a "metric", "value" and "date".
+        """
+        report_record = {"station": station, "report": report_query.report_type, "year": None, "month": None}
+
+        if report_query.error is not None:
+            report_record["error"] = str(report_query.error)
+            return report_record
+
+        report_values = []
+
+        if report_query.report_type == YEARLY_REPORT:
+            report_record["year"] = report_query.period
+            yearly_report = self.reading_filter.get_yearly_max_weather_values(
+                weather_rollups.get_year_rollup(report_query.period).get_max_readings()
+            )
+
+            for weather_attribute, yearly_stats_identifier in YEARLY_ATTRIBUTE_MAP.items():
+                weather_reading = yearly_report[yearly_stats_identifier]
+
+                if weather_reading:
+                    report_values.append({
+                        "metric": yearly_stats_identifier,
+                        "value": getattr(weather_reading, weather_attribute),
+                        "date": weather_reading.date.isoformat(),
+                    })
+        elif report_query.report_type == MONTHLY_REPORT:
+            report_record["year"], report_record["month"] = report_query.period
+            monthly_weather_rollup = weather_rollups.get_month_rollup(*report_query.period)
+
+            if monthly_weather_rollup:
+                monthly_averages = self.weather_calculator.calculate_monthly_averages_from_aggregate(
+                    monthly_weather_rollup,
+                    MONTHLY_ATTRIBUTE_MAP
+                )
+
+                report_values.extend(
+                    {"metric": monthly_average_key, "value": monthly_average, "date": None}
+                    for monthly_average_key, monthly_average in monthly_averages.items()
+                )
+        else:
+            report_record["year"], report_record["month"] = report_query.period
+
+            for weather_reading in self.reading_filter.get_sorted_readings_by_year_and_month(
+                weather_readings, *report_query.period
+            ):
+                if weather_reading.max_temp and weather_reading.min_temp:
+                    report_values.extend(
+                        {
+                            "metric": weather_attribute,
+                            "value": getattr(weather_reading, weather_attribute),
+                            "date": weather_reading.date.isoformat(),
+                        }
+                        for weather_attribute in ["max_temp", "min_temp"]
+                    )
+
+        report_record["values"] = report_values
+
+        return report_record
+
+    def enable_stage_profiling(self):
+        """
+        Measure the plan, filter, calculate, format and display stages of every report.
+
+        The methods of the pipeline components are replaced by measured versions, so runs
+        without --profile pay nothing. Parsing is measured by run_reports.
+        """
+        self.stage_profiler.instrument(self.query_planner, "plan", ["plan", "get_period_predicate"])
+        self.stage_profiler.instrument(
+            self.reading_filter, "filter", ["get_sorted_readings_by_year_and_month"], count_rows=len
+        )
+        self.stage_profiler.instrument(
+            self.reading_filter, "filter", ["get_yearly_max_weather_values", "get_range_extreme_weather_values"]
+        )
+        self.stage_profiler.instrument(
+            self.weather_calculator, "calculate", ["calculate_monthly_averages_from_aggregate", "calculate_percentiles"]
+        )
+        self.stage_profiler.instrument(
+            self.weather_calculator, "calculate", ["calculate_moving_averages"], count_rows=len
+        )
+        self.stage_profiler.instrument(
+            self.reading_formatters, "format", [
+                "format_yearly_weather_report", "format_temp_chart", "format_moving_averages",
+                "format_climatology_report", "format_anomaly_report", "format_quantile_report"
+            ],
+            count_rows=len
+        )
+        self.stage_profiler.instrument(self.report, "display", ["display_weather_report"])
+        self.stage_profiler.start()
+
+    def load_station_shards(
+            self, directory, stations=None, workers=DEFAULT_PARSER_WORKERS, reading_cache=None,
+            period_predicate=None, build_rollups=True
+    ):
+        """
+        Parse a weather directory into per-station shards of indexed readings and rollups.
+
+        A columnar file written by the export subcommand can be given instead of the directory;
+        its readings are then read through a memory map, skipping the row groups of other
+        stations and periods, and the parser, workers and reading cache are not used.
+
+        Args:
+            directory (str | Path): Weather directory containing weather data files, or a columnar file.
+            stations (Collection[str] | None): Stations to load, or None for every station.
+            workers (int): Number of processes used to parse the weather files.
+            reading_cache (WeatherReadingCache | None): Cache of parsed weather files.
+            period_predicate (ReportPeriodPredicate | None): Requested periods, to skip other files.
+            build_rollups (bool): Whether to build monthly/yearly rollups while parsing.
+
+        Returns:
+            WeatherStationShards: The loaded station shards.
+        """
+        if Path(directory).is_file():
+            with ColumnarWeatherFile(directory) as columnar_file:
+                return WeatherStationShards(self.weather_data_parser).load_reading_stores(
+                    columnar_file.read_station_stores(stations, period_predicate),
+                    stations=stations,
+                    build_rollups=build_rollups
+                )
+
+        return WeatherStationShards(self.weather_data_parser).load(
+            directory,
+            stations=stations,
+            workers=workers,
+            reading_cache=reading_cache,
+            period_predicate=period_predicate,
+            build_rollups=build_rollups
+        )
+
+    def stream_station_weather_data(self, directory, station, report_queries, period_predicate, count_rows=False):
+        """
+        Stream the readings of one station, or of all stations, keeping only what the reports need.
+
+        Args:
+            directory (str | Path): Weather directory containing weather data files.
+            station (str): Station name, or ALL_STATIONS.
+            report_queries (list[ReportQuery]): Planned reports.
+            period_predicate (ReportPeriodPredicate | None): Requested periods, to skip other files.
+            count_rows (bool): Whether to count the streamed readings in the parse stage profile.
+
+        Returns:
+            tuple[WeatherRollups, WeatherReadingIndex]: Rollups of the requested periods and
+            the indexed readings of the requested charts, date ranges and quantiles.
+        """
+        streaming_reports = StreamingWeatherReports(
+            self.query_planner.get_rollup_years(report_queries),
+            self.query_planner.get_rollup_months(report_queries),
+            self.query_planner.get_periods(report_queries, [CHART_REPORT, HORIZONTAL_CHART_REPORT])
+            + self.query_planner.get_date_range_months(report_queries)
+            + self.query_planner.get_quantile_months(report_queries),
+            all_months=self.query_planner.needs_every_month(report_queries)
+        )
+        streamed_readings = self.weather_data_parser.iter_directory_readings(
+            directory,
+            period_predicate,
+            None if station == ALL_STATIONS else {station}
+        )
+
+        with self.stage_profiler.measure("parse"):
+            streaming_reports.consume(
+                self.stage_profiler.count_rows("parse", streamed_readings) if count_rows else streamed_readings
+            )
+
+        return streaming_reports.weather_rollups, streaming_reports.build_chart_index()
+
+    @staticmethod
+    def add_server_address_arguments(parser):
+        """
+        Add the report server address arguments (--host, --port) to an argument parser.
+
+        Args:
+            parser (argparse.ArgumentParser): Parser to add the arguments to.
+        """
+        parser.add_argument(
+            "--host",
+            default=DEFAULT_SERVER_HOST,
+            help=f"Address of the report server (default: {DEFAULT_SERVER_HOST})."
+        )
+
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=DEFAULT_SERVER_PORT,
+            help=f"Port of the report server (default: {DEFAULT_SERVER_PORT})."
+        )
+
+    @staticmethod
+    def add_reading_cache_arguments(parser):
+        """
+        Add the reading cache arguments (--cache, --no-cache, --cache-dir) to an argument parser.
+
+        The cache is opt-in: parsed weather files are only cached, and cache entries only
+        unpickled, when --cache is given.
+
+        Args:
+            parser (argparse.ArgumentParser): Parser to add the arguments to.
+        """
+        parser.add_argument(
+            "--cache",
+            dest="cache",
+            action="store_true",
+            help="Cache parsed weather files in --cache-dir and load unchanged files from it."
+        )
+
+        parser.add_argument(
+            "--no-cache",
+            dest="cache",
+            action="store_false",
+            help="Parse every weather file without reading or writing the cache (default)."
+        )
+
+        parser.add_argument(
+            "--cache-dir",
+            default=READING_CACHE_DIRECTORY,
+            help=f"Directory where parsed weather files are cached (default: {READING_CACHE_DIRECTORY})."
+        )
+
+    @staticmethod
+    def add_report_cache_size_argument(parser):
+        """
+        Add the --report-cache-size argument to an argument parser.
+
+        Args:
+            parser (argparse.ArgumentParser): Parser to add the argument to.
+        """
+        parser.add_argument(
+            "--report-cache-size",
+            type=int,
+            default=REPORT_CACHE_SIZE,
+            help=f"Number of rendered reports kept in the LRU report cache, 0 to disable "
+                 f"(default: {REPORT_CACHE_SIZE})."
+        )
+
+    def run_server(self, argv):
+        """
+        Load a weather directory once and answer report requests over a local socket.
 
         Command-line arguments supported:
             directory (str): Path to directory containing weather files.
+            --host HOST, --port PORT: Address the server listens on.
+            --reload-interval SECONDS: How often changed weather files are looked for.
+            -w, --workers N: Number of processes used to parse the weather files.
+            --cache: Cache parsed weather files and load unchanged ones from the cache.
+            --no-cache: Parse every weather file without using the reading cache (default).
+            --cache-dir DIR: Directory of the parsed reading cache.
+            --parser {csv,fast,mmap}: Row parser used to read the weather files.
+            --report-cache-size N: Number of rendered reports kept in memory.
+            --profile: Print wall time, calls and rows of each pipeline stage when the server stops.
+            --profile-output FILE: Dump cProfile statistics of the server run to FILE.
+
+        Args:
+            argv (list[str]): Arguments following the "serve" subcommand.
+        """
+        parser = argparse.ArgumentParser(prog="main.py serve", description="WeatherMan report server")
+
+        parser.add_argument(
+            "directory",
+            nargs="?",
+            default=DEFAULT_WEATHER_DIR_PATH,
+            help="Weather directory containing weather data files."
+        )
+
+        self.add_server_address_arguments(parser)
+
+        parser.add_argument(
+            "--reload-interval",
+            type=float,
+            default=SERVER_RELOAD_INTERVAL_SECONDS,
+            help="Seconds between checks for changed weather files "
+                 f"(default: {SERVER_RELOAD_INTERVAL_SECONDS:g})."
+        )
+
+        parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=DEFAULT_PARSER_WORKERS,
+            help="Number of processes used to parse weather files in parallel (default: 1)."
+        )
+
+        self.add_reading_cache_arguments(parser)
+
+        parser.add_argument(
+            "--parser",
+            choices=sorted(WEATHER_DATA_PARSERS),
+            default=DEFAULT_PARSER_BACKEND,
+            help="Row parser used to read weather files (default: csv)."
+        )
+
+        self.add_report_cache_size_argument(parser)
+
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Print wall time, call count and rows processed of the plan, parse, filter, "
+                 "calculate, format and display stages when the server stops."
+        )
+
+        parser.add_argument(
+            "--profile-output",
+            metavar="FILE",
+            help="Dump cProfile statistics of the whole run to FILE (read them with pstats)."
+        )
+
+        args = parser.parse_args(argv)
+
+        self.weather_data_parser = WEATHER_DATA_PARSERS[args.parser]()
+
+        try:
+            report_server = WeatherReportServer(
+                self,
+                args.directory,
+                workers=args.workers,
+                reading_cache=WeatherReadingCache(args.cache_dir) if args.cache else None,
+                reload_interval=args.reload_interval,
+                report_cache_size=args.report_cache_size
+            )
+        except ValueError as report_cache_size_error:
+            parser.error(str(report_cache_size_error))
+
+        if args.profile:
+            self.enable_stage_profiling()
+
+        run_profile = cProfile.Profile() if args.profile_output else None
+
+        try:
+            if run_profile:
+                run_profile.runcall(asyncio.run, report_server.serve(args.host, args.port))
+            else:
+                asyncio.run(report_server.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if run_profile:
+                run_profile.dump_stats(args.profile_output)
+
+            if args.profile:
+                self.stage_profiler.stop()
+                print(self.stage_profiler.format_summary())
+
+    def run_client(self, argv):
+        """
+        Request reports from a running report server and print them like the CLI does.
+
+        Command-line arguments supported:
+            -e, -a, -c, -b, --from, --to, --rolling, --climatology, --anomaly, -q, -s: The same
+                report arguments as the CLI.
+            --host HOST, --port PORT: Address of the report server.
+            --cache-stats: Print the server's report cache hit/miss summary.
+
+        Args:
+            argv (list[str]): Arguments following the "client" subcommand.
+        """
+        parser = argparse.ArgumentParser(prog="main.py client", description="WeatherMan report client")
+
+        self.add_report_arguments(parser)
+        self.add_server_address_arguments(parser)
+
+        parser.add_argument(
+            "--cache-stats",
+            action="store_true",
+            help="Print the server's report cache hit/miss summary after the reports."
+        )
+
+        args = parser.parse_args(argv)
+
+        report_client = WeatherReportClient(args.host, args.port)
+
+        try:
+            rendered_reports = asyncio.run(report_client.request_reports({
+                "yearly": args.yearly,
+                "monthly": args.monthly,
+                "chart": args.chart,
+                "hchart": args.hchart,
+                "from": args.from_date,
+                "to": args.to_date,
+                "rolling": args.rolling,
+                "climatology": args.climatology,
+                "anomaly": args.anomaly,
+                "quantiles": args.quantiles,
+                "station": args.station,
+                "cache_stats": args.cache_stats,
+            }))
+        except OSError as connection_error:
+            parser.error(f"cannot reach the report server at {args.host}:{args.port}: {connection_error}")
+
+        print(rendered_reports, end="")
+
+    def get_station_names(self, directory):
+        """
+        List the stations of a weather directory or columnar file.
+
+        Args:
+            directory (str | Path): Weather directory containing weather data files, or a columnar file.
+
+        Returns:
+            list[str]: Sorted station names.
+
+        Raises:
+            ValueError: If a file is given that is not a columnar weather file.
+        """
+        if Path(directory).is_file():
+            with ColumnarWeatherFile(directory) as columnar_file:
+                return columnar_file.get_stations()
+
+        return self.weather_data_parser.get_station_names(directory)
+
+    @staticmethod
+    def write_weather_files(directory, station_reading_stores):
+        """
+        Write readings as weather files, one per station and month, that the weather data parsers read.
+
+        Only the date, max/min temperature and mean humidity columns are written; missing
+        values are left empty.
+
+        Args:
+            directory (str | Path): Directory to write the weather files to.
+            station_reading_stores (dict[str, WeatherReadingStore]): Readings of each station.
+
+        Returns:
+            int: Number of weather files written.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        month_readings = {}
+
+        for station, reading_store in station_reading_stores.items():
+            for weather_reading in reading_store:
+                month_readings.setdefault(
+                    (station, weather_reading.date.year, weather_reading.date.month), []
+                ).append(weather_reading)
+
+        for (station, year, month), weather_readings in month_readings.items():
+            weather_file_name = WEATHER_FILE_NAME_FORMAT.format(
+                station=station, year=year, month_abbr=calendar.month_abbr[month]
+            )
+
+            with open(directory / weather_file_name, "w", newline="") as weather_file:
+                csv_writer = csv.writer(weather_file)
+                csv_writer.writerow([DATE_COLUMNS[0], MAX_TEMPERATURE, MIN_TEMPERATURE, MEAN_HUMIDITY])
+                csv_writer.writerows(
+                    [
+                        f"{weather_reading.date.year}-{weather_reading.date.month}-{weather_reading.date.day}",
+                        *("" if attribute_value is None else attribute_value
+                          for attribute_value in weather_reading.as_tuple()[1:]),
+                    ]
+                    for weather_reading in weather_readings
+                )
+
+        return len(month_readings)
+
+    def run_export(self, argv):
+        """
+        Parse a weather directory and write its readings to a columnar file.
+
+        The file holds one row group per station and year with min/max statistics, so
+        reports given the file instead of the directory read only the row groups they need.
+
+        Command-line arguments supported:
+            directory (str): Path to directory containing weather files.
+            output (str): Columnar file to write.
+            -w, --workers N: Number of processes used to parse the weather files.
+            --cache: Cache parsed weather files and load unchanged ones from the cache.
+            --no-cache: Parse every weather file without using the reading cache (default).
+            --cache-dir DIR: Directory of the parsed reading cache.
+            --parser {csv,fast,mmap}: Row parser used to read the weather files.
+
+        Args:
+            argv (list[str]): Arguments following the "export" subcommand.
+        """
+        parser = argparse.ArgumentParser(prog="main.py export", description="Export weather readings")
+
+        parser.add_argument("directory", help="Weather directory containing weather data files.")
+        parser.add_argument("output", help="Columnar file to write.")
+
+        parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            default=DEFAULT_PARSER_WORKERS,
+            help="Number of processes used to parse weather files in parallel (default: 1)."
+        )
+
+        self.add_reading_cache_arguments(parser)
+
+        parser.add_argument(
+            "--parser",
+            choices=sorted(WEATHER_DATA_PARSERS),
+            default=DEFAULT_PARSER_BACKEND,
+            help="Row parser used to read weather files (default: csv)."
+        )
+
+        args = parser.parse_args(argv)
+
+        if not Path(args.directory).is_dir():
+            parser.error(f"not a weather directory: {args.directory}")
+
+        self.weather_data_parser = WEATHER_DATA_PARSERS[args.parser]()
+        station_shards = WeatherStationShards(self.weather_data_parser).load(
+            args.directory,
+            workers=args.workers,
+            reading_cache=WeatherReadingCache(args.cache_dir) if args.cache else None,
+            build_rollups=False
+        )
+        row_groups = ColumnarWeatherFile.write(args.output, {
+            station: station_shard.weather_readings.sorted_readings
+            for station, station_shard in station_shards.station_shards.items()
+        })
+
+        print(
+            f"Exported {station_shards.count_readings()} readings of {len(station_shards.station_shards)} "
+            f"station(s) in {len(row_groups)} row group(s) to {args.output}"
+        )
+
+    def run_import(self, argv):
+        """
+        Read a columnar file and write its readings back to a weather directory.
+
+        Command-line arguments supported:
+            input (str): Columnar file written by the export subcommand.
+            directory (str): Directory to write the weather files to.
+
+        Args:
+            argv (list[str]): Arguments following the "import" subcommand.
+        """
+        parser = argparse.ArgumentParser(prog="main.py import", description="Import weather readings")
+
+        parser.add_argument("input", help="Columnar file written by the export subcommand.")
+        parser.add_argument("directory", help="Directory to write the weather files to.")
+
+        args = parser.parse_args(argv)
+
+        try:
+            with ColumnarWeatherFile(args.input) as columnar_file:
+                station_reading_stores = columnar_file.read_station_stores()
+        except (OSError, ValueError) as columnar_file_error:
+            parser.error(str(columnar_file_error))
+
+        weather_file_count = self.write_weather_files(args.directory, station_reading_stores)
+
+        print(
+            f"Imported {sum(map(len, station_reading_stores.values()))} readings into "
+            f"{weather_file_count} weather file(s) in {args.directory}"
+        )
+
+    def run_reports(self, args, reading_cache=None):
+        """
+        Load the weather data the requested reports need and print the reports.
+
+        With a machine-readable --format, every report is serialized as soon as it is computed
+        and the cache and profile summaries go to stderr, so stdout only holds the records.
+
+        Args:
+            args (argparse.Namespace): Parsed command-line arguments of run.
+            reading_cache (WeatherReadingCache | None): Cache of parsed weather files.
+        """
+        report_queries = self.query_planner.plan(
+            args.yearly, args.monthly, args.chart, args.hchart, (args.from_date, args.to_date), args.rolling,
+            args.climatology, args.anomaly, args.quantiles
+        )
+        period_predicate = self.query_planner.get_period_predicate(report_queries)
+        selected_stations = list(dict.fromkeys(args.station))
+        station_shards = None
+        report_serializer = None
+        summary_stream = sys.stdout
+
+        if args.format != DEFAULT_OUTPUT_FORMAT:
+            report_serializer = REPORT_SERIALIZERS[args.format](sys.stdout)
+            summary_stream = sys.stderr
+
+            if args.profile:
+                self.stage_profiler.instrument(report_serializer, "display", ["write_report"])
+
+        if not args.stream:
+            with self.stage_profiler.measure("parse") as parse_statistics:
+                station_shards = self.load_station_shards(
+                    args.directory,
+                    stations=None if ALL_STATIONS in selected_stations else set(selected_stations),
+                    workers=args.workers,
+                    reading_cache=reading_cache,
+                    period_predicate=period_predicate,
+                    build_rollups=args.calculator == DEFAULT_CALCULATOR_BACKEND and not args.batch
+                )
+
+            parse_statistics.rows += station_shards.count_readings()
+
+        if reading_cache and args.cache_stats:
+            print(reading_cache.format_summary(), file=summary_stream)
+
+        if report_serializer:
+            report_serializer.begin()
+
+        for station in selected_stations:
+            if args.stream:
+                weather_rollups, weather_readings = self.stream_station_weather_data(
+                    args.directory, station, report_queries, period_predicate, count_rows=args.profile
+                )
+            else:
+                station_shard = station_shards.get_shard(station)
+                weather_rollups, weather_readings = station_shard.weather_rollups, station_shard.weather_readings
+
+                if args.batch:
+                    with self.stage_profiler.measure("calculate"):
+                        weather_rollups = self.query_planner.execute(report_queries, weather_readings)
+                elif weather_rollups is None:
+                    weather_rollups = IndexedWeatherAggregates(weather_readings, self.weather_calculator)
+
+            if args.profile:
+                self.stage_profiler.instrument(weather_rollups, "calculate", ["get_year_rollup", "get_month_rollup"])
+
+            if report_serializer:
+                for report_query in report_queries:
+                    report_serializer.write_report(self.build_report_record(
+                        report_query, weather_rollups, weather_readings, station=station
+                    ))
+
+                continue
+
+            if len(selected_stations) > 1:
+                sys.stdout.write(f"Station: {station}\n")
+
+            for report_query in report_queries:
+                sys.stdout.write(self.render_report_query(
+                    report_query, weather_rollups, weather_readings, station=station
+                ))
+
+        if report_serializer:
+            report_serializer.end()
+
+        if args.cache_stats:
+            print(self.report_cache.format_summary(), file=summary_stream)
+
+        if args.profile:
+            self.stage_profiler.stop()
+            print(self.stage_profiler.format_summary(), file=summary_stream)
+
+    def run(self, argv=None):
+        """
+        Parse Command-Line Arguments and execute requested weather reports or temperature charts.
+
+        Command-line arguments supported:
+            directory (str): Path to directory containing weather files, or to a columnar file.
             -e, --yearly YEAR [YEAR ...]: Generate yearly reports for given YEAR(s).
             -a, --monthly YEAR/MONTH [YEAR/MONTH ...]: Generate monthly averages.
             -c, --chart YEAR/MONTH [YEAR/MONTH ...]: Generate vertical monthly charts.
             -b, --hchart YEAR/MONTH [YEAR/MONTH ...]: Generate horizontal monthly charts.
+            --from YYYY-MM-DD, --to YYYY-MM-DD: Report the extremes and averages of a date range.
+            --rolling DAYS [DAYS ...]: Print moving averages over trailing windows for the date range.
+            --climatology: Print per-calendar-month baselines across all years.
+            --anomaly YEAR/MONTH [YEAR/MONTH ...]: Compare months with their calendar month's baseline.
+            -q, --quantiles PERIOD [PERIOD ...]: Print median, p90 and p99 of a YEAR or YEAR/MONTH.
+            -s, --station STATION [STATION ...]: Stations to report on, or "all" (default).
+            -w, --workers N: Number of processes used to parse the weather files.
+            --cache: Cache parsed weather files and load unchanged ones from the cache.
+            --no-cache: Parse every weather file without using the reading cache (default).
+            --cache-dir DIR: Directory of the parsed reading cache.
+            --rebuild-cache: Ignore cached readings and rebuild the reading cache (implies --cache).
+            --cache-stats: Print the reading cache hit/miss summary.
+            --incremental: Parse only rows appended to cached weather files (implies --cache).
+            --stream: Stream readings and keep only the data the requested reports need.
+            --parser {csv,fast,mmap}: Row parser used to read the weather files.
+            --calculator {numpy,python}: Backend computing yearly and monthly statistics.
+            --batch: Compute all requested reports in one pass over the buckets they need.
+            --report-cache-size N: Number of rendered reports kept for repeated requests.
+            --profile: Print wall time, calls and rows of each pipeline stage.
+            --profile-output FILE: Dump cProfile statistics of the run to FILE.
+            --color {always,auto,never}: Whether charts use ANSI colors ("auto": only on a terminal).
+            --format {text,csv,json,ndjson}: Print yearly, monthly and chart reports as text or as records.
+
+        Subcommands:
+            serve: Keep the readings in memory and answer report requests (see run_server).
+            client: Print reports answered by a running server (see run_client).
+            export: Write the readings of a weather directory to a columnar file (see run_export).
+            import: Write the readings of a columnar file back to weather files (see run_import).
 
         Behavior:
-            Parses all CSV files in the specified directory.
+            Parses all CSV files in the specified directory, or reads a columnar file given instead.
             Generates and displays reports based on user CLI arguments.
-            Validates YEAR/MONTH input formats and prints respective errors for invalid formats.
+            Validates YEAR/MONTH and date input formats and prints respective errors for invalid formats.
 
         Returns:
             Requested weather reports or temperature charts or Error messages.
         """
+        argv = sys.argv[1:] if argv is None else argv
+
+        if argv[:1] == ["serve"]:
+            return self.run_server(argv[1:])
+
+        if argv[:1] == ["client"]:
+            return self.run_client(argv[1:])
+
+        if argv[:1] == ["export"]:
+            return self.run_export(argv[1:])
+
+        if argv[:1] == ["import"]:
+            return self.run_import(argv[1:])
+
         parser = argparse.ArgumentParser(description="WeatherMan Project")
 
         parser.add_argument(
             "directory",
             nargs="?",
             default=DEFAULT_WEATHER_DIR_PATH,
-            help="Weather directory containing weather data files."
+            help="Weather directory containing weather data files, or a columnar file written by export."
         )
 
+        self.add_report_arguments(parser)
+
         parser.add_argument(
-            "-e", "--yearly",
+            "-w", "--workers",
             type=int,
-            nargs="+",
-            help="Generate yearly reports. Provide YEAR(s)."
+            default=DEFAULT_PARSER_WORKERS,
+            help="Number of processes used to parse weather files in parallel (default: 1)."
         )
 
+        self.add_reading_cache_arguments(parser)
+
         parser.add_argument(
-            "-a", "--monthly",
-            type=str,
-            nargs="+",
-            help="Generate monthly averages. Provide YEAR(s)/MONTH(s) (e.g: 2006/3)."
+            "--rebuild-cache",
+            action="store_true",
+            help="Ignore cached readings, parse every weather file and rewrite the cache (implies --cache)."
         )
 
         parser.add_argument(
-            "-c", "--chart",
-            type=str,
-            nargs="+",
-            help="Generate vertical monthly charts. Provide YEAR(s)/MONTH(s)."
+            "--cache-stats",
+            action="store_true",
+            help="Print how many weather files were loaded from the cache."
         )
 
         parser.add_argument(
-            "-b", "--hchart",
-            type=str,
-            nargs="+",
-            help="Generate horizontal monthly charts. Provide YEAR/MONTH."
+            "--incremental",
+            action="store_true",
+            help="Parse only the rows appended to weather files since they were cached (implies --cache)."
         )
 
-        args = parser.parse_args()
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Stream readings from the weather files with bounded memory, "
+                 "without the reading cache or worker processes."
+        )
 
-        weather_readings = self.weather_data_parser.parse_directory_to_readings(args.directory)
+        parser.add_argument(
+            "--parser",
+            choices=sorted(WEATHER_DATA_PARSERS),
+            default=DEFAULT_PARSER_BACKEND,
+            help="Row parser used to read weather files (default: csv)."
+        )
 
-        if args.yearly:
-            for raw_year in args.yearly:
-                try:
-                    year = self.date_parser.parse_and_validate_year(raw_year)
+        parser.add_argument(
+            "--calculator",
+            choices=sorted(WEATHER_CALCULATORS),
+            default=DEFAULT_CALCULATOR_BACKEND,
+            help="Backend computing yearly and monthly statistics (default: python, "
+                 "answered from rollups built while parsing)."
+        )
 
-                    yearly_weather_readings = self.reading_filter.get_readings_by_year_and_month(
-                        weather_readings,
-                        year
-                    )
+        parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="Plan all requested reports together and compute them in one pass over "
+                 "the year/month buckets they need."
+        )
 
-                    valid_weather_readings = self.reading_validator.validate_yearly_weather_readings_by_attribute(
-                        yearly_weather_readings,
-                        WEATHER_ATTRIBUTES
-                    )
+        self.add_report_cache_size_argument(parser)
 
-                    max_values_per_attribute = self.weather_calculator.find_max_reading_per_attribute(
-                        valid_weather_readings
-                    )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Print wall time, call count and rows processed of the plan, parse, filter, "
+                 "calculate, format and display stages."
+        )
 
-                    yearly_report = self.reading_filter.get_yearly_max_weather_values(
-                        max_values_per_attribute
-                    )
+        parser.add_argument(
+            "--profile-output",
+            metavar="FILE",
+            help="Dump cProfile statistics of the whole run to FILE (read them with pstats)."
+        )
 
-                    formatted_weather_report = self.reading_formatters.format_yearly_weather_report(
-                        yearly_report
-                    )
+        parser.add_argument(
+            "--color",
+            choices=["always", "auto", "never"],
+            default="always",
+            help="Use ANSI colors in temperature charts: always (default), auto (only when "
+                 "writing to a terminal) or never."
+        )
 
-                    self.report.display_weather_report(
-                        self.report.display_yearly_report,
-                        formatted_weather_report,
-                        year=year
-                    )
-                except ValueError as date_input_error:
-                    print(date_input_error)
-
-        if args.monthly:
-            for raw_month in args.monthly:
-                try:
-                    year, month = self.date_parser.parse_and_validate_year_and_month(raw_month)
-
-                    monthly_weather_readings = self.reading_filter.get_sorted_readings_by_year_and_month(
-                        weather_readings,
-                        year,
-                        month
-                    )
+        parser.add_argument(
+            "--format",
+            choices=[DEFAULT_OUTPUT_FORMAT, *sorted(REPORT_SERIALIZERS)],
+            default=DEFAULT_OUTPUT_FORMAT,
+            help="Output format of the yearly, monthly and chart reports: text (default), or "
+                 "csv, json or ndjson records written as each report is computed."
+        )
 
-                    if monthly_weather_readings:
-                        validated_values = self.reading_validator.validate_monthly_weather_readings(
-                            monthly_weather_readings,
-                            MONTHLY_ATTRIBUTE_MAP
-                        )
-
-                        monthly_averages = self.weather_calculator.calculate_monthly_averages(
-                            validated_values
-                        )
-
-                        self.report.display_weather_report(
-                            self.report.display_monthly_report,
-                            monthly_averages,
-                            year=year,
-                            month=month
-                        )
-                except ValueError as date_input_error:
-                    print(date_input_error)
-
-        for chart_args, horizontal in [(args.chart, False), (args.hchart, True)]:
-            for monthly_weather_chart in chart_args or []:
-                try:
-                    year, month = self.date_parser.parse_and_validate_year_and_month(monthly_weather_chart)
-
-                    monthly_weather_readings = self.reading_filter.get_sorted_readings_by_year_and_month(
-                        weather_readings,
-                        year,
-                        month
-                    )
+        args = parser.parse_args(argv)
+
+        if args.format != DEFAULT_OUTPUT_FORMAT and (
+            args.from_date or args.to_date or args.rolling or args.climatology or args.anomaly or args.quantiles
+        ):
+            parser.error(f"--format {args.format} supports the -e, -a, -c and -b reports only")
+
+        self.weather_data_parser = WEATHER_DATA_PARSERS[args.parser]()
+        columnar_input = Path(args.directory).is_file()
+
+        if columnar_input and args.stream:
+            parser.error("--stream reads weather directories only, not columnar files")
+
+        try:
+            station_names = self.get_station_names(args.directory)
+        except ValueError as columnar_file_error:
+            parser.error(str(columnar_file_error))
+
+        unknown_stations = set(args.station) - {ALL_STATIONS, *station_names}
+
+        if unknown_stations:
+            parser.error(f"unknown station(s): {', '.join(sorted(unknown_stations))}")
+
+        self.reading_formatters = WeatherReadingFormatter(
+            use_colors=args.color == "always" or (args.color == "auto" and sys.stdout.isatty())
+        )
+
+        try:
+            self.weather_calculator = WEATHER_CALCULATORS[args.calculator]()
+        except ImportError as missing_dependency_error:
+            parser.error(str(missing_dependency_error))
+
+        reading_cache = None
+
+        if (args.cache or args.rebuild_cache or args.incremental) and not (args.stream or columnar_input):
+            reading_cache = WeatherReadingCache(
+                args.cache_dir,
+                rebuild=args.rebuild_cache,
+                incremental=args.incremental
+            )
+
+        try:
+            self.report_cache = ReportResultCache(args.report_cache_size)
+        except ValueError as report_cache_size_error:
+            parser.error(str(report_cache_size_error))
+
+        if args.profile:
+            self.enable_stage_profiling()
+
+        if args.profile_output:
+            run_profile = cProfile.Profile()
 
-                    if monthly_weather_readings:
-                        formatted_temp_bars = self.reading_formatters.format_temp_chart(
-                            monthly_weather_readings, horizontal
-                        )
-
-                        self.report.display_weather_report(
-                            self.report.display_temp_chart,
-                            formatted_temp_bars,
-                            year=year,
-                            month=month
-                        )
-                except ValueError as date_input_error:
-                    print(date_input_error)
+            try:
+                run_profile.runcall(self.run_reports, args, reading_cache)
+            finally:
+                run_profile.dump_stats(args.profile_output)
+        else:
+            self.run_reports(args, reading_cache)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+from calculations import WeatherCalculator
+from constants import WEATHER_ATTRIBUTES
+from quantiles import QuantileSketch
+from reading_store import WeatherReadingStore
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NumpyWeatherAggregate:
+    """
+    Statistics of every weather attribute of a WeatherReadingStore, computed with NumPy.
+
+    Offers the same get_max_readings and get_totals interface as WeatherAggregate.
+    Valid values are the present, non-zero ones, and argmax/argmin return the first
+    occurrence, so the results match the pure-Python aggregation.
+    """
+    def __init__(self, reading_store, weather_attributes=WEATHER_ATTRIBUTES):
+        self.reading_store = reading_store
+        self.attribute_statistics = {
+            weather_attribute: self.calculate_attribute_statistics(weather_attribute)
+            for weather_attribute in weather_attributes
+        }
+
+    def get_masked_column(self, weather_attribute):
+        """
+        Return the valid values of an attribute column and their positions.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Valid values and their positions in the store.
+        """
+        attribute_values = numpy.frombuffer(
+            self.reading_store.attribute_values[weather_attribute],
+            dtype=numpy.dtype(self.reading_store.attribute_values[weather_attribute].typecode)
+        )
+        missing_value_mask = numpy.frombuffer(
+            self.reading_store.missing_value_masks[weather_attribute],
+            dtype=numpy.uint8
+        )
+        valid_value_positions = numpy.flatnonzero((attribute_values != 0) & (missing_value_mask == 0))
+
+        return attribute_values[valid_value_positions], valid_value_positions
+
+    def calculate_attribute_statistics(self, weather_attribute):
+        """
+        Calculate count, sum and the positions of the maximum and minimum of an attribute.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            dict[str, int | None]: "count", "total", "max_position" and "min_position".
+        """
+        if not len(self.reading_store):
+            valid_values = valid_value_positions = numpy.empty(0, dtype=numpy.int64)
+        else:
+            valid_values, valid_value_positions = self.get_masked_column(weather_attribute)
+
+        if not valid_values.size:
+            return {"count": 0, "total": 0, "max_position": None, "min_position": None}
+
+        return {
+            "count": int(valid_values.size),
+            "total": int(valid_values.sum(dtype=numpy.int64)),
+            "max_position": int(valid_value_positions[numpy.argmax(valid_values)]),
+            "min_position": int(valid_value_positions[numpy.argmin(valid_values)]),
+        }
+
+    def get_max_readings(self):
+        """
+        Return the reading holding the maximum value of each attribute.
+
+        Returns:
+            dict[str, WeatherReading]: Mapping of attribute to its maximum reading.
+            Attributes without any valid value are left out.
+        """
+        return {
+            weather_attribute: self.reading_store.get_reading(attribute_statistics["max_position"])
+            for weather_attribute, attribute_statistics in self.attribute_statistics.items()
+            if attribute_statistics["count"]
+        }
+
+    def get_totals(self, weather_attribute):
+        """
+        Return the sum and count of the valid values of an attribute.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            tuple[int, int]: Sum and count of the valid values.
+        """
+        attribute_statistics = self.attribute_statistics[weather_attribute]
+
+        return attribute_statistics["total"], attribute_statistics["count"]
+
+    def get_percentiles(self, weather_attribute, percentiles):
+        """
+        Return exact percentiles of the valid values of an attribute.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+            percentiles (Iterable[int]): Percentiles between 0 and 100.
+
+        Returns:
+            list[int] | None: One value per percentile, or None if there is no valid value.
+        """
+        if not len(self.reading_store):
+            return None
+
+        valid_values, _ = self.get_masked_column(weather_attribute)
+
+        return QuantileSketch.from_values(valid_values.tolist()).get_percentiles(percentiles)
+
+
+class NumpyWeatherCalculator(WeatherCalculator):
+    """
+    WeatherCalculator that uses vectorized NumPy operations on WeatherReadingStore columns.
+
+    Lists of readings or values are handled by the pure-Python WeatherCalculator methods.
+    """
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("The numpy calculator backend requires NumPy. Install it with: pip install numpy")
+
+    @staticmethod
+    def aggregate_weather_readings(weather_readings, weather_attributes=WEATHER_ATTRIBUTES):
+        """
+        Gather sum, count, maximum and minimum of every attribute.
+
+        Args:
+            weather_readings (list[WeatherReading] | WeatherReadingStore): Readings to aggregate.
+            weather_attributes (list[str]): Attribute names to aggregate.
+
+        Returns:
+            NumpyWeatherAggregate | WeatherAggregate: Statistics of every requested attribute.
+        """
+        if isinstance(weather_readings, WeatherReadingStore):
+            return NumpyWeatherAggregate(weather_readings, weather_attributes)
+
+        return WeatherCalculator.aggregate_weather_readings(weather_readings, weather_attributes)
+
+    @staticmethod
+    def find_max_reading_per_attribute(attribute_readings):
+        """
+        Find the maximum reading for each weather attribute.
+
+        Args:
+            attribute_readings (dict[str, list[WeatherReading] | WeatherReadingStore]):
+                Dictionary mapping weather attributes to the readings valid for that attribute.
+
+        Returns:
+            dict[str, WeatherReading]: Dictionary mapping each attribute to the first
+            WeatherReading holding its maximum valid value. Missing and zero values of a
+            store are skipped, as in the Python backend.
+        """
+        max_reading_per_attribute = {}
+
+        for weather_attribute, weather_readings_for_attribute in attribute_readings.items():
+            if not isinstance(weather_readings_for_attribute, WeatherReadingStore):
+                max_reading_per_attribute.update(WeatherCalculator.find_max_reading_per_attribute(
+                    {weather_attribute: weather_readings_for_attribute}
+                ))
+            else:
+                max_reading_per_attribute.update(
+                    NumpyWeatherAggregate(weather_readings_for_attribute, [weather_attribute]).get_max_readings()
+                )
+
+        return max_reading_per_attribute
+
+
+WEATHER_CALCULATORS = {
+    "python": WeatherCalculator,
+    "numpy": NumpyWeatherCalculator,
+}
@@ -1,13 +1,34 @@
 import csv
+import io
 import logging
-from datetime import datetime
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import ContextVar
+from datetime import (
+    date,
+    datetime,
+)
+from itertools import repeat
 from pathlib import Path
 
 from constants import (
     DATE_COLUMNS,
+    DATE_INPUT_FORMAT,
+    DEFAULT_PARSER_WORKERS,
+    FILE_BOUNDARY_READ_BYTES,
+    FILE_NAME_PERIOD_PATTERN,
+    MONTH_ABBREVIATIONS,
     LOG_CONFIG,
     NUMERIC_FIELDS,
+    PARALLEL_FILES_PER_WORKER_CHUNK,
+    PARSER_LOGGER_NAME,
+    READING_VALUE_MAX,
+    READING_VALUE_MIN,
+    STATION_FILE_NAME_PATTERN,
 )
+from rollups import WeatherRollups
 from weather_reading import WeatherReading
 
 logging.basicConfig(
@@ -18,6 +39,33 @@ logging.basicConfig(
 )
 
 
+collected_parsing_warnings = ContextVar("collected_parsing_warnings", default=None)
+
+
+class ParsingWarningCollector(logging.Filter):
+    """
+    Filter of the parser logger that holds back the parsing warnings of collecting contexts.
+
+    While WeatherDataParser.collect_parsing_warnings runs, the messages of the warnings
+    logged in its context (thread or task) are kept in collected_parsing_warnings instead
+    of being emitted. Warnings logged in any other context, and every other logger, are
+    left untouched.
+    """
+    def filter(self, record):
+        parsing_warnings = collected_parsing_warnings.get()
+
+        if parsing_warnings is None:
+            return True
+
+        parsing_warnings.append(record.getMessage())
+
+        return False
+
+
+parser_logger = logging.getLogger(PARSER_LOGGER_NAME)
+parser_logger.addFilter(ParsingWarningCollector())
+
+
 class WeatherDataParser:
     @staticmethod
     def parse_value_to_int(raw_value):
@@ -48,39 +96,550 @@ class WeatherDataParser:
             error_type (str): Type of error or warning.
             message (str): Message about the warning.
         """
-        logging.warning(f"{weather_file_name}, row {row_num}: {error_type} - {message}")
+        parser_logger.warning(f"{weather_file_name}, row {row_num}: {error_type} - {message}")
+
+    @classmethod
+    def build_reading(cls, reading_date, numeric_values, weather_file_name, weather_file_row_num):
+        """
+        Create a WeatherReading, treating values the reading store cannot hold as missing.
+
+        Readings are stored in typed arrays of READING_VALUE_TYPECODE, so integers outside
+        [READING_VALUE_MIN, READING_VALUE_MAX] are logged as out of range and dropped.
+
+        Args:
+            reading_date (date): Date of the reading.
+            numeric_values (Sequence[int | None]): Values of the NUMERIC_FIELDS columns.
+            weather_file_name (str): Name of the file being parsed.
+            weather_file_row_num (int): The row number in the CSV file.
+
+        Returns:
+            WeatherReading: The reading.
+        """
+        if all(
+            numeric_value is None or READING_VALUE_MIN <= numeric_value <= READING_VALUE_MAX
+            for numeric_value in numeric_values
+        ):
+            return WeatherReading(reading_date, *numeric_values)
+
+        checked_values = []
+
+        for weather_field_label, numeric_value in zip(NUMERIC_FIELDS.values(), numeric_values):
+            if numeric_value is not None and not READING_VALUE_MIN <= numeric_value <= READING_VALUE_MAX:
+                cls.log_parsing_warning(
+                    weather_file_name,
+                    weather_file_row_num,
+                    "ValueOutOfRange",
+                    f"'{weather_field_label.strip()}' value {numeric_value} is outside "
+                    f"[{READING_VALUE_MIN}, {READING_VALUE_MAX}] and is treated as missing"
+                )
+                numeric_value = None
+
+            checked_values.append(numeric_value)
+
+        return WeatherReading(reading_date, *checked_values)
 
     @classmethod
-    def parse_directory_to_readings(cls, directory):
+    def parse_directory_to_readings(
+            cls, directory, workers=DEFAULT_PARSER_WORKERS, reading_cache=None, weather_rollups=None,
+            period_predicate=None, stations=None
+    ):
         """
         Parse all CSV files in a directory into WeatherReading objects.
 
+        Files are parsed in sorted filename order, so the returned readings are in the
+        same order whether the files are parsed serially, by a pool of processes or
+        loaded from the reading cache.
+
         Args:
             directory (str): Path to the directory containing weather CSV files.
+            workers (int): Number of worker processes to parse files with.
+                Files are parsed serially in this process when workers is 1 or less.
+            reading_cache (WeatherReadingCache | None): Cache of already parsed files.
+                Unchanged files are loaded from it, parsed files are stored in it.
+            weather_rollups (WeatherRollups | None): When given, the monthly rollups of every
+                file are built while it is parsed (or loaded from the cache) and merged into it.
+            period_predicate (ReportPeriodPredicate | None): Requested periods; files that
+                cannot hold readings of these periods are skipped without being parsed.
+            stations (Collection[str] | None): Stations whose files are parsed, or None for all.
 
         Returns:
             list[WeatherReading]: A list of WeatherReading objects parsed from all files in the directory.
         """
+        weather_data_files = cls.select_weather_files(directory, period_predicate, stations)
+        build_rollups = weather_rollups is not None
         parsed_weather_readings = []
 
-        for weather_data_file in Path(directory).iterdir():
-            parsed_weather_readings.extend(cls.parse_file_to_readings(weather_data_file))
+        for weather_readings, file_rollups in cls.parse_weather_files(
+            weather_data_files, workers, reading_cache, build_rollups
+        ):
+            parsed_weather_readings.extend(weather_readings)
+
+            if build_rollups:
+                weather_rollups.merge(file_rollups)
 
         return parsed_weather_readings
 
     @classmethod
-    def parse_file_to_readings(cls, weather_file_path):
+    def parse_weather_files(
+            cls, weather_data_files, workers=DEFAULT_PARSER_WORKERS, reading_cache=None, build_rollups=False
+    ):
+        """
+        Parse weather files, loading unchanged ones from the reading cache.
+
+        The parsing warnings of every file are logged in the order of weather_data_files,
+        including the warnings stored with cached files, so the log is the same whether a
+        file was parsed or loaded from the cache.
+
+        Args:
+            weather_data_files (list[Path]): Paths of the CSV files to parse.
+            workers (int): Number of worker processes to parse files with.
+            reading_cache (WeatherReadingCache | None): Cache of already parsed files.
+                Unchanged files are loaded from it, parsed files are stored in it.
+            build_rollups (bool): Whether to build the monthly rollups of each file.
+
+        Returns:
+            list[tuple[list[WeatherReading], WeatherRollups | None]]: Readings and rollups of
+            each file, in the order of weather_data_files.
+        """
+        parsed_files = {}
+
+        if reading_cache:
+            for weather_data_file in weather_data_files:
+                cached_weather_file = reading_cache.load(weather_data_file)
+
+                if cached_weather_file is not None:
+                    cached_weather_readings, cached_file_rollups, cached_parsing_warnings = cached_weather_file
+
+                    if build_rollups and cached_file_rollups is None:
+                        cached_file_rollups = WeatherRollups()
+
+                        for weather_reading in cached_weather_readings:
+                            cached_file_rollups.add_reading(weather_reading)
+
+                    parsed_files[weather_data_file] = (
+                        cached_weather_readings, cached_file_rollups, cached_parsing_warnings
+                    )
+                elif reading_cache.incremental:
+                    appendable_cache_entry = reading_cache.load_appendable(weather_data_file)
+
+                    if appendable_cache_entry:
+                        file_stat = weather_data_file.stat()
+                        appended_bytes = reading_cache.read_appended_lines(weather_data_file, appendable_cache_entry)
+                        updated_weather_file = cls.parse_appended_rows(
+                            weather_data_file,
+                            appended_bytes.decode("utf-8"),
+                            appendable_cache_entry,
+                            reading_cache.unpack_readings(appendable_cache_entry["readings"]),
+                            build_rollups
+                        )
+
+                        if updated_weather_file:
+                            parsed_files[weather_data_file] = updated_weather_file
+                            reading_cache.store_appended_rows(
+                                weather_data_file,
+                                *updated_weather_file,
+                                appendable_cache_entry,
+                                appended_bytes,
+                                file_stat
+                            )
+
+        files_to_parse = [
+            weather_data_file
+            for weather_data_file in weather_data_files
+            if weather_data_file not in parsed_files
+        ]
+        # Taken before parsing, so rows appended while a file is parsed are not recorded as cached.
+        file_stats = {
+            weather_data_file: weather_data_file.stat()
+            for weather_data_file in files_to_parse
+        } if reading_cache else {}
+
+        for weather_data_file, parsed_file in zip(
+            files_to_parse, cls.parse_files(files_to_parse, workers, build_rollups)
+        ):
+            parsed_files[weather_data_file] = parsed_file
+
+            if reading_cache:
+                reading_cache.store(
+                    weather_data_file,
+                    *parsed_file,
+                    reading_cache.build_file_state(weather_data_file, file_stats[weather_data_file])
+                )
+
+        parsed_weather_files = []
+
+        for weather_data_file in weather_data_files:
+            weather_readings, file_rollups, parsing_warnings = parsed_files[weather_data_file]
+
+            for parsing_warning in parsing_warnings:
+                parser_logger.warning(parsing_warning)
+
+            parsed_weather_files.append((weather_readings, file_rollups))
+
+        return parsed_weather_files
+
+    @staticmethod
+    def get_station_name(weather_file_path, directory):
+        """
+        Return the station a weather file belongs to.
+
+        Files in a subdirectory of the weather directory belong to the station named after
+        the subdirectory. Other files are named by their filename prefix
+        (e.g. Murree_weather_2004_Aug.txt belongs to Murree), and files without one belong
+        to the station named after the weather directory.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            directory (str | Path): The weather directory.
+
+        Returns:
+            str: The station name.
+        """
+        directory = Path(directory)
+
+        if weather_file_path.parent != directory:
+            return weather_file_path.parent.name
+
+        station_file_name = re.match(STATION_FILE_NAME_PATTERN, weather_file_path.name)
+
+        return station_file_name.group(1) if station_file_name else directory.resolve().name
+
+    @classmethod
+    def get_station_names(cls, directory):
+        """
+        List the stations of a weather directory.
+
+        Args:
+            directory (str | Path): Path to the directory containing weather CSV files.
+
+        Returns:
+            list[str]: Sorted names of the stations having at least one weather file.
+        """
+        return sorted({
+            cls.get_station_name(weather_data_file, directory)
+            for weather_data_file in cls.select_weather_files(directory)
+        })
+
+    @classmethod
+    def select_weather_files(cls, directory, period_predicate=None, stations=None):
+        """
+        List the weather files of a directory that may hold readings of the requested periods.
+
+        Files directly in the directory and in its station subdirectories are listed.
+
+        Args:
+            directory (str | Path): Path to the directory containing weather CSV files.
+            period_predicate (ReportPeriodPredicate | None): Requested periods, or None to keep every file.
+            stations (Collection[str] | None): Stations to keep, or None to keep every station.
+
+        Returns:
+            list[Path]: The selected files, sorted by path.
+        """
+        weather_data_files = []
+
+        for directory_entry in sorted(Path(directory).iterdir()):
+            if directory_entry.is_dir():
+                weather_data_files.extend(sorted(
+                    station_entry
+                    for station_entry in directory_entry.iterdir()
+                    if station_entry.is_file()
+                ))
+            else:
+                weather_data_files.append(directory_entry)
+
+        return [
+            weather_data_file
+            for weather_data_file in weather_data_files
+            if (stations is None or cls.get_station_name(weather_data_file, directory) in stations)
+            and (period_predicate is None or cls.file_may_match(weather_data_file, period_predicate))
+        ]
+
+    @classmethod
+    def file_may_match(cls, weather_file_path, period_predicate):
+        """
+        Check, without parsing the whole file, whether a weather file may hold requested readings.
+
+        The period encoded in the filename (e.g. Murree_weather_2004_Aug.txt) is used first.
+        Otherwise the dates of the first and last rows are read; the file is kept whenever
+        its dates cannot be determined.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            period_predicate (ReportPeriodPredicate): Requested periods.
+
+        Returns:
+            bool: False only if the file certainly holds no readings of the requested periods.
+        """
+        file_name_period = re.search(FILE_NAME_PERIOD_PATTERN, weather_file_path.name)
+
+        if file_name_period:
+            file_year = int(file_name_period.group(1))
+            file_month = MONTH_ABBREVIATIONS.get((file_name_period.group(2) or "").lower())
+
+            if file_month:
+                return period_predicate.matches_month(file_year, file_month)
+
+            if not file_name_period.group(2):
+                return period_predicate.matches_year(file_year)
+
+        boundary_dates = cls.read_boundary_dates(weather_file_path)
+
+        if not boundary_dates:
+            return True
+
+        return period_predicate.matches_date_range(*boundary_dates)
+
+    @classmethod
+    def read_boundary_dates(cls, weather_file_path):
+        """
+        Read the dates of the first and the last dated rows of a weather file.
+
+        Only the header, the first rows and the last FILE_BOUNDARY_READ_BYTES bytes are read.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+
+        Returns:
+            tuple[date, date] | None: First and last row dates, or None if either is not found.
+        """
+        with weather_file_path.open("rb") as weather_file:
+            head_lines = weather_file.read(FILE_BOUNDARY_READ_BYTES).decode("utf-8", "ignore").splitlines()
+            weather_file.seek(max(0, weather_file.seek(0, io.SEEK_END) - FILE_BOUNDARY_READ_BYTES))
+            tail_lines = weather_file.read().decode("utf-8", "ignore").splitlines()
+
+        if len(head_lines) < 2:
+            return None
+
+        fieldnames = next(csv.reader(head_lines[:1]))
+        first_date = cls.find_first_row_date(head_lines[1:-1] or head_lines[1:], fieldnames)
+        last_date = cls.find_first_row_date(reversed(tail_lines[1:]), fieldnames)
+
+        if first_date is None or last_date is None:
+            return None
+
+        return first_date, last_date
+
+    @staticmethod
+    def find_first_row_date(weather_file_lines, fieldnames):
+        """
+        Return the first valid date found in a sequence of CSV lines.
+
+        Args:
+            weather_file_lines (Iterable[str]): CSV lines without the header.
+            fieldnames (list[str]): Column names of the lines.
+
+        Returns:
+            date | None: The first date that parses, or None if no line has one.
+        """
+        for weather_file_row in csv.DictReader(weather_file_lines, fieldnames=fieldnames):
+            for date_column in DATE_COLUMNS:
+                try:
+                    return datetime.strptime((weather_file_row.get(date_column) or "").strip(), "%Y-%m-%d").date()
+                except ValueError:
+                    continue
+
+        return None
+
+    @classmethod
+    def parse_appended_rows(
+            cls, weather_file_path, appended_text, cache_entry, cached_weather_readings, build_rollups=False
+    ):
+        """
+        Parse only the rows appended to a weather file since it was cached.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            appended_text (str): The complete lines following the cached byte offset.
+            cache_entry (dict): The file's cache entry, holding the parsed byte offset,
+                line count, header, last seen date and parsing warnings.
+            cached_weather_readings (list[WeatherReading]): Readings already parsed from the file.
+            build_rollups (bool): Whether to return the monthly rollups of all the file's readings.
+
+        Returns:
+            tuple[list[WeatherReading], WeatherRollups | None, list[str]] | None: Readings, rollups
+            and parsing warnings of the whole file, or None if an appended row is not dated after
+            the last seen date, in which case the file has to be parsed again from the start.
+        """
+        appended_weather_readings, parsing_warnings = cls.collect_parsing_warnings(
+            cls.parse_text_to_readings,
+            appended_text,
+            weather_file_path.name,
+            cache_entry["fieldnames"],
+            cache_entry["line_count"]
+        )
+        last_date_ordinal = cache_entry["last_date_ordinal"]
+
+        if last_date_ordinal is not None and any(
+            weather_reading.date_ordinal <= last_date_ordinal
+            for weather_reading in appended_weather_readings
+        ):
+            return None
+
+        file_rollups = cache_entry["rollups"] if build_rollups else None
+
+        if build_rollups:
+            if file_rollups is None:
+                file_rollups = WeatherRollups()
+                appended_weather_readings_to_roll_up = cached_weather_readings + appended_weather_readings
+            else:
+                appended_weather_readings_to_roll_up = appended_weather_readings
+
+            for weather_reading in appended_weather_readings_to_roll_up:
+                file_rollups.add_reading(weather_reading)
+
+        return (
+            cached_weather_readings + appended_weather_readings,
+            file_rollups,
+            cache_entry["parsing_warnings"] + parsing_warnings,
+        )
+
+    @classmethod
+    def parse_files(cls, weather_data_files, workers=DEFAULT_PARSER_WORKERS, build_rollups=False):
+        """
+        Parse weather files one by one, or concurrently when more than one worker is requested.
+
+        Args:
+            weather_data_files (list[Path]): Paths of the CSV files to parse.
+            workers (int): Number of worker processes to parse files with.
+            build_rollups (bool): Whether to build the monthly rollups of each file while parsing it.
+
+        Yields:
+            tuple[list[WeatherReading], WeatherRollups | None, list[str]]: Readings, rollups and
+            parsing warnings of each file, in the order of weather_data_files. The warnings are
+            not logged yet.
+        """
+        if workers > 1 and len(weather_data_files) > 1:
+            yield from cls.parse_files_in_parallel(weather_data_files, workers, build_rollups)
+        else:
+            for weather_data_file in weather_data_files:
+                yield cls.parse_file_with_warnings(weather_data_file, build_rollups)
+
+    @classmethod
+    def parse_files_in_parallel(cls, weather_data_files, workers, build_rollups=False):
+        """
+        Parse weather files concurrently in a process pool.
+
+        Parsing warnings raised in the worker processes are sent back with the readings,
+        so they can be logged file by file in the same order as in the serial path.
+
+        Args:
+            weather_data_files (list[Path]): Paths of the CSV files to parse.
+            workers (int): Maximum number of worker processes.
+            build_rollups (bool): Whether to build the monthly rollups of each file while parsing it.
+
+        Yields:
+            tuple[list[WeatherReading], WeatherRollups | None, list[str]]: Readings, rollups and
+            parsing warnings of each file, in the order of weather_data_files.
+        """
+        files_per_chunk = max(
+            1, len(weather_data_files) // (workers * PARALLEL_FILES_PER_WORKER_CHUNK)
+        )
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(weather_data_files))) as executor:
+            yield from executor.map(
+                cls.parse_file_with_warnings,
+                weather_data_files,
+                repeat(build_rollups),
+                chunksize=files_per_chunk
+            )
+
+    @classmethod
+    def parse_file_with_warnings(cls, weather_file_path, build_rollups=False):
+        """
+        Parse a single CSV file, collecting its parsing warnings instead of logging them.
+
+        Args:
+            weather_file_path (Path): Path to the CSV file to parse.
+            build_rollups (bool): Whether to build the file's monthly rollups while parsing it.
+
+        Returns:
+            tuple[list[WeatherReading], WeatherRollups | None, list[str]]: Parsed readings, their
+            rollups and the messages of the warnings produced while parsing them.
+        """
+        (weather_readings, file_rollups), parsing_warnings = cls.collect_parsing_warnings(
+            cls.parse_file_with_rollups,
+            weather_file_path,
+            build_rollups
+        )
+
+        return weather_readings, file_rollups, parsing_warnings
+
+    @staticmethod
+    def collect_parsing_warnings(parse_function, *parse_args):
+        """
+        Call a parse function while holding back the parsing warnings it logs.
+
+        Only the warnings of the parser logger logged in the current context are held back,
+        so other threads, e.g. a report server's event loop, keep logging as usual.
+
+        Args:
+            parse_function (Callable): The parse function to call.
+            *parse_args: Arguments passed to parse_function.
+
+        Returns:
+            tuple[Any, list[str]]: The function's result and the messages of the warnings it
+            produced, to be logged later through the parser logger.
+        """
+        parsing_warnings = []
+        collecting_token = collected_parsing_warnings.set(parsing_warnings)
+
+        try:
+            parse_result = parse_function(*parse_args)
+        finally:
+            collected_parsing_warnings.reset(collecting_token)
+
+        return parse_result, parsing_warnings
+
+    @classmethod
+    def parse_file_with_rollups(cls, weather_file_path, build_rollups=False):
+        """
+        Parse a single CSV file, optionally building its monthly rollups in the same pass.
+
+        Args:
+            weather_file_path (Path): Path to the CSV file to parse.
+            build_rollups (bool): Whether to build the file's monthly rollups.
+
+        Returns:
+            tuple[list[WeatherReading], WeatherRollups | None]: Parsed readings and their rollups,
+            or None instead of the rollups when build_rollups is False.
+        """
+        file_rollups = WeatherRollups() if build_rollups else None
+
+        return cls.parse_file_to_readings(weather_file_path, file_rollups), file_rollups
+
+    @classmethod
+    def parse_file_to_readings(cls, weather_file_path, weather_rollups=None):
         """
         Parse a single CSV file into WeatherReading objects.
 
         Args:
             weather_file_path (str | Path): Path to the CSV file to parse.
+            weather_rollups (WeatherRollups | None): Rollups to add every parsed reading to.
 
         Returns:
             list[WeatherReading]: A list of WeatherReading objects parsed from the file.
         """
         weather_readings = []
 
+        for weather_reading in cls.iter_file_readings(weather_file_path):
+            weather_readings.append(weather_reading)
+
+            if weather_rollups is not None:
+                weather_rollups.add_reading(weather_reading)
+
+        return weather_readings
+
+    @classmethod
+    def iter_file_readings(cls, weather_file_path):
+        """
+        Lazily parse a single CSV file, yielding one WeatherReading per valid row.
+
+        Args:
+            weather_file_path (Path): Path to the CSV file to parse.
+
+        Yields:
+            WeatherReading: Readings in file row order.
+        """
         with weather_file_path.open("r", encoding="utf-8") as weather_file:
             weather_file_rows = csv.DictReader(weather_file)
 
@@ -92,7 +651,54 @@ class WeatherDataParser:
                 )
 
                 if weather_reading:
-                    weather_readings.append(weather_reading)
+                    yield weather_reading
+
+    @classmethod
+    def iter_directory_readings(cls, directory, period_predicate=None, stations=None):
+        """
+        Lazily parse all CSV files in a directory, in sorted filename order.
+
+        Only the row being parsed is held in memory, so callers can aggregate an archive
+        of any size as long as they do not keep every reading.
+
+        Args:
+            directory (str): Path to the directory containing weather CSV files.
+            period_predicate (ReportPeriodPredicate | None): Requested periods; files that
+                cannot hold readings of these periods are skipped.
+            stations (Collection[str] | None): Stations whose files are read, or None for all.
+
+        Yields:
+            WeatherReading: Readings of all files, in the same order as parse_directory_to_readings.
+        """
+        for weather_data_file in cls.select_weather_files(directory, period_predicate, stations):
+            yield from cls.iter_file_readings(weather_data_file)
+
+    @classmethod
+    def parse_text_to_readings(cls, weather_text, weather_file_name, fieldnames, first_line_num=0):
+        """
+        Parse CSV rows without a header line into WeatherReading objects.
+
+        Args:
+            weather_text (str): CSV rows to parse.
+            weather_file_name (str): Name of the file the rows come from.
+            fieldnames (list[str]): Column names of the rows.
+            first_line_num (int): Number of file lines before the first row, used for row numbers.
+
+        Returns:
+            list[WeatherReading]: A list of WeatherReading objects parsed from the rows.
+        """
+        weather_readings = []
+        weather_file_rows = csv.DictReader(io.StringIO(weather_text), fieldnames=fieldnames)
+
+        for weather_file_row in weather_file_rows:
+            weather_reading = cls.parse_row_to_reading(
+                weather_file_row,
+                weather_file_name,
+                first_line_num + weather_file_rows.line_num
+            )
+
+            if weather_reading:
+                weather_readings.append(weather_reading)
 
         return weather_readings
 
@@ -129,11 +735,15 @@ class WeatherDataParser:
                 ))
                 numeric_values[weather_field_identifier] = numeric_value
 
-            return WeatherReading(
+            return cls.build_reading(
                 date,
-                numeric_values["MAX_TEMPERATURE"],
-                numeric_values["MIN_TEMPERATURE"],
-                numeric_values["MEAN_HUMIDITY"]
+                [
+                    numeric_values["MAX_TEMPERATURE"],
+                    numeric_values["MIN_TEMPERATURE"],
+                    numeric_values["MEAN_HUMIDITY"],
+                ],
+                weather_file_name,
+                weather_file_row_num
             )
         except (ValueError, TypeError) as date_parse_error:
             cls.log_parsing_warning(
@@ -144,6 +754,437 @@ class WeatherDataParser:
         )
 
 
+class FastWeatherDataParser(WeatherDataParser):
+    """
+    WeatherDataParser with a fast row parser.
+
+    Column positions are resolved once from each file's header, rows are read with
+    csv.reader instead of csv.DictReader, dates in the YYYY-M-D layout are split into
+    integers instead of going through datetime.strptime, and blank numeric cells are
+    converted without raising exceptions. Rows the fast path cannot handle are handed
+    to WeatherDataParser.parse_row_to_reading, so the readings and warnings are the same.
+    """
+    @staticmethod
+    def build_row_dict(fieldnames, weather_file_fields):
+        """
+        Build the dictionary csv.DictReader would return for a row.
+
+        Args:
+            fieldnames (list[str]): Column names from the file header.
+            weather_file_fields (list[str]): Values of the row.
+
+        Returns:
+            dict: The row as csv.DictReader represents it.
+        """
+        weather_file_row = dict(zip(fieldnames, weather_file_fields))
+
+        if len(fieldnames) < len(weather_file_fields):
+            weather_file_row[None] = weather_file_fields[len(fieldnames):]
+        else:
+            for missing_fieldname in fieldnames[len(weather_file_fields):]:
+                weather_file_row[missing_fieldname] = None
+
+        return weather_file_row
+
+    @staticmethod
+    def parse_date_fields(date_str_from_csv):
+        """
+        Parse a YYYY-M-D date by splitting it into integers.
+
+        Args:
+            date_str_from_csv (str): Stripped date value from the CSV row.
+
+        Returns:
+            date | None: The date, or None if the value is not a plain valid YYYY-M-D date.
+        """
+        date_parts = date_str_from_csv.split("-")
+
+        if len(date_parts) != 3 or not date_str_from_csv.isascii():
+            return None
+
+        year_part, month_part, day_part = date_parts
+
+        if not (
+            len(year_part) == 4 and 1 <= len(month_part) <= 2 and 1 <= len(day_part) <= 2
+            and year_part.isdigit() and month_part.isdigit() and day_part.isdigit()
+        ):
+            return None
+
+        try:
+            return date(int(year_part), int(month_part), int(day_part))
+        except ValueError:
+            return None
+
+    @classmethod
+    def parse_numeric_field(cls, raw_value):
+        """
+        Convert a numeric cell to an integer, without raising for blank cells.
+
+        Args:
+            raw_value (str | None): The cell value.
+
+        Returns:
+            int | None: Converted integer, or None if the cell is blank or not an integer.
+        """
+        if not raw_value:
+            return None
+
+        digits = raw_value[1:] if raw_value[0] == "-" else raw_value
+
+        if digits.isascii() and digits.isdigit():
+            return int(raw_value)
+
+        return cls.parse_value_to_int(raw_value)
+
+    @staticmethod
+    def resolve_column_indices(fieldnames):
+        """
+        Find the positions of the date and numeric columns in a file header.
+
+        When a column name appears more than once the last one is used, as csv.DictReader does.
+
+        Args:
+            fieldnames (list[str]): Column names from the file header.
+
+        Returns:
+            tuple[list[int], list[int | None]]: Positions of the DATE_COLUMNS present in the
+            header, and the position of every NUMERIC_FIELDS column (None if absent).
+        """
+        column_indices = {fieldname: column_index for column_index, fieldname in enumerate(fieldnames)}
+        date_column_indices = [
+            column_indices[date_column]
+            for date_column in DATE_COLUMNS
+            if date_column in column_indices
+        ]
+        numeric_column_indices = [
+            column_indices.get(weather_field_label)
+            for weather_field_label in NUMERIC_FIELDS.values()
+        ]
+
+        return date_column_indices, numeric_column_indices
+
+    @classmethod
+    def parse_fields_to_reading(
+            cls, weather_file_fields, fieldnames, column_indices, weather_file_name, weather_file_row_num
+    ):
+        """
+        Parse the values of a CSV row into a WeatherReading using column positions.
+
+        Args:
+            weather_file_fields (list[str]): Values of the row.
+            fieldnames (list[str]): Column names from the file header.
+            column_indices (tuple[list[int], list[int | None]]): Result of resolve_column_indices.
+            weather_file_name (str): Name of the file being parsed.
+            weather_file_row_num (int): The row number in the CSV file.
+
+        Returns:
+            WeatherReading | None: The reading, or None if the row is invalid.
+        """
+        date_column_indices, numeric_column_indices = column_indices
+        fields_count = len(weather_file_fields)
+        date_str_from_csv = None
+
+        for date_column_index in date_column_indices:
+            if date_column_index >= fields_count:
+                date_str_from_csv = None
+                break
+
+            if date_column_value := weather_file_fields[date_column_index].strip():
+                date_str_from_csv = date_column_value
+                break
+
+        reading_date = date_str_from_csv and cls.parse_date_fields(date_str_from_csv)
+
+        if not reading_date:
+            return cls.parse_row_to_reading(
+                cls.build_row_dict(fieldnames, weather_file_fields),
+                weather_file_name,
+                weather_file_row_num
+            )
+
+        return cls.build_reading(
+            reading_date,
+            [
+                cls.parse_numeric_field(weather_file_fields[column_index])
+                if column_index is not None and column_index < fields_count else None
+                for column_index in numeric_column_indices
+            ],
+            weather_file_name,
+            weather_file_row_num
+        )
+
+    @classmethod
+    def iter_row_readings(cls, weather_file_rows, fieldnames, weather_file_name, first_line_num=0):
+        """
+        Parse rows from a csv.reader into WeatherReading objects using column positions.
+
+        Args:
+            weather_file_rows (csv.reader): Reader positioned after the header.
+            fieldnames (list[str]): Column names from the file header.
+            weather_file_name (str): Name of the file being parsed.
+            first_line_num (int): Number of file lines before the reader's first line.
+
+        Yields:
+            WeatherReading: Readings of the valid rows, in row order.
+        """
+        column_indices = cls.resolve_column_indices(fieldnames)
+
+        for weather_file_fields in weather_file_rows:
+            if not weather_file_fields:
+                continue
+
+            weather_reading = cls.parse_fields_to_reading(
+                weather_file_fields,
+                fieldnames,
+                column_indices,
+                weather_file_name,
+                first_line_num + weather_file_rows.line_num
+            )
+
+            if weather_reading:
+                yield weather_reading
+
+    @classmethod
+    def iter_file_readings(cls, weather_file_path):
+        """
+        Lazily parse a single CSV file with the fast row parser.
+
+        Args:
+            weather_file_path (Path): Path to the CSV file to parse.
+
+        Yields:
+            WeatherReading: Readings in file row order.
+        """
+        with weather_file_path.open("r", encoding="utf-8") as weather_file:
+            weather_file_rows = csv.reader(weather_file)
+            fieldnames = next(weather_file_rows, None)
+
+            if fieldnames is not None:
+                yield from cls.iter_row_readings(weather_file_rows, fieldnames, weather_file_path.name)
+
+    @classmethod
+    def parse_text_to_readings(cls, weather_text, weather_file_name, fieldnames, first_line_num=0):
+        """
+        Parse CSV rows without a header line with the fast row parser.
+
+        Args:
+            weather_text (str): CSV rows to parse.
+            weather_file_name (str): Name of the file the rows come from.
+            fieldnames (list[str]): Column names of the rows.
+            first_line_num (int): Number of file lines before the first row, used for row numbers.
+
+        Returns:
+            list[WeatherReading]: A list of WeatherReading objects parsed from the rows.
+        """
+        return list(cls.iter_row_readings(
+            csv.reader(io.StringIO(weather_text)),
+            fieldnames,
+            weather_file_name,
+            first_line_num
+        ))
+
+
+class MmapWeatherDataParser(FastWeatherDataParser):
+    """
+    FastWeatherDataParser that reads each file through a memory map.
+
+    Row and field boundaries are found on the raw bytes of the map, and only the date
+    and NUMERIC_FIELDS columns are sliced out and converted; the other columns are
+    never decoded into strings. Files containing quotes or bare carriage returns, which
+    need full CSV handling, and rows the byte path cannot handle are parsed with the
+    FastWeatherDataParser logic, so readings and warnings stay the same.
+    """
+    @staticmethod
+    def parse_date_bytes(date_bytes):
+        """
+        Parse a YYYY-M-D date from raw bytes.
+
+        Args:
+            date_bytes (bytes): Stripped date field.
+
+        Returns:
+            date | None: The date, or None if the value is not a plain valid YYYY-M-D date.
+        """
+        date_parts = date_bytes.split(b"-")
+
+        if len(date_parts) != 3:
+            return None
+
+        year_part, month_part, day_part = date_parts
+
+        if not (
+            len(year_part) == 4 and 1 <= len(month_part) <= 2 and 1 <= len(day_part) <= 2
+            and year_part.isdigit() and month_part.isdigit() and day_part.isdigit()
+        ):
+            return None
+
+        try:
+            return date(int(year_part), int(month_part), int(day_part))
+        except ValueError:
+            return None
+
+    @classmethod
+    def parse_numeric_bytes(cls, raw_value):
+        """
+        Convert a numeric field from raw bytes to an integer.
+
+        Args:
+            raw_value (bytes): The field bytes.
+
+        Returns:
+            int | None: Converted integer, or None if the field is blank or not an integer.
+        """
+        if not raw_value:
+            return None
+
+        digits = raw_value[1:] if raw_value[:1] == b"-" else raw_value
+
+        if digits.isdigit():
+            return int(raw_value)
+
+        return cls.parse_value_to_int(raw_value.decode("utf-8"))
+
+    @staticmethod
+    def slice_fields(weather_file_map, line_start, line_end, wanted_column_indices, last_wanted_column_index):
+        """
+        Slice the wanted fields of one line out of a memory map.
+
+        Args:
+            weather_file_map (mmap.mmap): The mapped file.
+            line_start (int): Offset of the first byte of the line.
+            line_end (int): Offset just after the last byte of the line, without the line break.
+            wanted_column_indices (set[int]): Positions of the fields to slice.
+            last_wanted_column_index (int): Highest position in wanted_column_indices.
+
+        Returns:
+            dict[int, bytes] | None: Field bytes by position, or None if the line is too
+            short to hold every wanted field.
+        """
+        wanted_fields = {}
+        field_start = line_start
+
+        for column_index in range(last_wanted_column_index + 1):
+            field_end = weather_file_map.find(b",", field_start, line_end)
+
+            if field_end == -1:
+                if column_index < last_wanted_column_index:
+                    return None
+
+                field_end = line_end
+
+            if column_index in wanted_column_indices:
+                wanted_fields[column_index] = weather_file_map[field_start:field_end]
+
+            field_start = field_end + 1
+
+        return wanted_fields
+
+    @classmethod
+    def iter_file_readings(cls, weather_file_path):
+        """
+        Lazily parse a single CSV file from a memory map.
+
+        Args:
+            weather_file_path (Path): Path to the CSV file to parse.
+
+        Yields:
+            WeatherReading: Readings in file row order.
+        """
+        with weather_file_path.open("rb") as weather_file:
+            if not os.fstat(weather_file.fileno()).st_size:
+                return
+
+            with mmap.mmap(weather_file.fileno(), 0, access=mmap.ACCESS_READ) as weather_file_map:
+                if re.search(rb'"|\r(?!\n)', weather_file_map):
+                    yield from super().iter_file_readings(weather_file_path)
+                    return
+
+                yield from cls.iter_mapped_readings(weather_file_map, weather_file_path.name)
+
+    @classmethod
+    def iter_mapped_readings(cls, weather_file_map, weather_file_name):
+        """
+        Parse the rows of a memory-mapped CSV file without quotes or bare carriage returns.
+
+        Args:
+            weather_file_map (mmap.mmap): The mapped file.
+            weather_file_name (str): Name of the file being parsed.
+
+        Yields:
+            WeatherReading: Readings in file row order.
+        """
+        file_size = len(weather_file_map)
+        header_end = weather_file_map.find(b"\n")
+        header_end = file_size if header_end == -1 else header_end
+        header_line = weather_file_map[:header_end].rstrip(b"\r").decode("utf-8")
+        fieldnames = next(csv.reader([header_line]), [])
+
+        column_indices = cls.resolve_column_indices(fieldnames)
+        date_column_indices, numeric_column_indices = column_indices
+        wanted_column_indices = set(date_column_indices) | {
+            column_index
+            for column_index in numeric_column_indices
+            if column_index is not None
+        }
+        last_wanted_column_index = max(wanted_column_indices, default=0)
+
+        line_start = header_end + 1
+        weather_file_row_num = 1
+
+        while line_start < file_size:
+            line_end = weather_file_map.find(b"\n", line_start)
+            next_line_start = file_size if line_end == -1 else line_end + 1
+            line_end = file_size if line_end == -1 else line_end
+            weather_file_row_num += 1
+
+            if line_end > line_start and weather_file_map[line_end - 1] == 0x0D:
+                line_end -= 1
+
+            weather_reading = None
+
+            if line_end > line_start:
+                wanted_fields = cls.slice_fields(
+                    weather_file_map, line_start, line_end, wanted_column_indices, last_wanted_column_index
+                )
+                reading_date = None
+
+                if wanted_fields is not None:
+                    date_bytes = next(
+                        (
+                            date_column_value
+                            for date_column_index in date_column_indices
+                            if (date_column_value := wanted_fields[date_column_index].strip())
+                        ),
+                        None
+                    )
+                    reading_date = date_bytes and cls.parse_date_bytes(date_bytes)
+
+                if reading_date:
+                    weather_reading = cls.build_reading(
+                        reading_date,
+                        [
+                            cls.parse_numeric_bytes(wanted_fields[column_index])
+                            if column_index is not None else None
+                            for column_index in numeric_column_indices
+                        ],
+                        weather_file_name,
+                        weather_file_row_num
+                    )
+                else:
+                    weather_reading = cls.parse_fields_to_reading(
+                        next(csv.reader([weather_file_map[line_start:line_end].decode("utf-8")])),
+                        fieldnames,
+                        column_indices,
+                        weather_file_name,
+                        weather_file_row_num
+                    )
+
+            if weather_reading:
+                yield weather_reading
+
+            line_start = next_line_start
+
+
 class InputDateParser:
     @staticmethod
     def parse_and_validate_year(raw_input_year):
@@ -191,3 +1232,117 @@ class InputDateParser:
             raise ValueError(
                 f"Invalid format for monthly report: {raw_year_and_month}. Please use YEAR/MONTH Format"
             )
+
+    def parse_and_validate_calendar_month(self, raw_year_and_month):
+        """
+        Parse and validate a YEAR/MONTH string whose month must be a calendar month (1-12).
+
+        Args:
+            raw_year_and_month (str): String in the format "YEAR/MONTH".
+
+        Returns:
+            tuple[int, int]: year and month as integers.
+
+        Raises:
+            ValueError: If the input is not in the correct format or the month is not 1-12.
+        """
+        year, month = self.parse_and_validate_year_and_month(raw_year_and_month)
+
+        if not 1 <= month <= 12:
+            raise ValueError(f"Invalid month: {raw_year_and_month}. Please use a MONTH from 1 to 12")
+
+        return year, month
+
+    def parse_and_validate_period(self, raw_period):
+        """
+        Parse and validate a YEAR or YEAR/MONTH period given by user (through CLI arguments).
+
+        Args:
+            raw_period (int | str): A year, or a string in the format "YEAR/MONTH".
+
+        Returns:
+            int | tuple[int, int]: The year, or year and month as integers.
+
+        Raises:
+            ValueError: If the input is not a valid YEAR or YEAR/MONTH, or its month is not 1-12.
+        """
+        if "/" in str(raw_period):
+            return self.parse_and_validate_calendar_month(str(raw_period))
+
+        return self.parse_and_validate_year(raw_period)
+
+    @staticmethod
+    def parse_and_validate_date(raw_date):
+        """
+        Parse and validate a YYYY-MM-DD date given by user (through CLI arguments).
+
+        Args:
+            raw_date (str): Date in the format "YYYY-MM-DD".
+
+        Returns:
+            date: The parsed date.
+
+        Raises:
+            ValueError: If the input is not a valid date or in incorrect format.
+        """
+        try:
+            return datetime.strptime(str(raw_date), DATE_INPUT_FORMAT).date()
+        except ValueError:
+            raise ValueError(f"Invalid format for date: {raw_date}. Please use YYYY-MM-DD Format")
+
+    def parse_and_validate_date_range(self, raw_date_range):
+        """
+        Parse and validate the --from/--to dates given by user (through CLI arguments).
+
+        Args:
+            raw_date_range (tuple[str | None, str | None]): First and last date, both included.
+
+        Returns:
+            tuple[date, date]: First and last date of the range.
+
+        Raises:
+            ValueError: If a date is missing, invalid, or the first date is after the last one.
+        """
+        raw_first_date, raw_last_date = raw_date_range
+
+        if raw_first_date is None or raw_last_date is None:
+            raise ValueError("Invalid date range: both --from and --to dates are required")
+
+        first_date = self.parse_and_validate_date(raw_first_date)
+        last_date = self.parse_and_validate_date(raw_last_date)
+
+        if first_date > last_date:
+            raise ValueError(f"Invalid date range: {raw_first_date} is after {raw_last_date}")
+
+        return first_date, last_date
+
+    @staticmethod
+    def parse_and_validate_window_days(raw_window_days):
+        """
+        Parse and validate the number of days of a rolling window given by user (through CLI arguments).
+
+        Args:
+            raw_window_days (int | str): Window length in days.
+
+        Returns:
+            int: Validated window length.
+
+        Raises:
+            ValueError: If the input is not a positive number of days.
+        """
+        try:
+            window_days = int(raw_window_days)
+
+            if window_days <= 0:
+                raise ValueError
+
+            return window_days
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid rolling window: {raw_window_days}. Please use a positive number of days")
+
+
+WEATHER_DATA_PARSERS = {
+    "csv": WeatherDataParser,
+    "fast": FastWeatherDataParser,
+    "mmap": MmapWeatherDataParser,
+}
@@ -0,0 +1,160 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager
+
+from constants import (
+    PARSER_LOGGER_NAME,
+    PROFILE_STAGES,
+)
+
+
+class StageStatistics:
+    """Wall time, call count and processed rows of one pipeline stage."""
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self.rows = 0
+
+    def add_call(self, seconds, rows=0):
+        """
+        Record one call of the stage.
+
+        Args:
+            seconds (float): Wall time of the call.
+            rows (int): Rows the call processed.
+        """
+        self.seconds += seconds
+        self.calls += 1
+        self.rows += rows
+
+
+class ParsingWarningCounter(logging.Handler):
+    """Logging handler counting the rows rejected by log_parsing_warning."""
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+class StageProfiler:
+    """
+    Per-stage instrumentation of the report pipeline.
+
+    Stage functions are measured either by wrapping the methods of the components
+    WeatherMan calls (instrument), which leaves uninstrumented runs untouched, or with
+    the measure context manager around a block of work. Rows rejected while parsing are
+    counted from the parsing warnings; files loaded from the reading cache log their stored
+    warnings again, so their rejected rows are counted on cache hits too.
+    """
+    def __init__(self):
+        self.stage_statistics = {stage: StageStatistics() for stage in PROFILE_STAGES}
+        self.parsing_warning_counter = ParsingWarningCounter()
+
+    def start(self):
+        """Start counting parsing warnings."""
+        logging.getLogger(PARSER_LOGGER_NAME).addHandler(self.parsing_warning_counter)
+
+    def stop(self):
+        """Stop counting parsing warnings."""
+        logging.getLogger(PARSER_LOGGER_NAME).removeHandler(self.parsing_warning_counter)
+
+    @contextmanager
+    def measure(self, stage):
+        """
+        Measure a block of work as one call of a stage.
+
+        Args:
+            stage (str): Stage name.
+
+        Yields:
+            StageStatistics: The stage's statistics, so the block can add the rows it processed.
+        """
+        stage_statistics = self.stage_statistics[stage]
+        start_time = time.perf_counter()
+
+        try:
+            yield stage_statistics
+        finally:
+            stage_statistics.add_call(time.perf_counter() - start_time)
+
+    def wrap(self, stage, stage_function, count_rows=None):
+        """
+        Wrap a function so every call is recorded as a call of a stage.
+
+        Args:
+            stage (str): Stage name.
+            stage_function (Callable): Function to wrap.
+            count_rows (Callable | None): Returns the number of rows processed from the result.
+
+        Returns:
+            Callable: The measured function.
+        """
+        stage_statistics = self.stage_statistics[stage]
+
+        @functools.wraps(stage_function)
+        def measured_function(*args, **kwargs):
+            start_time = time.perf_counter()
+            stage_result = stage_function(*args, **kwargs)
+            stage_statistics.add_call(
+                time.perf_counter() - start_time,
+                count_rows(stage_result) if count_rows and stage_result else 0
+            )
+
+            return stage_result
+
+        return measured_function
+
+    def instrument(self, component, stage, method_names, count_rows=None):
+        """
+        Replace methods of a component instance with measured versions.
+
+        Args:
+            component (object): Instance whose methods are measured.
+            stage (str): Stage the methods belong to.
+            method_names (Iterable[str]): Names of the methods.
+            count_rows (Callable | None): Returns the number of rows processed from a result.
+        """
+        for method_name in method_names:
+            setattr(component, method_name, self.wrap(stage, getattr(component, method_name), count_rows))
+
+    def count_rows(self, stage, stage_rows):
+        """
+        Count the rows of an iterable as they are consumed.
+
+        Args:
+            stage (str): Stage the rows are added to.
+            stage_rows (Iterable): Rows to count.
+
+        Yields:
+            Any: The rows, unchanged.
+        """
+        stage_statistics = self.stage_statistics[stage]
+
+        for stage_row in stage_rows:
+            stage_statistics.rows += 1
+            yield stage_row
+
+    def format_summary(self):
+        """
+        Format the per-stage statistics as a table.
+
+        Returns:
+            str: One line per stage with calls, rows and wall time, then the totals.
+        """
+        summary_lines = [f"{'Stage':<10} {'Calls':>7} {'Rows':>10} {'Time (ms)':>11}"]
+
+        for stage, stage_statistics in self.stage_statistics.items():
+            summary_lines.append(
+                f"{stage:<10} {stage_statistics.calls:>7} {stage_statistics.rows:>10} "
+                f"{stage_statistics.seconds * 1000:>11.2f}"
+            )
+
+        total_seconds = sum(stage_statistics.seconds for stage_statistics in self.stage_statistics.values())
+
+        summary_lines.append(f"{'total':<10} {'':>7} {'':>10} {total_seconds * 1000:>11.2f}")
+        summary_lines.append(f"Rows rejected while parsing: {self.parsing_warning_counter.count}")
+
+        return "\n".join(summary_lines)
@@ -0,0 +1,172 @@
+import math
+
+from constants import (
+    QUANTILE_SKETCH_CAPACITY,
+    QUANTILE_SKETCH_CAPACITY_DECAY,
+)
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch of the values of one weather attribute.
+
+    Values enter the level 0 compactor. When the sketch holds more values than its
+    levels allow, a full level is sorted and every other value is promoted to the next
+    level with twice the weight, so memory stays O(capacity) however many values are
+    added. Lower levels get geometrically smaller capacities, as in KLL. The promoted
+    half alternates between the even and odd positions instead of being picked at
+    random, so the same values always give the same sketch.
+
+    Until more than `capacity` values are added nothing is compacted and the percentiles
+    are exact. Sketches built from different files, e.g. in worker processes, are
+    combined with merge.
+    """
+    def __init__(self, capacity=QUANTILE_SKETCH_CAPACITY):
+        self.capacity = capacity
+        self.compactors = [[]]
+        self.compaction_offsets = [0]
+        self.max_size = self.get_max_size()
+        self.size = 0
+
+    @classmethod
+    def from_values(cls, attribute_values):
+        """
+        Build an exact sketch holding every given value.
+
+        Args:
+            attribute_values (Collection[int | float]): Values to add.
+
+        Returns:
+            QuantileSketch: Sketch large enough that no value is compacted.
+        """
+        quantile_sketch = cls(max(QUANTILE_SKETCH_CAPACITY, len(attribute_values)))
+
+        for attribute_value in attribute_values:
+            quantile_sketch.add(attribute_value)
+
+        return quantile_sketch
+
+    def get_level_capacity(self, level):
+        """
+        Return how many values a level may hold before it is compacted.
+
+        Args:
+            level (int): Compactor level, 0 being the one new values enter.
+
+        Returns:
+            int: Capacity of the level; the top level holds `capacity` values.
+        """
+        depth = len(self.compactors) - level - 1
+
+        return int(math.ceil(QUANTILE_SKETCH_CAPACITY_DECAY ** depth * self.capacity)) + 1
+
+    def get_max_size(self):
+        """
+        Return how many values the sketch may hold before it is compressed.
+
+        Returns:
+            int: The sum of the level capacities.
+        """
+        return sum(self.get_level_capacity(level) for level in range(len(self.compactors)))
+
+    def is_exact(self):
+        """
+        Check whether no value has been compacted yet.
+
+        Returns:
+            bool: True if the quantiles are exact.
+        """
+        return len(self.compactors) == 1
+
+    def add(self, attribute_value):
+        """
+        Add a value to the sketch.
+
+        Args:
+            attribute_value (int | float): A present, non-zero attribute value.
+        """
+        self.compactors[0].append(attribute_value)
+        self.size += 1
+
+        if self.size >= self.max_size:
+            self.compress()
+
+    def merge(self, other_sketch):
+        """
+        Merge the values of another sketch into this one, leaving the other sketch unchanged.
+
+        Args:
+            other_sketch (QuantileSketch): Sketch to merge.
+        """
+        while len(self.compactors) < len(other_sketch.compactors):
+            self.add_level()
+
+        for level, other_compactor in enumerate(other_sketch.compactors):
+            self.compactors[level].extend(other_compactor)
+
+        self.size += other_sketch.size
+
+        while self.size >= self.max_size:
+            self.compress()
+
+    def add_level(self):
+        """Add an empty top level, raising the capacity of the levels below it."""
+        self.compactors.append([])
+        self.compaction_offsets.append(0)
+        self.max_size = self.get_max_size()
+
+    def compress(self):
+        """Compact the lowest level that reached its capacity into the level above it."""
+        for level, compactor in enumerate(self.compactors):
+            if len(compactor) >= self.get_level_capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.add_level()
+
+                compactor.sort()
+                compacted_length = len(compactor) - len(compactor) % 2
+                offset = self.compaction_offsets[level]
+
+                self.compactors[level + 1].extend(compactor[offset:compacted_length:2])
+                self.compactors[level] = compactor[compacted_length:]
+                self.compaction_offsets[level] = 1 - offset
+                self.size = sum(len(level_compactor) for level_compactor in self.compactors)
+
+                return
+
+    def get_percentiles(self, percentiles):
+        """
+        Return nearest-rank percentiles of the sketched values.
+
+        The p-th percentile is the smallest value whose cumulative weight reaches p% of
+        the total weight, so every percentile is one of the added values.
+
+        Args:
+            percentiles (Iterable[int]): Percentiles between 0 and 100 (e.g., 50 for the median).
+
+        Returns:
+            list[int | float] | None: One value per percentile, or None if the sketch is empty.
+        """
+        weighted_values = sorted(
+            (attribute_value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for attribute_value in compactor
+        )
+
+        if not weighted_values:
+            return None
+
+        total_weight = sum(value_weight for _, value_weight in weighted_values)
+        percentile_values = []
+
+        for percentile in percentiles:
+            target_weight = max(1, -(-percentile * total_weight // 100))
+            cumulative_weight = 0
+
+            for attribute_value, value_weight in weighted_values:
+                cumulative_weight += value_weight
+
+                if cumulative_weight >= target_weight:
+                    percentile_values.append(attribute_value)
+                    break
+
+        return percentile_values
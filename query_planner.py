@@ -0,0 +1,326 @@
+from datetime import date
+
+from constants import (
+    ANOMALY_REPORT,
+    CHART_REPORT,
+    CLIMATOLOGY_REPORT,
+    HORIZONTAL_CHART_REPORT,
+    MONTHLY_REPORT,
+    QUANTILE_REPORT,
+    RANGE_REPORT,
+    ROLLING_REPORT,
+    YEARLY_REPORT,
+)
+from parser import InputDateParser
+from report_periods import ReportPeriodPredicate
+from streaming import StreamingWeatherReports
+
+
+class ReportQuery:
+    """A single requested report: its type, the raw CLI argument and the parsed period or error."""
+    def __init__(self, report_type, raw_period, period=None, error=None):
+        self.report_type = report_type
+        self.raw_period = raw_period
+        self.period = period
+        self.error = error
+
+
+class ReportQueryPlanner:
+    """
+    Collects every requested report up front and plans the data they need.
+
+    Reports are kept in the order they are printed (yearly, monthly, vertical charts,
+    horizontal charts, anomalies, quantiles, each in argument order, then the climatology, the
+    date range report and its rolling windows), and their periods are grouped into
+    the (year, month) buckets the reports read.
+    """
+    def __init__(self, date_parser=None):
+        self.date_parser = date_parser or InputDateParser()
+
+    def plan(
+            self, yearly=None, monthly=None, charts=None, horizontal_charts=None, date_range=(None, None),
+            rolling_windows=None, climatology=False, anomalies=None, quantiles=None
+    ):
+        """
+        Parse the requested periods into report queries.
+
+        Args:
+            yearly (list[int] | None): Requested YEAR arguments.
+            monthly (list[str] | None): Requested YEAR/MONTH arguments for monthly averages.
+            charts (list[str] | None): Requested YEAR/MONTH arguments for vertical charts.
+            horizontal_charts (list[str] | None): Requested YEAR/MONTH arguments for horizontal charts.
+            date_range (tuple[str | None, str | None]): Requested --from and --to dates.
+            rolling_windows (list[int] | None): Requested moving average windows, in days.
+            climatology (bool): Whether the per-calendar-month climatology is requested.
+            anomalies (list[str] | None): Requested YEAR/MONTH arguments compared with their climatology.
+            quantiles (list[str] | None): Requested YEAR or YEAR/MONTH arguments for percentile reports.
+
+        Returns:
+            list[ReportQuery]: One query per argument, in printing order. Invalid arguments
+            get the error message to print in place of their report.
+        """
+        requested_reports = [
+            (YEARLY_REPORT, yearly, self.date_parser.parse_and_validate_year),
+            (MONTHLY_REPORT, monthly, self.date_parser.parse_and_validate_year_and_month),
+            (CHART_REPORT, charts, self.date_parser.parse_and_validate_year_and_month),
+            (HORIZONTAL_CHART_REPORT, horizontal_charts, self.date_parser.parse_and_validate_year_and_month),
+            (ANOMALY_REPORT, anomalies, self.date_parser.parse_and_validate_calendar_month),
+            (QUANTILE_REPORT, quantiles, self.date_parser.parse_and_validate_period),
+        ]
+        report_queries = []
+
+        for report_type, raw_periods, parse_period in requested_reports:
+            for raw_period in raw_periods or []:
+                try:
+                    report_queries.append(ReportQuery(report_type, raw_period, period=parse_period(raw_period)))
+                except ValueError as date_input_error:
+                    report_queries.append(ReportQuery(report_type, raw_period, error=date_input_error))
+
+        if climatology:
+            report_queries.append(ReportQuery(CLIMATOLOGY_REPORT, None))
+
+        if date_range != (None, None) or rolling_windows:
+            report_queries.extend(self.plan_date_range(date_range, rolling_windows))
+
+        return report_queries
+
+    def plan_date_range(self, date_range, rolling_windows=None):
+        """
+        Parse a date range and its rolling windows into report queries.
+
+        Args:
+            date_range (tuple[str | None, str | None]): Requested --from and --to dates.
+            rolling_windows (list[int] | None): Requested moving average windows, in days.
+
+        Returns:
+            list[ReportQuery]: The range query followed by one query per window. An invalid
+            range gives a single query holding its error.
+        """
+        try:
+            first_date, last_date = self.date_parser.parse_and_validate_date_range(date_range)
+        except ValueError as date_input_error:
+            return [ReportQuery(RANGE_REPORT, date_range, error=date_input_error)]
+
+        report_queries = [ReportQuery(RANGE_REPORT, date_range, period=(first_date, last_date))]
+
+        for raw_window_days in rolling_windows or []:
+            try:
+                window_days = self.date_parser.parse_and_validate_window_days(raw_window_days)
+                report_queries.append(
+                    ReportQuery(ROLLING_REPORT, raw_window_days, period=(first_date, last_date, window_days))
+                )
+            except ValueError as window_input_error:
+                report_queries.append(ReportQuery(ROLLING_REPORT, raw_window_days, error=window_input_error))
+
+        return report_queries
+
+    @staticmethod
+    def get_query_months(report_query):
+        """
+        Return the (year, month) buckets a valid query reads.
+
+        Rolling windows also read the days before the range that their first windows reach back to.
+
+        Args:
+            report_query (ReportQuery): A query without an error.
+
+        Returns:
+            list[tuple[int, int]]: The months, in ascending order.
+        """
+        if isinstance(report_query.period, int):
+            return [(report_query.period, month) for month in range(1, 13)]
+
+        if report_query.report_type == CLIMATOLOGY_REPORT:
+            return []
+
+        if report_query.report_type not in (RANGE_REPORT, ROLLING_REPORT):
+            return [report_query.period]
+
+        first_date, last_date = report_query.period[:2]
+
+        if report_query.report_type == ROLLING_REPORT:
+            first_date = date.fromordinal(max(1, first_date.toordinal() - report_query.period[2] + 1))
+
+        query_months = []
+        year, month = first_date.year, first_date.month
+
+        while (year, month) <= (last_date.year, last_date.month):
+            query_months.append((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return query_months
+
+    def get_date_range_months(self, report_queries):
+        """
+        Return the distinct months read by the date range and rolling window queries.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            list[tuple[int, int]]: Months in first-requested order.
+        """
+        return list(dict.fromkeys(
+            query_month
+            for report_query in report_queries
+            if report_query.error is None and report_query.report_type in (RANGE_REPORT, ROLLING_REPORT)
+            for query_month in self.get_query_months(report_query)
+        ))
+
+    def get_quantile_months(self, report_queries):
+        """
+        Return the distinct months read by the quantile queries.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            list[tuple[int, int]]: Months of requested quantile years and months, in first-requested order.
+        """
+        return list(dict.fromkeys(
+            query_month
+            for report_query in report_queries
+            if report_query.error is None and report_query.report_type == QUANTILE_REPORT
+            for query_month in self.get_query_months(report_query)
+        ))
+
+    @staticmethod
+    def get_periods(report_queries, report_types):
+        """
+        Return the distinct valid periods of the queries of some report types.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+            report_types (Iterable[str]): Report types to include.
+
+        Returns:
+            list[int | tuple[int, int]]: Periods in first-requested order.
+        """
+        return list(dict.fromkeys(
+            report_query.period
+            for report_query in report_queries
+            if report_query.error is None and report_query.report_type in report_types
+        ))
+
+    def get_rollup_years(self, report_queries):
+        """
+        Return the distinct years whose rollups the queries read.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            list[int]: Years of yearly reports and of yearly quantiles, in first-requested order.
+        """
+        return [
+            report_period
+            for report_period in self.get_periods(report_queries, [YEARLY_REPORT, QUANTILE_REPORT])
+            if isinstance(report_period, int)
+        ]
+
+    def get_rollup_months(self, report_queries):
+        """
+        Return the distinct months whose rollups the queries read.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            list[tuple[int, int]]: Months of monthly reports and of monthly quantiles, in first-requested order.
+        """
+        return [
+            report_period
+            for report_period in self.get_periods(report_queries, [MONTHLY_REPORT, QUANTILE_REPORT])
+            if not isinstance(report_period, int)
+        ]
+
+    @staticmethod
+    def needs_every_month(report_queries):
+        """
+        Check whether a query compares a month with every year, so all months must be read.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            bool: True if a valid climatology or anomaly query is planned.
+        """
+        return any(
+            report_query.error is None and report_query.report_type in (CLIMATOLOGY_REPORT, ANOMALY_REPORT)
+            for report_query in report_queries
+        )
+
+    def get_period_predicate(self, report_queries):
+        """
+        Build the predicate of the periods the queries need, for skipping weather files.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            ReportPeriodPredicate | None: The requested years and months, or None when
+            every weather file is needed.
+        """
+        if self.needs_every_month(report_queries):
+            return None
+
+        return ReportPeriodPredicate(
+            self.get_rollup_years(report_queries),
+            self.get_rollup_months(report_queries)
+            + self.get_periods(report_queries, [CHART_REPORT, HORIZONTAL_CHART_REPORT])
+            + self.get_date_range_months(report_queries)
+        )
+
+    def get_month_buckets(self, report_queries):
+        """
+        Group the queries by the (year, month) buckets they read.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+
+        Returns:
+            dict[tuple[int, int], set[str]]: Report types that need each bucket.
+        """
+        month_buckets = {}
+
+        for report_query in report_queries:
+            if report_query.error is not None:
+                continue
+
+            for query_month in self.get_query_months(report_query):
+                month_buckets.setdefault(query_month, set()).add(report_query.report_type)
+
+        return month_buckets
+
+    def execute(self, report_queries, weather_index):
+        """
+        Compute the rollups of every planned report in a single traversal of the needed buckets.
+
+        Each (year, month) bucket is read from the index once, however many reports need it.
+
+        Args:
+            report_queries (list[ReportQuery]): Planned queries.
+            weather_index (WeatherReadingIndex): Indexed readings.
+
+        Returns:
+            WeatherRollups: Rollups of the months of requested years and of requested months,
+            or of every month when a climatology or anomaly is requested.
+        """
+        needs_every_month = self.needs_every_month(report_queries)
+        batch_reports = StreamingWeatherReports(
+            self.get_rollup_years(report_queries),
+            self.get_rollup_months(report_queries),
+            [],
+            all_months=needs_every_month
+        )
+        month_buckets = self.get_month_buckets(report_queries)
+
+        if needs_every_month:
+            for month_bucket in weather_index.month_buckets:
+                month_buckets.setdefault(month_bucket, set()).add(CLIMATOLOGY_REPORT)
+
+        for month_bucket, report_types in sorted(month_buckets.items()):
+            if report_types & {YEARLY_REPORT, MONTHLY_REPORT, QUANTILE_REPORT, CLIMATOLOGY_REPORT, ANOMALY_REPORT}:
+                batch_reports.consume(weather_index.get_readings(*month_bucket))
+
+        return batch_reports.weather_rollups
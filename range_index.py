@@ -0,0 +1,290 @@
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+
+from constants import (
+    RANGE_PREFIX_SUM_TYPECODE,
+    READING_DATE_TYPECODE,
+    WEATHER_ATTRIBUTES,
+)
+
+
+class AttributeSegmentTree:
+    """
+    Segment tree over one attribute of date-sorted readings, answering range maximum queries.
+
+    Each node keeps the position of the best valid reading below it. Missing and zero
+    values are skipped, like the truthiness check of the validators, and ties go to the
+    earlier position, i.e. the earlier date. Minimums are answered by a tree built over
+    negated values.
+    """
+    def __init__(self, attribute_values, valid_mask, negate=False):
+        self.leaf_count = len(attribute_values)
+        self.keys = array(attribute_values.typecode, (-value for value in attribute_values)) if negate else (
+            attribute_values
+        )
+        self.nodes = array(READING_DATE_TYPECODE, [-1]) * (2 * self.leaf_count)
+
+        for reading_index, is_valid in enumerate(valid_mask):
+            if is_valid:
+                self.nodes[self.leaf_count + reading_index] = reading_index
+
+        for node_index in range(self.leaf_count - 1, 0, -1):
+            self.nodes[node_index] = self.choose(self.nodes[2 * node_index], self.nodes[2 * node_index + 1])
+
+    def choose(self, first_index, second_index):
+        """
+        Return the position holding the larger key, preferring the earlier one on ties.
+
+        Args:
+            first_index (int): A position, or -1 for none.
+            second_index (int): A position, or -1 for none.
+
+        Returns:
+            int: The chosen position, or -1 if both are -1.
+        """
+        if first_index < 0:
+            return second_index
+
+        if second_index < 0:
+            return first_index
+
+        first_key, second_key = self.keys[first_index], self.keys[second_index]
+
+        if first_key > second_key or (first_key == second_key and first_index < second_index):
+            return first_index
+
+        return second_index
+
+    def query(self, start_index, stop_index):
+        """
+        Return the position of the best valid reading in positions [start_index, stop_index).
+
+        Args:
+            start_index (int): First position of the range.
+            stop_index (int): First position after the range.
+
+        Returns:
+            int: Position of the best reading, or -1 if the range has no valid reading.
+        """
+        best_index = -1
+        start_index += self.leaf_count
+        stop_index += self.leaf_count
+
+        while start_index < stop_index:
+            if start_index & 1:
+                best_index = self.choose(best_index, self.nodes[start_index])
+                start_index += 1
+
+            if stop_index & 1:
+                stop_index -= 1
+                best_index = self.choose(best_index, self.nodes[stop_index])
+
+            start_index //= 2
+            stop_index //= 2
+
+        return best_index
+
+
+class RangeAggregate:
+    """
+    Statistics of the readings in a range of positions of a WeatherRangeIndex.
+
+    Offers the get_max_readings/get_totals interface of WeatherRollup, so range
+    results can be rendered like yearly and monthly reports.
+    """
+    def __init__(self, range_index, start_index, stop_index):
+        self.range_index = range_index
+        self.start_index = start_index
+        self.stop_index = stop_index
+
+    def __bool__(self):
+        return self.stop_index > self.start_index
+
+    def get_totals(self, weather_attribute):
+        """
+        Return the sum and count of the valid values of an attribute in the range.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            tuple[int, int]: Sum and count of the valid values.
+        """
+        return self.range_index.get_totals(weather_attribute, self.start_index, self.stop_index)
+
+    def get_extreme_readings(self, segment_trees):
+        """
+        Return the reading chosen by each attribute's segment tree in the range.
+
+        Args:
+            segment_trees (dict[str, AttributeSegmentTree]): Tree per attribute.
+
+        Returns:
+            dict[str, WeatherReading]: Reading per attribute; attributes without valid values are left out.
+        """
+        extreme_readings = {}
+
+        for weather_attribute, segment_tree in segment_trees.items():
+            reading_index = segment_tree.query(self.start_index, self.stop_index)
+
+            if reading_index >= 0:
+                extreme_readings[weather_attribute] = self.range_index.sorted_readings.get_reading(reading_index)
+
+        return extreme_readings
+
+    def get_max_readings(self):
+        """
+        Return the reading holding the maximum value of each attribute in the range.
+
+        Returns:
+            dict[str, WeatherReading]: Mapping of attribute to its maximum reading.
+        """
+        return self.get_extreme_readings(self.range_index.max_trees)
+
+    def get_min_readings(self):
+        """
+        Return the reading holding the minimum value of each attribute in the range.
+
+        Returns:
+            dict[str, WeatherReading]: Mapping of attribute to its minimum reading.
+        """
+        return self.get_extreme_readings(self.range_index.min_trees)
+
+
+class WeatherRangeIndex:
+    """
+    Interval index over date-sorted weather readings.
+
+    Dates are located by binary search, sums and counts come from prefix-sum arrays
+    and extremes from segment trees, so any date range is answered in O(log n).
+    """
+    def __init__(self, sorted_readings):
+        self.sorted_readings = sorted_readings
+        self.date_ordinals = sorted_readings.date_ordinals
+        self.prefix_totals = {}
+        self.prefix_counts = {}
+        self.max_trees = {}
+        self.min_trees = {}
+
+        for weather_attribute in WEATHER_ATTRIBUTES:
+            attribute_values = sorted_readings.attribute_values[weather_attribute]
+            valid_mask = [
+                bool(attribute_value) and not is_missing
+                for attribute_value, is_missing in zip(
+                    attribute_values, sorted_readings.missing_value_masks[weather_attribute]
+                )
+            ]
+
+            self.prefix_totals[weather_attribute], self.prefix_counts[weather_attribute] = self.build_prefix_sums(
+                attribute_values, valid_mask
+            )
+            self.max_trees[weather_attribute] = AttributeSegmentTree(attribute_values, valid_mask)
+            self.min_trees[weather_attribute] = AttributeSegmentTree(attribute_values, valid_mask, negate=True)
+
+    @staticmethod
+    def build_prefix_sums(attribute_values, valid_mask):
+        """
+        Build the running sums and counts of the valid values of an attribute.
+
+        Args:
+            attribute_values (array): Attribute values in date order.
+            valid_mask (list[bool]): Whether each value is present and non-zero.
+
+        Returns:
+            tuple[array, array]: Prefix sums and prefix counts, both one longer than the values.
+        """
+        prefix_totals = array(RANGE_PREFIX_SUM_TYPECODE, [0])
+        prefix_counts = array(RANGE_PREFIX_SUM_TYPECODE, [0])
+        running_total = running_count = 0
+
+        for attribute_value, is_valid in zip(attribute_values, valid_mask):
+            if is_valid:
+                running_total += attribute_value
+                running_count += 1
+
+            prefix_totals.append(running_total)
+            prefix_counts.append(running_count)
+
+        return prefix_totals, prefix_counts
+
+    def get_position_range(self, first_date_ordinal, last_date_ordinal):
+        """
+        Return the positions of the readings dated within [first_date_ordinal, last_date_ordinal].
+
+        Args:
+            first_date_ordinal (int): First date ordinal to include.
+            last_date_ordinal (int): Last date ordinal to include.
+
+        Returns:
+            tuple[int, int]: The [start, stop) positions.
+        """
+        return (
+            bisect_left(self.date_ordinals, first_date_ordinal),
+            bisect_right(self.date_ordinals, last_date_ordinal),
+        )
+
+    def get_totals(self, weather_attribute, start_index, stop_index):
+        """
+        Return the sum and count of the valid values of an attribute in positions [start, stop).
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+            start_index (int): First position.
+            stop_index (int): First position after the range.
+
+        Returns:
+            tuple[int, int]: Sum and count of the valid values.
+        """
+        prefix_totals = self.prefix_totals[weather_attribute]
+        prefix_counts = self.prefix_counts[weather_attribute]
+
+        return (
+            prefix_totals[stop_index] - prefix_totals[start_index],
+            prefix_counts[stop_index] - prefix_counts[start_index],
+        )
+
+    def get_range_aggregate(self, first_date, last_date):
+        """
+        Return the statistics of the readings dated between two dates, both included.
+
+        Args:
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+
+        Returns:
+            RangeAggregate: Statistics of the range.
+        """
+        return RangeAggregate(self, *self.get_position_range(first_date.toordinal(), last_date.toordinal()))
+
+    def iter_window_totals(self, first_date, last_date, window_days, weather_attribute):
+        """
+        Iterate over the trailing-window totals of an attribute for each reading date in a range.
+
+        Args:
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+            window_days (int): Number of calendar days in each window, ending on the reading date.
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Yields:
+            tuple[int, tuple[int, int]]: Date ordinal, and the sum and count of the valid
+            values dated within the window ending on it.
+        """
+        start_index, stop_index = self.get_position_range(first_date.toordinal(), last_date.toordinal())
+        previous_date_ordinal = None
+
+        for reading_index in range(start_index, stop_index):
+            date_ordinal = self.date_ordinals[reading_index]
+
+            if date_ordinal == previous_date_ordinal:
+                continue
+
+            previous_date_ordinal = date_ordinal
+            window_start_index, window_stop_index = self.get_position_range(
+                date_ordinal - window_days + 1, date_ordinal
+            )
+
+            yield date_ordinal, self.get_totals(weather_attribute, window_start_index, window_stop_index)
@@ -0,0 +1,436 @@
+import csv
+import hashlib
+import pickle
+from pathlib import Path
+
+from constants import (
+    CONTENT_HASH_CHUNK_BYTES,
+    INCREMENTAL_CHECK_BYTES,
+    READING_CACHE_DIRECTORY,
+    READING_CACHE_FORMAT_VERSION,
+)
+from weather_reading import WeatherReading
+
+
+class WeatherReadingCache:
+    """
+    On-disk cache of parsed WeatherReading data, stored as one binary entry per source file.
+
+    The parsing warnings of a file are stored with its readings and logged again when the
+    file is loaded from the cache, so cached runs log the same warnings as uncached ones.
+
+    An entry covers the first byte_offset bytes of its file: the bytes that were actually
+    parsed. Its content hash is chained over the segments added by each incremental update
+    (hash_offsets), so an update hashes only the appended bytes.
+    """
+    def __init__(self, cache_directory=READING_CACHE_DIRECTORY, rebuild=False, incremental=False):
+        self.cache_directory = Path(cache_directory)
+        self.rebuild = rebuild
+        self.incremental = incremental
+        self.hits = 0
+        self.misses = 0
+        self.appends = 0
+
+    @staticmethod
+    def hash_file_segment(weather_file_path, start_offset, stop_offset, previous_hash=""):
+        """
+        Hash a segment of a weather file, chained to the hash of the content before it.
+
+        The segment is read in chunks of CONTENT_HASH_CHUNK_BYTES bytes.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            start_offset (int): Offset of the first byte of the segment.
+            stop_offset (int): Offset just after the last byte of the segment.
+            previous_hash (str): Content hash of the bytes before the segment ("" for none).
+
+        Returns:
+            tuple[str, int]: Hex digest of the previous hash followed by the segment, and the
+            number of line breaks in the segment.
+        """
+        content_hash = hashlib.sha256(previous_hash.encode("ascii"))
+        line_count = 0
+
+        with weather_file_path.open("rb") as weather_file:
+            weather_file.seek(start_offset)
+            remaining_bytes = stop_offset - start_offset
+
+            while remaining_bytes > 0:
+                content_chunk = weather_file.read(min(CONTENT_HASH_CHUNK_BYTES, remaining_bytes))
+
+                if not content_chunk:
+                    break
+
+                content_hash.update(content_chunk)
+                line_count += content_chunk.count(b"\n")
+                remaining_bytes -= len(content_chunk)
+
+        return content_hash.hexdigest(), line_count
+
+    @classmethod
+    def calculate_content_hash(cls, weather_file_path, hash_offsets):
+        """
+        Calculate the chained hash of a weather file's content up to its last hash offset.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            hash_offsets (list[int]): End offsets of the segments the cached hash was chained over.
+
+        Returns:
+            str: Hex digest of the content.
+        """
+        content_hash = ""
+        start_offset = 0
+
+        for stop_offset in hash_offsets:
+            content_hash, _ = cls.hash_file_segment(weather_file_path, start_offset, stop_offset, content_hash)
+            start_offset = stop_offset
+
+        return content_hash
+
+    @staticmethod
+    def pack_readings(weather_readings):
+        """
+        Convert WeatherReading objects into plain tuples for compact storage.
+
+        Args:
+            weather_readings (list[WeatherReading]): Readings parsed from a file.
+
+        Returns:
+            list[tuple[int, int | None, int | None, int | None]]: One
+            (date ordinal, max_temp, min_temp, mean_humidity) tuple per reading.
+        """
+        return [
+            (reading.date_ordinal, reading.max_temp, reading.min_temp, reading.mean_humidity)
+            for reading in weather_readings
+        ]
+
+    @staticmethod
+    def unpack_readings(packed_readings):
+        """
+        Rebuild WeatherReading objects from tuples created by pack_readings.
+
+        Args:
+            packed_readings (list[tuple]): Packed readings loaded from the cache.
+
+        Returns:
+            list[WeatherReading]: The cached readings.
+        """
+        return [
+            WeatherReading.from_date_ordinal(date_ordinal, max_temp, min_temp, mean_humidity)
+            for date_ordinal, max_temp, min_temp, mean_humidity in packed_readings
+        ]
+
+    @staticmethod
+    def read_prefix_boundaries(weather_file_path, byte_offset):
+        """
+        Read the first and last INCREMENTAL_CHECK_BYTES bytes of the first byte_offset bytes of a file.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            byte_offset (int): Length of the already parsed content.
+
+        Returns:
+            tuple[bytes, bytes]: Head and tail of the parsed content.
+        """
+        tail_offset = max(0, byte_offset - INCREMENTAL_CHECK_BYTES)
+
+        with weather_file_path.open("rb") as weather_file:
+            head_bytes = weather_file.read(min(INCREMENTAL_CHECK_BYTES, byte_offset))
+            weather_file.seek(tail_offset)
+            tail_bytes = weather_file.read(byte_offset - tail_offset)
+
+        return head_bytes, tail_bytes
+
+    @staticmethod
+    def calculate_prefix_hashes(head_bytes, tail_bytes):
+        """
+        Hash the head and the tail of already parsed file content.
+
+        Args:
+            head_bytes (bytes): First bytes of the content.
+            tail_bytes (bytes): Last bytes of the content.
+
+        Returns:
+            tuple[str, str]: Hex digests of the head and the tail of the content.
+        """
+        return hashlib.sha256(head_bytes).hexdigest(), hashlib.sha256(tail_bytes).hexdigest()
+
+    @staticmethod
+    def read_fieldnames(weather_file_path):
+        """
+        Read the CSV header of a weather file.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+
+        Returns:
+            list[str] | None: Column names, or None if the file has no header line.
+        """
+        with weather_file_path.open("rb") as weather_file:
+            header_line = weather_file.readline().rstrip(b"\r\n").decode("utf-8")
+
+        return next(csv.reader([header_line]), None)
+
+    def build_file_state(self, weather_file_path, file_stat):
+        """
+        Describe the content of a weather file that was parsed in full.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            file_stat (os.stat_result): Status of the file taken before it was parsed. Its size
+                is the recorded byte offset, so rows appended while the file was parsed are
+                parsed again by the next run instead of being counted as cached.
+
+        Returns:
+            dict: The file state entries of a cache entry.
+        """
+        byte_offset = file_stat.st_size
+        content_hash, line_count = self.hash_file_segment(weather_file_path, 0, byte_offset)
+
+        return {
+            "mtime_ns": file_stat.st_mtime_ns,
+            "byte_offset": byte_offset,
+            "hash_offsets": [byte_offset],
+            "content_hash": content_hash,
+            "line_count": line_count,
+            "prefix_hashes": self.calculate_prefix_hashes(
+                *self.read_prefix_boundaries(weather_file_path, byte_offset)
+            ),
+            "fieldnames": self.read_fieldnames(weather_file_path),
+        }
+
+    def extend_file_state(self, weather_file_path, cache_entry, appended_bytes, file_stat):
+        """
+        Describe the content of a weather file after the appended bytes were parsed.
+
+        The content hash is chained from the cached one over the appended bytes only.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            cache_entry (dict): The file's cache entry before the update.
+            appended_bytes (bytes): The parsed bytes following the cached byte offset.
+            file_stat (os.stat_result): Status of the file taken before the bytes were read.
+
+        Returns:
+            dict: The file state entries of the updated cache entry.
+        """
+        byte_offset = cache_entry["byte_offset"] + len(appended_bytes)
+
+        return {
+            "mtime_ns": file_stat.st_mtime_ns,
+            "byte_offset": byte_offset,
+            "hash_offsets": cache_entry["hash_offsets"] + [byte_offset],
+            "content_hash": hashlib.sha256(cache_entry["content_hash"].encode("ascii") + appended_bytes).hexdigest(),
+            "line_count": cache_entry["line_count"] + appended_bytes.count(b"\n"),
+            "prefix_hashes": self.calculate_prefix_hashes(
+                *self.read_prefix_boundaries(weather_file_path, byte_offset)
+            ),
+            "fieldnames": cache_entry["fieldnames"],
+        }
+
+    @staticmethod
+    def read_appended_lines(weather_file_path, cache_entry):
+        """
+        Read the complete lines appended to a weather file after its cached byte offset.
+
+        A last line without a line break may still be being written, so it is left for
+        the next update.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            cache_entry (dict): The file's cache entry.
+
+        Returns:
+            bytes: The appended bytes, up to and including the last line break.
+        """
+        with weather_file_path.open("rb") as weather_file:
+            weather_file.seek(cache_entry["byte_offset"])
+            appended_bytes = weather_file.read()
+
+        return appended_bytes[:appended_bytes.rfind(b"\n") + 1]
+
+    def get_entry_path(self, weather_file_path):
+        """
+        Return the path of the cache entry belonging to a weather file.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+
+        Returns:
+            Path: Path of the cache entry file.
+        """
+        source_key = hashlib.sha1(str(weather_file_path.resolve()).encode("utf-8")).hexdigest()
+
+        return self.cache_directory / f"{source_key}.pickle"
+
+    def read_entry(self, weather_file_path):
+        """
+        Read the raw cache entry of a weather file.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+
+        Returns:
+            dict | None: The cache entry, or None if it is missing, unreadable or
+            written by another cache format version.
+        """
+        try:
+            with self.get_entry_path(weather_file_path).open("rb") as cache_entry_file:
+                cache_entry = pickle.load(cache_entry_file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return None
+
+        if not isinstance(cache_entry, dict) or cache_entry.get("version") != READING_CACHE_FORMAT_VERSION:
+            return None
+
+        return cache_entry
+
+    def write_entry(self, weather_file_path, cache_entry):
+        """
+        Atomically write the cache entry of a weather file.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            cache_entry (dict): The entry to write.
+        """
+        entry_path = self.get_entry_path(weather_file_path)
+        temporary_entry_path = entry_path.with_suffix(".tmp")
+
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+
+        with temporary_entry_path.open("wb") as cache_entry_file:
+            pickle.dump(cache_entry, cache_entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        temporary_entry_path.replace(entry_path)
+
+    def load(self, weather_file_path):
+        """
+        Load the cached readings of a weather file if the file has not changed.
+
+        A file is unchanged when its size matches the cached byte offset and either its
+        modification time or its content hash matches the cached one.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+
+        Returns:
+            tuple[list[WeatherReading], WeatherRollups | None, list[str]] | None: Cached readings
+            and the rollups and parsing warnings stored with them, or None on a cache miss.
+        """
+        cache_entry = None if self.rebuild else self.read_entry(weather_file_path)
+        file_stat = weather_file_path.stat()
+
+        if not cache_entry or cache_entry["byte_offset"] != file_stat.st_size:
+            self.misses += 1
+            return None
+
+        if cache_entry["mtime_ns"] != file_stat.st_mtime_ns:
+            if cache_entry["content_hash"] != self.calculate_content_hash(
+                weather_file_path, cache_entry["hash_offsets"]
+            ):
+                self.misses += 1
+                return None
+
+            cache_entry["mtime_ns"] = file_stat.st_mtime_ns
+            self.write_entry(weather_file_path, cache_entry)
+
+        self.hits += 1
+
+        return self.unpack_readings(cache_entry["readings"]), cache_entry["rollups"], cache_entry["parsing_warnings"]
+
+    def load_appendable(self, weather_file_path):
+        """
+        Return the cache entry of a weather file that has only grown by appended rows.
+
+        The file must be larger than the cached byte offset, the cached content must have
+        ended with a complete line, and the head and tail of the cached content must be
+        unchanged. Anything else (truncation, rewrite) needs a full re-parse. Only the
+        head and the tail are read.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+
+        Returns:
+            dict | None: The cache entry, or None if the file cannot be parsed incrementally.
+        """
+        cache_entry = None if self.rebuild else self.read_entry(weather_file_path)
+
+        if not cache_entry or not cache_entry["fieldnames"]:
+            return None
+
+        byte_offset = cache_entry["byte_offset"]
+
+        if weather_file_path.stat().st_size <= byte_offset:
+            return None
+
+        head_bytes, tail_bytes = self.read_prefix_boundaries(weather_file_path, byte_offset)
+
+        if not tail_bytes.endswith(b"\n") or (
+            self.calculate_prefix_hashes(head_bytes, tail_bytes) != cache_entry["prefix_hashes"]
+        ):
+            return None
+
+        return cache_entry
+
+    def store(self, weather_file_path, weather_readings, file_rollups, parsing_warnings, file_state):
+        """
+        Store the parsed readings of a weather file, their rollups and parsing warnings, in the cache.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            weather_readings (list[WeatherReading]): Readings parsed from the file.
+            file_rollups (WeatherRollups | None): Monthly rollups of the readings, if built.
+            parsing_warnings (Iterable[str]): Messages of the warnings logged while parsing the file.
+            file_state (dict): Parsed content of the file, from build_file_state or extend_file_state.
+        """
+        self.write_entry(weather_file_path, {
+            "version": READING_CACHE_FORMAT_VERSION,
+            "source": str(weather_file_path),
+            **file_state,
+            "last_date_ordinal": max(
+                (reading.date_ordinal for reading in weather_readings), default=None
+            ),
+            "readings": self.pack_readings(weather_readings),
+            "rollups": file_rollups,
+            "parsing_warnings": list(parsing_warnings),
+        })
+
+    def store_appended_rows(
+            self, weather_file_path, weather_readings, file_rollups, parsing_warnings, cache_entry,
+            appended_bytes, file_stat
+    ):
+        """
+        Store a weather file updated from its appended rows, and count the incremental update.
+
+        Args:
+            weather_file_path (Path): Path to the weather file.
+            weather_readings (list[WeatherReading]): Readings of the whole file.
+            file_rollups (WeatherRollups | None): Monthly rollups of the readings, if built.
+            parsing_warnings (Iterable[str]): Messages of the warnings logged while parsing the file.
+            cache_entry (dict): The file's cache entry before the update.
+            appended_bytes (bytes): The parsed bytes following the cached byte offset.
+            file_stat (os.stat_result): Status of the file taken before the bytes were read.
+        """
+        self.store(
+            weather_file_path,
+            weather_readings,
+            file_rollups,
+            parsing_warnings,
+            self.extend_file_state(weather_file_path, cache_entry, appended_bytes, file_stat)
+        )
+        self.appends += 1
+
+    def format_summary(self):
+        """
+        Format the cache hit/miss counters.
+
+        Returns:
+            str: Summary of cache hits and misses.
+        """
+        cache_summary = f"Reading cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+        if self.incremental:
+            cache_summary += f", {self.appends} incremental update(s)"
+
+        return cache_summary
@@ -0,0 +1,97 @@
+from calendar import monthrange
+from datetime import date
+
+from range_index import WeatherRangeIndex
+from reading_store import WeatherReadingStore
+
+
+class WeatherReadingIndex:
+    """
+    Year/month index over date-sorted weather readings.
+
+    The readings are sorted once when the index is built and every (year, month)
+    bucket is recorded as a contiguous [start, stop) range of the sorted store, so
+    a lookup costs a dictionary access plus copying the bucket. Arbitrary date ranges
+    are answered by a WeatherRangeIndex built the first time one is requested.
+    """
+    def __init__(self, weather_readings):
+        if not isinstance(weather_readings, WeatherReadingStore):
+            weather_readings = WeatherReadingStore.from_readings(weather_readings)
+
+        self.sorted_readings = weather_readings.sort_by_date()
+        self.month_buckets = self.build_month_buckets(self.sorted_readings.date_ordinals)
+        self.range_index = None
+
+    @staticmethod
+    def build_month_buckets(sorted_date_ordinals):
+        """
+        Find the range of positions covered by each (year, month) in sorted date ordinals.
+
+        Args:
+            sorted_date_ordinals (Sequence[int]): Date ordinals in ascending order.
+
+        Returns:
+            dict[tuple[int, int], tuple[int, int]]: Mapping of (year, month) to the
+            [start, stop) positions of that month's readings.
+        """
+        month_buckets = {}
+        bucket_key = None
+        bucket_start = 0
+        bucket_end_ordinal = None
+
+        for reading_index, date_ordinal in enumerate(sorted_date_ordinals):
+            if bucket_end_ordinal is not None and date_ordinal < bucket_end_ordinal:
+                continue
+
+            if bucket_key:
+                month_buckets[bucket_key] = (bucket_start, reading_index)
+
+            reading_date = date.fromordinal(date_ordinal)
+            bucket_key = (reading_date.year, reading_date.month)
+            bucket_start = reading_index
+            bucket_end_ordinal = date_ordinal + monthrange(*bucket_key)[1] - reading_date.day + 1
+
+        if bucket_key:
+            month_buckets[bucket_key] = (bucket_start, len(sorted_date_ordinals))
+
+        return month_buckets
+
+    def get_readings(self, year, month=None):
+        """
+        Return the date-sorted readings of a month, or of a whole year.
+
+        A year is resolved by joining its month buckets, which are adjacent in the sorted store.
+
+        Args:
+            year (int): Year to look up.
+            month (int | None, optional): Month to look up (1–12). If None, returns the whole year.
+
+        Returns:
+            WeatherReadingStore: Matching readings sorted by date.
+        """
+        if month is not None:
+            bucket_bounds = [self.month_buckets.get((year, month))]
+        else:
+            bucket_bounds = [
+                self.month_buckets.get((year, year_month))
+                for year_month in range(1, 13)
+            ]
+
+        bucket_bounds = [bounds for bounds in bucket_bounds if bounds]
+
+        if not bucket_bounds:
+            return WeatherReadingStore()
+
+        return self.sorted_readings.get_slice(bucket_bounds[0][0], bucket_bounds[-1][1])
+
+    def get_range_index(self):
+        """
+        Return the date range index of the sorted readings, building it on first use.
+
+        Returns:
+            WeatherRangeIndex: Prefix sums and segment trees over the sorted readings.
+        """
+        if self.range_index is None:
+            self.range_index = WeatherRangeIndex(self.sorted_readings)
+
+        return self.range_index
@@ -0,0 +1,313 @@
+from array import array
+from calendar import monthrange
+from datetime import (
+    MAXYEAR,
+    MINYEAR,
+    date,
+)
+
+from constants import (
+    READING_DATE_TYPECODE,
+    READING_MASK_TYPECODE,
+    READING_VALUE_TYPECODE,
+    WEATHER_ATTRIBUTES,
+)
+from weather_reading import WeatherReading
+
+
+class WeatherReadingStore:
+    """
+    Columnar store of weather readings.
+
+    Dates are kept as ordinal ints and every weather attribute as a typed array with
+    an explicit missing-value mask, so no WeatherReading object exists until one is
+    requested with get_reading, indexing or iteration.
+    """
+    def __init__(self):
+        self.date_ordinals = array(READING_DATE_TYPECODE)
+        self.attribute_values = {
+            weather_attribute: array(READING_VALUE_TYPECODE)
+            for weather_attribute in WEATHER_ATTRIBUTES
+        }
+        self.missing_value_masks = {
+            weather_attribute: array(READING_MASK_TYPECODE)
+            for weather_attribute in WEATHER_ATTRIBUTES
+        }
+
+    @classmethod
+    def from_readings(cls, weather_readings):
+        """
+        Build a store from WeatherReading objects.
+
+        Args:
+            weather_readings (Iterable[WeatherReading]): Readings to store.
+
+        Returns:
+            WeatherReadingStore: Store holding the given readings in the same order.
+        """
+        reading_store = cls()
+
+        for weather_reading in weather_readings:
+            reading_store.append(weather_reading)
+
+        return reading_store
+
+    @classmethod
+    def concatenate(cls, reading_stores):
+        """
+        Build a store holding the readings of several stores, one after the other.
+
+        Args:
+            reading_stores (Iterable[WeatherReadingStore]): Stores to concatenate.
+
+        Returns:
+            WeatherReadingStore: Store with the readings of every given store, in order.
+        """
+        concatenated_store = cls()
+
+        for reading_store in reading_stores:
+            concatenated_store.date_ordinals.extend(reading_store.date_ordinals)
+
+            for weather_attribute in WEATHER_ATTRIBUTES:
+                concatenated_store.attribute_values[weather_attribute].extend(
+                    reading_store.attribute_values[weather_attribute]
+                )
+                concatenated_store.missing_value_masks[weather_attribute].extend(
+                    reading_store.missing_value_masks[weather_attribute]
+                )
+
+        return concatenated_store
+
+    def __len__(self):
+        return len(self.date_ordinals)
+
+    def __getitem__(self, reading_index):
+        return self.get_reading(reading_index)
+
+    def __iter__(self):
+        for reading_index in range(len(self)):
+            yield self.get_reading(reading_index)
+
+    def append(self, weather_reading):
+        """
+        Append a WeatherReading to the store.
+
+        Args:
+            weather_reading (WeatherReading): The reading to append.
+        """
+        self.date_ordinals.append(weather_reading.date.toordinal())
+
+        for weather_attribute in WEATHER_ATTRIBUTES:
+            attribute_value = getattr(weather_reading, weather_attribute)
+
+            self.attribute_values[weather_attribute].append(attribute_value or 0)
+            self.missing_value_masks[weather_attribute].append(attribute_value is None)
+
+    def iter_value_rows(self):
+        """
+        Iterate over the attribute values of every reading without building WeatherReading objects.
+
+        Yields:
+            tuple[int | None, ...]: Values of WEATHER_ATTRIBUTES for one reading, None where missing.
+        """
+        attribute_columns = [
+            zip(self.attribute_values[weather_attribute], self.missing_value_masks[weather_attribute])
+            for weather_attribute in WEATHER_ATTRIBUTES
+        ]
+
+        for attribute_row in zip(*attribute_columns):
+            yield tuple(
+                None if is_missing else attribute_value
+                for attribute_value, is_missing in attribute_row
+            )
+
+    def get_value(self, weather_attribute, reading_index):
+        """
+        Return the value of an attribute for one reading.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+            reading_index (int): Position of the reading in the store.
+
+        Returns:
+            int | None: The attribute value, or None if it is missing.
+        """
+        if self.missing_value_masks[weather_attribute][reading_index]:
+            return None
+
+        return self.attribute_values[weather_attribute][reading_index]
+
+    def get_reading(self, reading_index):
+        """
+        Build the WeatherReading object of one stored reading.
+
+        Args:
+            reading_index (int): Position of the reading in the store.
+
+        Returns:
+            WeatherReading: The reading at that position.
+        """
+        if reading_index < 0:
+            reading_index += len(self)
+
+        return WeatherReading.from_date_ordinal(
+            self.date_ordinals[reading_index],
+            *(
+                self.get_value(weather_attribute, reading_index)
+                for weather_attribute in WEATHER_ATTRIBUTES
+            )
+        )
+
+    def select(self, reading_indices):
+        """
+        Build a new store holding only the readings at the given positions.
+
+        Args:
+            reading_indices (Iterable[int]): Positions of the readings to keep, in the wanted order.
+
+        Returns:
+            WeatherReadingStore: Store with the selected readings.
+        """
+        selected_store = WeatherReadingStore()
+        date_ordinals = self.date_ordinals
+
+        for reading_index in reading_indices:
+            selected_store.date_ordinals.append(date_ordinals[reading_index])
+
+            for weather_attribute in WEATHER_ATTRIBUTES:
+                selected_store.attribute_values[weather_attribute].append(
+                    self.attribute_values[weather_attribute][reading_index]
+                )
+                selected_store.missing_value_masks[weather_attribute].append(
+                    self.missing_value_masks[weather_attribute][reading_index]
+                )
+
+        return selected_store
+
+    def get_slice(self, start_index, stop_index):
+        """
+        Build a new store holding the readings in positions [start_index, stop_index).
+
+        Args:
+            start_index (int): First position to keep.
+            stop_index (int): First position after the kept readings.
+
+        Returns:
+            WeatherReadingStore: Store with the sliced readings.
+        """
+        sliced_store = WeatherReadingStore()
+        sliced_store.date_ordinals = self.date_ordinals[start_index:stop_index]
+
+        for weather_attribute in WEATHER_ATTRIBUTES:
+            sliced_store.attribute_values[weather_attribute] = (
+                self.attribute_values[weather_attribute][start_index:stop_index]
+            )
+            sliced_store.missing_value_masks[weather_attribute] = (
+                self.missing_value_masks[weather_attribute][start_index:stop_index]
+            )
+
+        return sliced_store
+
+    def sort_by_date(self):
+        """
+        Build a new store with the readings sorted by date.
+
+        The sort is stable, so readings of the same day keep their relative order.
+
+        Returns:
+            WeatherReadingStore: Date-sorted copy of the store.
+        """
+        return self.select(sorted(range(len(self)), key=self.date_ordinals.__getitem__))
+
+    def get_indices_in_date_range(self, first_date_ordinal, end_date_ordinal):
+        """
+        Return positions of readings dated within [first_date_ordinal, end_date_ordinal).
+
+        Args:
+            first_date_ordinal (int): First date ordinal to include.
+            end_date_ordinal (int): First date ordinal after the range.
+
+        Returns:
+            list[int]: Matching positions, in store order.
+        """
+        return [
+            reading_index
+            for reading_index, date_ordinal in enumerate(self.date_ordinals)
+            if first_date_ordinal <= date_ordinal < end_date_ordinal
+        ]
+
+    def get_indices_by_year_and_month(self, year, month=None):
+        """
+        Return positions of readings in a given year and, optionally, month.
+
+        Args:
+            year (int): Year to filter by.
+            month (int | None, optional): Month to filter by (1–12). If None, the whole year matches.
+
+        Returns:
+            list[int]: Matching positions, in store order.
+        """
+        if not MINYEAR <= year <= MAXYEAR or (month is not None and not 1 <= month <= 12):
+            return []
+
+        first_month, last_month = (1, 12) if month is None else (month, month)
+        first_date = date(year, first_month, 1)
+        last_date = date(year, last_month, monthrange(year, last_month)[1])
+
+        return self.get_indices_in_date_range(first_date.toordinal(), last_date.toordinal() + 1)
+
+    def get_indices_with_value(self, weather_attribute):
+        """
+        Return positions of readings with a present, non-zero value for an attribute.
+
+        This matches the truthiness check the list based filters and validators apply.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            list[int]: Matching positions, in store order.
+        """
+        return [
+            reading_index
+            for reading_index, (attribute_value, is_missing) in enumerate(zip(
+                self.attribute_values[weather_attribute],
+                self.missing_value_masks[weather_attribute]
+            ))
+            if attribute_value and not is_missing
+        ]
+
+    def get_present_values(self, weather_attribute):
+        """
+        Return the present, non-zero values of an attribute.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            list[int]: Values in store order.
+        """
+        attribute_values = self.attribute_values[weather_attribute]
+
+        return [
+            attribute_values[reading_index]
+            for reading_index in self.get_indices_with_value(weather_attribute)
+        ]
+
+    def find_max_index(self, weather_attribute):
+        """
+        Return the position of the first reading holding the maximum valid value of an attribute.
+
+        Missing and zero values are skipped, like get_indices_with_value does.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            int | None: Position of the maximum, or None if the attribute has no valid value.
+        """
+        return max(
+            self.get_indices_with_value(weather_attribute),
+            key=self.attribute_values[weather_attribute].__getitem__,
+            default=None
+        )
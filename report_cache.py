@@ -0,0 +1,77 @@
+from collections import OrderedDict
+
+from constants import REPORT_CACHE_SIZE
+
+
+class ReportResultCache:
+    """
+    Bounded least-recently-used cache of rendered reports.
+
+    Entries are keyed by report type and period and remember the data version they were
+    rendered from. A lookup with another data version is a miss, so a report is rendered
+    again as soon as the files it was computed from change.
+    """
+    def __init__(self, max_entries=REPORT_CACHE_SIZE):
+        if max_entries < 0:
+            raise ValueError(f"Report cache size must not be negative, got {max_entries}.")
+
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, report_key, data_version=None):
+        """
+        Return a cached report and mark it as most recently used.
+
+        Args:
+            report_key (tuple[str, int | tuple[int, int]]): Report type and period.
+            data_version (Hashable): Version of the data the report would be computed from.
+
+        Returns:
+            str | None: The rendered report, or None on a miss.
+        """
+        cache_entry = self.entries.get(report_key)
+
+        if cache_entry is None or cache_entry[0] != data_version:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(report_key)
+        self.hits += 1
+
+        return cache_entry[1]
+
+    def store(self, report_key, rendered_report, data_version=None):
+        """
+        Cache a rendered report, evicting the least recently used one when full.
+
+        Args:
+            report_key (tuple[str, int | tuple[int, int]]): Report type and period.
+            rendered_report (str): The rendered report.
+            data_version (Hashable): Version of the data the report was computed from.
+        """
+        if not self.max_entries:
+            return
+
+        self.entries[report_key] = (data_version, rendered_report)
+        self.entries.move_to_end(report_key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached report."""
+        self.entries.clear()
+
+    def format_summary(self):
+        """
+        Format the hit/miss counters.
+
+        Returns:
+            str: Summary of report cache hits and misses.
+        """
+        return (
+            f"Report cache: {self.hits} hit(s), {self.misses} miss(es), "
+            f"{len(self.entries)}/{self.max_entries} entries"
+        )
@@ -0,0 +1,56 @@
+class ReportPeriodPredicate:
+    """The years and months the requested reports need, used to skip weather files early."""
+    def __init__(self, years=(), months=()):
+        self.years = set(years)
+        self.months = set(months)
+
+    def matches_year(self, year):
+        """
+        Check whether any requested report needs data of a year.
+
+        Args:
+            year (int): The year.
+
+        Returns:
+            bool: True if the year, or one of its months, is requested.
+        """
+        return year in self.years or any(
+            requested_year == year
+            for requested_year, _ in self.months
+        )
+
+    def matches_month(self, year, month):
+        """
+        Check whether any requested report needs data of a month.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+
+        Returns:
+            bool: True if the month, or its whole year, is requested.
+        """
+        return year in self.years or (year, month) in self.months
+
+    def matches_date_range(self, first_date, last_date):
+        """
+        Check whether any requested period overlaps a range of dates.
+
+        Args:
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+
+        Returns:
+            bool: True if a requested year or month overlaps the range.
+        """
+        first_date, last_date = sorted((first_date, last_date))
+        first_month = (first_date.year, first_date.month)
+        last_month = (last_date.year, last_date.month)
+
+        return any(
+            first_date.year <= requested_year <= last_date.year
+            for requested_year in self.years
+        ) or any(
+            first_month <= requested_month <= last_month
+            for requested_month in self.months
+        )
@@ -0,0 +1,103 @@
+import csv
+import json
+
+from constants import CSV_REPORT_FIELDS
+
+
+class NdjsonReportSerializer:
+    """
+    Writes every report record as one JSON object per line, as soon as it is computed.
+
+    The output stream is flushed after every record, so a downstream tool reading a pipe
+    receives each report as soon as it is written.
+    """
+    def __init__(self, output_stream):
+        self.output_stream = output_stream
+
+    def begin(self):
+        """Write what precedes the first record."""
+
+    def write_report(self, report_record):
+        """
+        Write one report record and flush it to the output stream.
+
+        Args:
+            report_record (dict): Record built by WeatherMan.build_report_record.
+        """
+        self.write_record(report_record)
+        self.output_stream.flush()
+
+    def write_record(self, report_record):
+        """
+        Write one report record, without flushing.
+
+        Args:
+            report_record (dict): Record built by WeatherMan.build_report_record.
+        """
+        self.output_stream.write(json.dumps(report_record) + "\n")
+
+    def end(self):
+        """Write what follows the last record."""
+
+
+class JsonReportSerializer(NdjsonReportSerializer):
+    """
+    Writes the report records as one JSON array.
+
+    The array is written incrementally, one element per record, so no record waits
+    for the others to be computed.
+    """
+    def __init__(self, output_stream):
+        super().__init__(output_stream)
+        self.record_count = 0
+
+    def begin(self):
+        self.output_stream.write("[")
+
+    def write_record(self, report_record):
+        self.output_stream.write(f"{',' if self.record_count else ''}\n{json.dumps(report_record)}")
+        self.record_count += 1
+
+    def end(self):
+        self.output_stream.write("\n]\n")
+
+
+class CsvReportSerializer(NdjsonReportSerializer):
+    """
+    Writes the report records as CSV rows with one value per row.
+
+    Every value of a record becomes a row of CSV_REPORT_FIELDS; an invalid report becomes
+    a single "error" row holding its message, and a report without values a single
+    "no_data" row, so every requested report appears in the output.
+    """
+    def __init__(self, output_stream):
+        super().__init__(output_stream)
+        self.csv_writer = csv.writer(output_stream, lineterminator="\n")
+
+    def begin(self):
+        self.csv_writer.writerow(CSV_REPORT_FIELDS)
+
+    def write_record(self, report_record):
+        report_columns = [
+            report_record["station"], report_record["report"], report_record["year"], report_record["month"]
+        ]
+
+        if "error" in report_record:
+            self.csv_writer.writerow(report_columns + ["error", report_record["error"], None])
+            return
+
+        if not report_record["values"]:
+            self.csv_writer.writerow(report_columns + ["no_data", None, None])
+            return
+
+        self.csv_writer.writerows(
+            report_columns + [report_value["metric"], report_value["value"], report_value["date"]]
+            for report_value in report_record["values"]
+        )
+
+
+REPORT_SERIALIZERS = {
+    "csv": CsvReportSerializer,
+    "json": JsonReportSerializer,
+    "ndjson": NdjsonReportSerializer,
+}
@@ -0,0 +1,244 @@
+from constants import WEATHER_ATTRIBUTES
+from quantiles import QuantileSketch
+
+
+class AttributeRollup:
+    """
+    Mergeable count, sum, maximum, minimum and quantile sketch of one weather attribute.
+
+    The extremes keep the readings themselves, so rollups built from different files
+    can be merged. When two readings hold the same extreme value the earlier day wins,
+    which is what running max() over date-sorted readings gives.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max_value = None
+        self.max_reading = None
+        self.min_value = None
+        self.min_reading = None
+        self.quantile_sketch = QuantileSketch()
+
+    def add(self, attribute_value, weather_reading):
+        """
+        Add a valid attribute value to the rollup.
+
+        Args:
+            attribute_value (int | float): A present, non-zero attribute value.
+            weather_reading (WeatherReading): The reading the value belongs to.
+        """
+        self.count += 1
+        self.total += attribute_value
+        self.update_extremes(attribute_value, weather_reading, attribute_value, weather_reading)
+        self.quantile_sketch.add(attribute_value)
+
+    def update_extremes(self, max_value, max_reading, min_value, min_reading):
+        """
+        Replace the stored extremes when the given ones are more extreme or earlier.
+
+        Args:
+            max_value (int | float): Candidate maximum value.
+            max_reading (WeatherReading): Reading holding the candidate maximum.
+            min_value (int | float): Candidate minimum value.
+            min_reading (WeatherReading): Reading holding the candidate minimum.
+        """
+        if self.max_value is None or max_value > self.max_value or (
+            max_value == self.max_value and max_reading.date < self.max_reading.date
+        ):
+            self.max_value, self.max_reading = max_value, max_reading
+
+        if self.min_value is None or min_value < self.min_value or (
+            min_value == self.min_value and min_reading.date < self.min_reading.date
+        ):
+            self.min_value, self.min_reading = min_value, min_reading
+
+    def merge(self, other_rollup):
+        """
+        Merge the statistics of another rollup of the same attribute into this one.
+
+        Args:
+            other_rollup (AttributeRollup): Rollup to merge.
+        """
+        if not other_rollup.count:
+            return
+
+        self.count += other_rollup.count
+        self.total += other_rollup.total
+        self.update_extremes(
+            other_rollup.max_value, other_rollup.max_reading,
+            other_rollup.min_value, other_rollup.min_reading
+        )
+        self.quantile_sketch.merge(other_rollup.quantile_sketch)
+
+
+class WeatherRollup:
+    """Rolled up statistics of every weather attribute over one month or one year."""
+    def __init__(self):
+        self.attribute_rollups = {
+            weather_attribute: AttributeRollup()
+            for weather_attribute in WEATHER_ATTRIBUTES
+        }
+
+    def add_reading(self, weather_reading):
+        """
+        Add the valid attribute values of a reading to the rollup.
+
+        Args:
+            weather_reading (WeatherReading): The reading to add.
+        """
+        for weather_attribute, attribute_rollup in self.attribute_rollups.items():
+            attribute_value = getattr(weather_reading, weather_attribute)
+
+            if attribute_value:
+                attribute_rollup.add(attribute_value, weather_reading)
+
+    def merge(self, other_rollup):
+        """
+        Merge another rollup into this one.
+
+        Args:
+            other_rollup (WeatherRollup): Rollup to merge.
+        """
+        for weather_attribute, attribute_rollup in self.attribute_rollups.items():
+            attribute_rollup.merge(other_rollup.attribute_rollups[weather_attribute])
+
+    def get_max_readings(self):
+        """
+        Return the reading holding the maximum value of each attribute.
+
+        Returns:
+            dict[str, WeatherReading]: Mapping of attribute to its maximum reading.
+            Attributes without any valid value are left out.
+        """
+        return {
+            weather_attribute: attribute_rollup.max_reading
+            for weather_attribute, attribute_rollup in self.attribute_rollups.items()
+            if attribute_rollup.count
+        }
+
+    def get_totals(self, weather_attribute):
+        """
+        Return the sum and count of the valid values of an attribute.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+
+        Returns:
+            tuple[int | float, int]: Sum and count of the valid values.
+        """
+        attribute_rollup = self.attribute_rollups[weather_attribute]
+
+        return attribute_rollup.total, attribute_rollup.count
+
+    def get_percentiles(self, weather_attribute, percentiles):
+        """
+        Return percentiles of the valid values of an attribute from its quantile sketch.
+
+        Args:
+            weather_attribute (str): Attribute name (e.g., 'max_temp').
+            percentiles (Iterable[int]): Percentiles between 0 and 100.
+
+        Returns:
+            list[int] | None: One value per percentile, or None if there is no valid value.
+        """
+        return self.attribute_rollups[weather_attribute].quantile_sketch.get_percentiles(percentiles)
+
+    def has_exact_percentiles(self):
+        """
+        Check whether no quantile sketch of the rollup has been compacted.
+
+        Returns:
+            bool: True if get_percentiles returns exact percentiles for every attribute.
+        """
+        return all(
+            attribute_rollup.quantile_sketch.is_exact()
+            for attribute_rollup in self.attribute_rollups.values()
+        )
+
+
+class WeatherRollups:
+    """
+    Per-month and per-year rollups of weather readings, built while the readings are parsed.
+
+    Yearly and monthly reports can be answered from the rollups without the raw readings.
+    """
+    def __init__(self):
+        self.monthly_rollups = {}
+        self.yearly_rollups = {}
+
+    def add_reading(self, weather_reading):
+        """
+        Add a reading to the rollup of its month.
+
+        Args:
+            weather_reading (WeatherReading): The reading to add.
+        """
+        month_key = (weather_reading.date.year, weather_reading.date.month)
+        monthly_rollup = self.monthly_rollups.get(month_key)
+
+        if monthly_rollup is None:
+            monthly_rollup = self.monthly_rollups[month_key] = WeatherRollup()
+
+        monthly_rollup.add_reading(weather_reading)
+        self.yearly_rollups.pop(weather_reading.date.year, None)
+
+    def merge(self, other_rollups):
+        """
+        Merge the monthly rollups of another WeatherRollups into this one.
+
+        Args:
+            other_rollups (WeatherRollups): Rollups to merge, e.g. those of another file.
+        """
+        for month_key, other_monthly_rollup in other_rollups.monthly_rollups.items():
+            monthly_rollup = self.monthly_rollups.get(month_key)
+
+            if monthly_rollup is None:
+                monthly_rollup = self.monthly_rollups[month_key] = WeatherRollup()
+
+            monthly_rollup.merge(other_monthly_rollup)
+            self.yearly_rollups.pop(month_key[0], None)
+
+    def get_months(self):
+        """
+        Return the months that have a rollup.
+
+        Returns:
+            list[tuple[int, int]]: (year, month) pairs in ascending order.
+        """
+        return sorted(self.monthly_rollups)
+
+    def get_month_rollup(self, year, month):
+        """
+        Return the rollup of a month.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+
+        Returns:
+            WeatherRollup | None: The month's rollup, or None if it has no readings.
+        """
+        return self.monthly_rollups.get((year, month))
+
+    def get_year_rollup(self, year):
+        """
+        Return the rollup of a year, merging its monthly rollups the first time it is requested.
+
+        Args:
+            year (int): The year.
+
+        Returns:
+            WeatherRollup: The year's rollup, empty if the year has no readings.
+        """
+        yearly_rollup = self.yearly_rollups.get(year)
+
+        if yearly_rollup is None:
+            yearly_rollup = self.yearly_rollups[year] = WeatherRollup()
+
+            for month in range(1, 13):
+                monthly_rollup = self.monthly_rollups.get((year, month))
+
+                if monthly_rollup:
+                    yearly_rollup.merge(monthly_rollup)
+
+        return yearly_rollup
@@ -0,0 +1,176 @@
+from constants import (
+    ALL_STATIONS,
+    DEFAULT_PARSER_WORKERS,
+)
+from reading_index import WeatherReadingIndex
+from reading_store import WeatherReadingStore
+from rollups import WeatherRollups
+
+
+class WeatherStationShard:
+    """Indexed readings, and optionally rollups, of one station."""
+    def __init__(self, station, weather_readings, weather_rollups=None):
+        self.station = station
+        self.weather_readings = weather_readings
+        self.weather_rollups = weather_rollups
+
+
+class WeatherStationShards:
+    """
+    Weather readings partitioned into one shard per station.
+
+    The files of every selected station are parsed together, so a pool of worker
+    processes ingests all shards at once, and each file's readings and rollups are then
+    added to the shard of its station. The "all stations" shard is merged from the
+    station shards the first time it is requested.
+    """
+    def __init__(self, weather_data_parser):
+        self.weather_data_parser = weather_data_parser
+        self.station_shards = {}
+        self.all_stations_shard = None
+
+    def load(
+            self, directory, stations=None, workers=DEFAULT_PARSER_WORKERS, reading_cache=None,
+            period_predicate=None, build_rollups=True
+    ):
+        """
+        Parse the weather files of a directory into station shards.
+
+        Args:
+            directory (str | Path): Weather directory containing weather data files.
+            stations (Collection[str] | None): Stations to load, or None for every station.
+            workers (int): Number of processes used to parse the weather files.
+            reading_cache (WeatherReadingCache | None): Cache of parsed weather files.
+            period_predicate (ReportPeriodPredicate | None): Requested periods, to skip other files.
+            build_rollups (bool): Whether to build monthly/yearly rollups while parsing.
+
+        Returns:
+            WeatherStationShards: This object, holding one shard per loaded station.
+        """
+        weather_data_files = self.weather_data_parser.select_weather_files(directory, period_predicate, stations)
+        station_readings = {station: [] for station in stations or []}
+        station_rollups = {}
+
+        for weather_data_file, (weather_readings, file_rollups) in zip(
+            weather_data_files,
+            self.weather_data_parser.parse_weather_files(weather_data_files, workers, reading_cache, build_rollups)
+        ):
+            station = self.weather_data_parser.get_station_name(weather_data_file, directory)
+            station_readings.setdefault(station, []).extend(weather_readings)
+
+            if build_rollups:
+                station_rollups.setdefault(station, WeatherRollups()).merge(file_rollups)
+
+        self.station_shards = {
+            station: WeatherStationShard(
+                station,
+                WeatherReadingIndex(station_readings[station]),
+                station_rollups.get(station, WeatherRollups()) if build_rollups else None
+            )
+            for station in sorted(station_readings)
+        }
+        self.all_stations_shard = None
+
+        return self
+
+    def load_reading_stores(self, station_reading_stores, stations=None, build_rollups=True):
+        """
+        Build station shards from already parsed readings, e.g. read from a columnar file.
+
+        Args:
+            station_reading_stores (dict[str, WeatherReadingStore]): Readings of each station.
+            stations (Collection[str] | None): Requested stations, given a shard even without readings.
+            build_rollups (bool): Whether to build monthly/yearly rollups from the readings.
+
+        Returns:
+            WeatherStationShards: This object, holding one shard per loaded station.
+        """
+        station_reading_stores = {
+            **{station: WeatherReadingStore() for station in stations or []},
+            **station_reading_stores,
+        }
+        self.station_shards = {}
+
+        for station in sorted(station_reading_stores):
+            weather_rollups = None
+
+            if build_rollups:
+                weather_rollups = WeatherRollups()
+
+                for weather_reading in station_reading_stores[station]:
+                    weather_rollups.add_reading(weather_reading)
+
+            self.station_shards[station] = WeatherStationShard(
+                station, WeatherReadingIndex(station_reading_stores[station]), weather_rollups
+            )
+
+        self.all_stations_shard = None
+
+        return self
+
+    def count_readings(self):
+        """
+        Count the readings of every station shard.
+
+        Returns:
+            int: Number of loaded readings.
+        """
+        return sum(
+            len(station_shard.weather_readings.sorted_readings)
+            for station_shard in self.station_shards.values()
+        )
+
+    def get_shard(self, station):
+        """
+        Return the shard of a station, or of all stations together.
+
+        Args:
+            station (str): Station name, or ALL_STATIONS.
+
+        Returns:
+            WeatherStationShard: The station's shard; empty if the station has no loaded readings.
+        """
+        if station == ALL_STATIONS:
+            return self.get_all_stations_shard()
+
+        station_shard = self.station_shards.get(station)
+
+        if station_shard is None:
+            station_shard = WeatherStationShard(station, WeatherReadingIndex([]), WeatherRollups())
+
+        return station_shard
+
+    def get_all_stations_shard(self):
+        """
+        Return the fleet-wide shard, merging the station shards the first time it is requested.
+
+        Returns:
+            WeatherStationShard: Readings and rollups of every loaded station.
+        """
+        if self.all_stations_shard is None:
+            station_shards = list(self.station_shards.values())
+
+            if len(station_shards) == 1:
+                only_shard = station_shards[0]
+                self.all_stations_shard = WeatherStationShard(
+                    ALL_STATIONS, only_shard.weather_readings, only_shard.weather_rollups
+                )
+            else:
+                weather_rollups = None
+
+                if all(station_shard.weather_rollups is not None for station_shard in station_shards):
+                    weather_rollups = WeatherRollups()
+
+                    for station_shard in station_shards:
+                        weather_rollups.merge(station_shard.weather_rollups)
+
+                self.all_stations_shard = WeatherStationShard(
+                    ALL_STATIONS,
+                    WeatherReadingIndex(WeatherReadingStore.concatenate(
+                        station_shard.weather_readings.sorted_readings
+                        for station_shard in station_shards
+                    )),
+                    weather_rollups
+                )
+
+        return self.all_stations_shard
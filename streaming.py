@@ -0,0 +1,65 @@
+from reading_index import WeatherReadingIndex
+from rollups import WeatherRollups
+
+
+class StreamingWeatherReports:
+    """
+    Builds the data of the requested reports while readings stream in.
+
+    Only readings in a requested period are kept: months of requested years and
+    requested months are added to rollups, and the readings of charted months are
+    kept to draw the charts. The readings of quantile periods are kept the same way,
+    so their percentiles can be computed exactly. Memory therefore depends on the requested periods,
+    not on the size of the weather archive. Reports comparing every year, such as
+    climatologies, need the rollups of all months (all_months).
+    """
+    def __init__(self, yearly_periods, monthly_periods, chart_periods, all_months=False):
+        self.all_months = all_months
+        self.rollup_periods = set(monthly_periods) | {
+            (year, month)
+            for year in yearly_periods
+            for month in range(1, 13)
+        }
+        self.chart_periods = set(chart_periods)
+        self.weather_rollups = WeatherRollups()
+        self.chart_readings = []
+
+    def add_reading(self, weather_reading):
+        """
+        Route a reading into the rollups and chart buckets that need it.
+
+        Args:
+            weather_reading (WeatherReading): A newly parsed reading.
+        """
+        reading_period = (weather_reading.date.year, weather_reading.date.month)
+
+        if self.all_months or reading_period in self.rollup_periods:
+            self.weather_rollups.add_reading(weather_reading)
+
+        if reading_period in self.chart_periods:
+            self.chart_readings.append(weather_reading)
+
+    def consume(self, weather_readings):
+        """
+        Add every reading of a (lazy) iterable of readings.
+
+        Args:
+            weather_readings (Iterable[WeatherReading]): Readings to add, e.g. from
+                WeatherDataParser.iter_directory_readings.
+
+        Returns:
+            StreamingWeatherReports: This object, for chaining.
+        """
+        for weather_reading in weather_readings:
+            self.add_reading(weather_reading)
+
+        return self
+
+    def build_chart_index(self):
+        """
+        Index the kept chart readings by year and month.
+
+        Returns:
+            WeatherReadingIndex: Index over the readings of the charted months.
+        """
+        return WeatherReadingIndex(self.chart_readings)
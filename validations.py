@@ -29,11 +29,12 @@ class WeatherReadingValidator:
         Validate yearly weather readings for specified attributes.
 
         Args:
-            yearly_weather_readings (list[WeatherReading]): List of yearly weather readings.
+            yearly_weather_readings (list[WeatherReading] | WeatherReadingStore): Yearly weather readings.
             weather_attributes (list[str]): List of attributes to validate (e.g., temperature, humidity).
 
         Returns:
-            dict[str, list[WeatherReading]]: Dictionary of attributes mapping to valid weather readings.
+            dict[str, list[WeatherReading] | WeatherReadingStore]: Dictionary of attributes mapping
+            to valid weather readings.
         """
         return self.readings.get_valid_readings_by_attribute(
             yearly_weather_readings,
@@ -46,7 +47,7 @@ class WeatherReadingValidator:
         by removing None or invalid entries.
 
         Args:
-            weather_readings (list[WeatherReading]): List of WeatherReading objects
+            weather_readings (list[WeatherReading] | WeatherReadingStore): Readings
                 from which the attribute values will be extracted.
             weather_attribute (str): The name of the weather attribute to extract
                 (e.g., "max_temp", "min_temp", "mean_humidity").
@@ -66,7 +67,7 @@ class WeatherReadingValidator:
         Validate weather attribute values for a monthly dataset.
 
         Args:
-            monthly_weather_readings (list[WeatherReading]): List of WeatherReading objects
+            monthly_weather_readings (list[WeatherReading] | WeatherReadingStore): Monthly weather readings
             weather_attributes (dict[str, str]): Dictionary mapping attribute keys (e.g., "max_temp", "min_temp",
             "mean_humidity") to their corresponding attribute names in WeatherReading objects.
 
@@ -1,7 +1,46 @@
+from datetime import date as calendar_date
+
+
 class WeatherReading:
-    """Represents a single day's weather data."""
+    """
+    Represents a single day's weather data.
+
+    Readings use __slots__, so no instance dictionary is held per reading.
+    """
+    __slots__ = ("date", "max_temp", "min_temp", "mean_humidity")
+
     def __init__(self, date, max_temp, min_temp, mean_humidity):
         self.date = date
         self.max_temp = max_temp
         self.min_temp = min_temp
         self.mean_humidity = mean_humidity
+
+    @classmethod
+    def from_date_ordinal(cls, date_ordinal, max_temp, min_temp, mean_humidity):
+        """
+        Create a reading from a date ordinal.
+
+        Args:
+            date_ordinal (int): Proleptic Gregorian ordinal of the reading's date.
+            max_temp (int | None): Maximum temperature.
+            min_temp (int | None): Minimum temperature.
+            mean_humidity (int | None): Mean humidity.
+
+        Returns:
+            WeatherReading: The reading.
+        """
+        return cls(calendar_date.fromordinal(date_ordinal), max_temp, min_temp, mean_humidity)
+
+    @property
+    def date_ordinal(self):
+        return self.date.toordinal()
+
+    def as_tuple(self):
+        """
+        Return the reading's values.
+
+        Returns:
+            tuple[date, int | None, int | None, int | None]: Date, max temperature,
+            min temperature and mean humidity.
+        """
+        return self.date, self.max_temp, self.min_temp, self.mean_humidity
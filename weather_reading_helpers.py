@@ -1,10 +1,19 @@
+from calendar import month_name
+from functools import lru_cache
+
 from constants import (
     BLUE,
+    MONTHLY_AVERAGE_LABELS,
     PURPLE,
+    QUANTILE_ATTRIBUTE_LABELS,
+    RANGE_REPORT_DATE_FORMAT,
     RED,
     RESET,
+    TEMP_BAR_CACHE_SIZE,
     YEARLY_ATTRIBUTE_MAP
 )
+from reading_index import WeatherReadingIndex
+from reading_store import WeatherReadingStore
 
 
 class WeatherReadingFilter:
@@ -14,14 +23,23 @@ class WeatherReadingFilter:
         Return weather readings for a given year and month, sorted by date.
 
         Args:
-             readings (list[WeatherReading]): List of weather reading objects.
+             readings (list[WeatherReading] | WeatherReadingStore | WeatherReadingIndex): Weather readings.
              year (int): The year to filter by.
              month (int): The month to filter by (1–12).
 
         Returns:
-            list[WeatherReading]: A list of WeatherReading objects that match
+            list[WeatherReading] | WeatherReadingStore: The readings that match
             the given year and month, sorted by date.
         """
+        if isinstance(readings, WeatherReadingIndex):
+            return readings.get_readings(year, month)
+
+        if isinstance(readings, WeatherReadingStore):
+            return readings.select(sorted(
+                readings.get_indices_by_year_and_month(year, month),
+                key=readings.date_ordinals.__getitem__
+            ))
+
         return sorted(
             [
                 reading
@@ -37,14 +55,22 @@ class WeatherReadingFilter:
         Filter readings to include only those where specified attributes are not None.
 
         Args:
-            weather_readings (list[WeatherReading]): List of weather reading objects.
+            weather_readings (list[WeatherReading] | WeatherReadingStore): Weather readings.
             weather_attributes (list[str]): List of attribute names to filter on
                 (e.g., ["max_temp", "min_temp", "mean_humidity"]).
 
         Returns:
-            dict[str, list[WeatherReading]]: Dictionary mapping each attribute name to a list of readings
-            where that attribute is not None.
+            dict[str, list[WeatherReading] | WeatherReadingStore]: Dictionary mapping each attribute
+            name to the readings where that attribute is not None.
         """
+        if isinstance(weather_readings, WeatherReadingStore):
+            return {
+                weather_attribute: weather_readings.select(
+                    weather_readings.get_indices_with_value(weather_attribute)
+                )
+                for weather_attribute in weather_attributes
+            }
+
         return {
             weather_attribute: [
                 reading
@@ -60,13 +86,20 @@ class WeatherReadingFilter:
         Filter readings by year and optionally by month.
 
         Args:
-            weather_readings (list[WeatherReading]): List of weather reading objects.
+            weather_readings (list[WeatherReading] | WeatherReadingStore | WeatherReadingIndex): Weather readings.
             year (int): Year to filter by.
             month (int | None, optional): Month to filter by (1–12). If None, returns all readings for the year.
 
         Returns:
-            list[WeatherReading]: List of readings matching the specified year and, if provided, month.
+            list[WeatherReading] | WeatherReadingStore: Readings matching the specified year and,
+            if provided, month. Readings looked up in a WeatherReadingIndex are sorted by date.
         """
+        if isinstance(weather_readings, WeatherReadingIndex):
+            return weather_readings.get_readings(year, month)
+
+        if isinstance(weather_readings, WeatherReadingStore):
+            return weather_readings.select(weather_readings.get_indices_by_year_and_month(year, month))
+
         return [
             reading
             for reading in weather_readings
@@ -89,18 +122,42 @@ class WeatherReadingFilter:
             for input_weather_attr, yearly_stats_identifier in YEARLY_ATTRIBUTE_MAP.items()
         }
 
+    @staticmethod
+    def get_range_extreme_weather_values(max_values_per_attribute, min_values_per_attribute):
+        """
+        Map the extremes of a date range to yearly statistics keys.
+
+        Unlike get_yearly_max_weather_values, the lowest temperature is the reading
+        with the minimum min_temp of the range.
+
+        Args:
+            max_values_per_attribute (dict[str, WeatherReading]): Max reading per attribute.
+            min_values_per_attribute (dict[str, WeatherReading]): Min reading per attribute.
+
+        Returns:
+            dict[str, WeatherReading]: Dictionary mapping yearly stat keys to readings.
+        """
+        return {
+            "highest_temperature": max_values_per_attribute.get("max_temp"),
+            "lowest_temperature": min_values_per_attribute.get("min_temp"),
+            "highest_mean_humidity_day": max_values_per_attribute.get("mean_humidity"),
+        }
+
     @staticmethod
     def get_attribute_values(weather_readings, weather_attribute):
         """
         Extract non-None values for a specific attribute from readings.
 
         Args:
-            weather_readings (list[WeatherReading]): List of weather reading objects.
+            weather_readings (list[WeatherReading] | WeatherReadingStore): Weather readings.
             weather_attribute (str): Attribute name to extract (e.g., 'max_temp').
 
         Returns:
             list[float | int]: List of attribute values that are not None.
         """
+        if isinstance(weather_readings, WeatherReadingStore):
+            return weather_readings.get_present_values(weather_attribute)
+
         return [
             getattr(reading, weather_attribute)
             for reading in weather_readings
@@ -109,7 +166,10 @@ class WeatherReadingFilter:
 
 
 class WeatherReadingFormatter:
-    def format_yearly_weather_report(self, yearly_statistics):
+    def __init__(self, use_colors=True):
+        self.colors = (RED, BLUE, PURPLE, RESET) if use_colors else ("", "", "", "")
+
+    def format_yearly_weather_report(self, yearly_statistics, date_format="%B %d"):
         """
         Format yearly weather report as strings.
 
@@ -118,6 +178,7 @@ class WeatherReadingFormatter:
                 "highest_temperature"
                 "lowest_temperature"
                 "highest_mean_humidity_day"
+            date_format (str): strftime format of the dates of the readings.
 
         Returns:
             list[str]: List of formatted strings for the report.
@@ -143,13 +204,153 @@ class WeatherReadingFormatter:
 
             yearly_weather_report.append(
                 f"{weather_attribute_label}: {weather_reading_measurement}{weather_unit_of_measurement} "
-                f"on {weather_reading.date.strftime("%B %d")}"
+                f"on {weather_reading.date.strftime(date_format)}"
             )
 
         return yearly_weather_report
 
+    def format_range_weather_report(self, first_date, last_date, range_statistics):
+        """
+        Format the extremes of a date range as strings, headed by the range.
+
+        Args:
+            first_date (date): First date of the range.
+            last_date (date): Last date of the range.
+            range_statistics (dict): WeatherReading objects keyed like format_yearly_weather_report's.
+
+        Returns:
+            list[str]: List of formatted strings for the report.
+        """
+        return [
+            f"{first_date.isoformat()} to {last_date.isoformat()}",
+            *self.format_yearly_weather_report(range_statistics, RANGE_REPORT_DATE_FORMAT)
+        ]
+
     @staticmethod
-    def format_temperature_bars(weather_reading, horizontal=False):
+    def format_moving_averages(window_days, moving_averages):
+        """
+        Format moving averages as one line per date.
+
+        Args:
+            window_days (int): Length of the windows in days.
+            moving_averages (list[tuple[date, dict[str, float]]]): Averages of max_temp and
+                min_temp per date, as calculate_moving_averages returns them.
+
+        Returns:
+            list[str]: List of lines for printing.
+        """
+        return [f"{window_days}-day moving averages"] + [
+            f"{reading_date.isoformat()} Max: {attribute_averages["max_temp"]}C "
+            f"Min: {attribute_averages["min_temp"]}C"
+            for reading_date, attribute_averages in moving_averages
+        ]
+
+    @staticmethod
+    def format_climatology_report(weather_climatology):
+        """
+        Format the baseline of every calendar month as strings.
+
+        Args:
+            weather_climatology (MonthlyClimatology): Per-calendar-month baselines.
+
+        Returns:
+            list[str]: List of lines for printing; empty if no month has readings.
+        """
+        climatology_lines = []
+
+        for month in range(1, 13):
+            baseline = weather_climatology.get_baseline(month)
+
+            if not baseline:
+                continue
+
+            first_year, last_year = weather_climatology.get_year_span(month)
+            climatology_lines.append(f"{month_name[month]} ({first_year}-{last_year})")
+
+            for monthly_average_key, (average_label, unit_of_measurement) in MONTHLY_AVERAGE_LABELS.items():
+                if monthly_average_key in baseline:
+                    attribute_baseline = baseline[monthly_average_key]
+                    climatology_lines.append(
+                        f"{average_label}: {attribute_baseline["mean"]}{unit_of_measurement} "
+                        f"(min {attribute_baseline["min"]}{unit_of_measurement}, "
+                        f"max {attribute_baseline["max"]}{unit_of_measurement})"
+                    )
+
+        return ["Climatology", *climatology_lines] if climatology_lines else []
+
+    @staticmethod
+    def format_anomaly_report(year, month, monthly_anomalies, year_span):
+        """
+        Format the averages of a month and their differences from its climatology as strings.
+
+        Args:
+            year (int): Year of the month.
+            month (int): Month (1–12).
+            monthly_anomalies (dict[str, tuple[float, float]]): Average and difference from the
+                baseline mean per monthly average key, as MonthlyClimatology.get_anomalies returns them.
+            year_span (tuple[int, int]): First and last year of the baseline.
+
+        Returns:
+            list[str]: List of lines for printing.
+        """
+        anomaly_lines = [f"{month_name[month]} {year} vs {month_name[month]} {year_span[0]}-{year_span[1]}"]
+
+        for monthly_average_key, (average_label, unit_of_measurement) in MONTHLY_AVERAGE_LABELS.items():
+            if monthly_average_key in monthly_anomalies:
+                monthly_average, anomaly = monthly_anomalies[monthly_average_key]
+                anomaly_lines.append(
+                    f"{average_label}: {monthly_average}{unit_of_measurement} "
+                    f"({anomaly:+}{unit_of_measurement})"
+                )
+
+        return anomaly_lines
+
+    @staticmethod
+    def format_quantile_report(report_period, attribute_percentiles):
+        """
+        Format the percentiles of a year or month as strings.
+
+        Args:
+            report_period (int | tuple[int, int]): A year, or a (year, month) pair.
+            attribute_percentiles (dict[str, dict[str, int]]): Percentile values by name for each
+                attribute, as calculate_percentiles returns them.
+
+        Returns:
+            list[str]: List of lines for printing.
+        """
+        if isinstance(report_period, int):
+            quantile_lines = [f"Quantiles {report_period}"]
+        else:
+            quantile_lines = [f"Quantiles {month_name[report_period[1]]} {report_period[0]}"]
+
+        for weather_attribute, (attribute_label, unit_of_measurement) in QUANTILE_ATTRIBUTE_LABELS.items():
+            if weather_attribute in attribute_percentiles:
+                quantile_lines.append(f"{attribute_label}: " + ", ".join(
+                    f"{percentile_name} {percentile_value}{unit_of_measurement}"
+                    for percentile_name, percentile_value in attribute_percentiles[weather_attribute].items()
+                ))
+
+        return quantile_lines
+
+    @staticmethod
+    @lru_cache(maxsize=TEMP_BAR_CACHE_SIZE)
+    def get_temp_bar(color, temp_value):
+        """
+        Return the colored bar of a temperature, built once per color and value.
+
+        Only the TEMP_BAR_CACHE_SIZE most recently used bars are kept, which covers every
+        bar of both colors over realistic temperatures.
+
+        Args:
+            color (str): ANSI color code starting the bar, or "" without colors.
+            temp_value (int): Temperature the bar represents; negative values give an empty bar.
+
+        Returns:
+            str: The color code followed by one '+' per degree.
+        """
+        return f"{color}{'+' * max(0, temp_value)}"
+
+    def format_temperature_bars(self, weather_reading, horizontal=False):
         """
         Generate temperature bar(s) for a single reading.
 
@@ -163,17 +364,18 @@ class WeatherReadingFormatter:
         temp_bars_formatter = None
 
         if weather_reading.max_temp and weather_reading.min_temp:
+            red, blue, purple, reset = self.colors
             day = f"{weather_reading.date.day:02d}"
 
-            min_temp_bar = f"{BLUE}{'+' * max(0, weather_reading.min_temp)}"
-            max_temp_bar = f"{RED}{'+' * max(0, weather_reading.max_temp)}"
-            temp_values = f"{PURPLE} {weather_reading.min_temp}C - {weather_reading.max_temp}C {RESET}"
+            min_temp_bar = self.get_temp_bar(blue, weather_reading.min_temp)
+            max_temp_bar = self.get_temp_bar(red, weather_reading.max_temp)
+            temp_values = f"{purple} {weather_reading.min_temp}C - {weather_reading.max_temp}C {reset}"
 
             temp_bars_formatter = (
                 f"{day} {min_temp_bar}+{max_temp_bar}{temp_values}" if horizontal else
                 [
-                    f"{day} {max_temp_bar} {PURPLE}{weather_reading.max_temp}C {RESET}",
-                    f"{day} {min_temp_bar} {PURPLE}{weather_reading.min_temp}C {RESET}"
+                    f"{day} {max_temp_bar} {purple}{weather_reading.max_temp}C {reset}",
+                    f"{day} {min_temp_bar} {purple}{weather_reading.min_temp}C {reset}"
                 ]
             )
 
@@ -184,7 +386,7 @@ class WeatherReadingFormatter:
         Prepare temperature chart lines for a month.
 
         Args:
-            monthly_weather_readings (list[WeatherReading]): List of readings.
+            monthly_weather_readings (list[WeatherReading] | WeatherReadingStore): Readings of the month.
             horizontal (bool): Whether to format horizontal bars.
 
         Returns:
@@ -30,7 +30,7 @@ class WeatherReportConsoleView:
     def display_yearly_report(self, yearly_weather_report):
         """
         Display the yearly weather report including highest temperature, lowest temperature,
-        and highest mean humidity.
+        and highest mean humidity, written with a single print.
 
         Args:
             yearly_weather_report (list[dict]): A list of dictionaries, each containing WeatherReading data with keys:
@@ -42,8 +42,7 @@ class WeatherReportConsoleView:
         Returns:
             None
         """
-        for weather_report in yearly_weather_report:
-            print(weather_report)
+        print("\n".join(yearly_weather_report))
 
     @staticmethod
     def display_monthly_report(monthly_statistics):
@@ -68,7 +67,7 @@ class WeatherReportConsoleView:
 
     def display_temp_chart(self, formatted_temp_bars):
         """
-        Display a formatted temperature chart for a month.
+        Display a formatted temperature chart for a month, written with a single print.
 
         Args:
             formatted_temp_bars (list[str]): A list of strings, each representing a line in the
@@ -77,8 +76,21 @@ class WeatherReportConsoleView:
         Returns:
             None
         """
-        for temp_bar in formatted_temp_bars:
-            print(temp_bar)
+        print("\n".join(formatted_temp_bars))
+
+    @staticmethod
+    def display_report_lines(report_lines):
+        """
+        Display the formatted lines of a date range, moving average, climatology, anomaly
+        or quantile report, written with a single print.
+
+        Args:
+            report_lines (list[str]): Lines of the report.
+
+        Returns:
+            None
+        """
+        print("\n".join(report_lines))
 
     def display_weather_report(
             self, weather_report_display_method, weather_report_data, year=None, month=None
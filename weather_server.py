@@ -0,0 +1,298 @@
+import asyncio
+import json
+
+from constants import (
+    ALL_STATIONS,
+    DEFAULT_PARSER_WORKERS,
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
+    REPORT_CACHE_SIZE,
+    SERVER_RELOAD_INTERVAL_SECONDS,
+    SERVER_REQUEST_ENCODING,
+    SERVER_REQUEST_FLAG_FIELDS,
+    SERVER_REQUEST_LIST_FIELDS,
+    SERVER_REQUEST_TEXT_FIELDS,
+)
+from report_cache import ReportResultCache
+
+
+class WeatherReportServer:
+    """
+    Long-running report server that keeps the parsed and indexed readings in memory.
+
+    The weather directory is loaded once. Clients send one JSON line with the requested
+    reports ({"yearly": [...], "monthly": [...], "chart": [...], "hchart": [...],
+    "from": "YYYY-MM-DD", "to": "YYYY-MM-DD", "rolling": [...], "climatology": true,
+    "anomaly": [...], "quantiles": [...], "station": [...]}) and receive
+    the text the CLI would print for the same arguments. The directory is polled in the
+    background and reloaded when a weather file is added, removed or changed; with the
+    reading cache enabled, only the changed files are parsed again.
+
+    Rendered reports are kept in an LRU report cache. Each entry is tagged with the
+    modification times and sizes of the files its period may read, so a reload only
+    invalidates the reports whose files changed.
+    """
+    def __init__(
+            self, weather_man, directory, workers=DEFAULT_PARSER_WORKERS, reading_cache=None,
+            reload_interval=SERVER_RELOAD_INTERVAL_SECONDS, report_cache_size=REPORT_CACHE_SIZE
+    ):
+        self.weather_man = weather_man
+        self.directory = directory
+        self.workers = workers
+        self.reading_cache = reading_cache
+        self.reload_interval = reload_interval
+        self.loaded_data = ({}, None, {})
+
+        self.weather_man.report_cache = ReportResultCache(report_cache_size)
+
+    def snapshot_files(self):
+        """
+        Record the modification time and size of every weather file.
+
+        Returns:
+            dict[Path, tuple[int, int]]: Mapping of weather file to its (mtime_ns, size).
+        """
+        file_snapshot = {}
+
+        for weather_data_file in self.weather_man.weather_data_parser.select_weather_files(self.directory):
+            file_stat = weather_data_file.stat()
+            file_snapshot[weather_data_file] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        return file_snapshot
+
+    def load(self):
+        """
+        Parse the weather directory into station shards, then swap the new data in.
+
+        The previous data keeps answering queries until the new data is ready. The file
+        snapshot, the weather data and the period data versions derived from the snapshot
+        are swapped together, so a query never mixes two loads.
+        """
+        file_snapshot = self.snapshot_files()
+
+        with self.weather_man.stage_profiler.measure("parse") as parse_statistics:
+            station_shards = self.weather_man.load_station_shards(
+                self.directory,
+                workers=self.workers,
+                reading_cache=self.reading_cache
+            )
+
+        parse_statistics.rows += station_shards.count_readings()
+        self.loaded_data = (file_snapshot, station_shards, {})
+
+    def get_period_data_version(self, station, report_query, file_snapshot, period_data_versions):
+        """
+        Return the version of the data a station's report is computed from.
+
+        Args:
+            station (str): Station name, or ALL_STATIONS.
+            report_query (ReportQuery): A planned report without an error.
+            file_snapshot (dict[Path, tuple[int, int]]): Files the weather data was loaded from.
+            period_data_versions (dict): Versions already computed from the same snapshot.
+
+        Returns:
+            tuple[tuple[str, tuple[int, int]], ...]: Name, modification time and size of every
+            weather file of the station that may hold readings of the report's period.
+        """
+        weather_data_parser = self.weather_man.weather_data_parser
+        version_key = (station, report_query.report_type, report_query.period)
+
+        if version_key not in period_data_versions:
+            period_predicate = self.weather_man.query_planner.get_period_predicate([report_query])
+
+            period_data_versions[version_key] = tuple(
+                (str(weather_data_file), file_version)
+                for weather_data_file, file_version in file_snapshot.items()
+                if (
+                    station == ALL_STATIONS
+                    or weather_data_parser.get_station_name(weather_data_file, self.directory) == station
+                )
+                and (
+                    period_predicate is None
+                    or weather_data_parser.file_may_match(weather_data_file, period_predicate)
+                )
+            )
+
+        return period_data_versions[version_key]
+
+    async def reload_changed_files(self):
+        """Poll the weather directory and reload it whenever its files change."""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+
+            if await asyncio.to_thread(self.snapshot_files) != self.loaded_data[0]:
+                await asyncio.to_thread(self.load)
+
+    @staticmethod
+    def validate_report_request(report_request):
+        """
+        Check the type of every field of a report request before it is planned.
+
+        Args:
+            report_request: The decoded JSON request.
+
+        Returns:
+            dict: The request, with the entries of its list fields converted to strings as
+            the CLI passes them.
+
+        Raises:
+            ValueError: If the request is not an object, has an unknown field, or a field
+                of the wrong type.
+        """
+        if not isinstance(report_request, dict):
+            raise ValueError("Report request must be a JSON object.")
+
+        validated_request = {}
+
+        for field_name, field_value in report_request.items():
+            if field_value is None:
+                continue
+
+            if field_name in SERVER_REQUEST_LIST_FIELDS:
+                if not isinstance(field_value, list) or not all(
+                    isinstance(field_entry, (str, int)) and not isinstance(field_entry, bool)
+                    for field_entry in field_value
+                ):
+                    raise ValueError(f'"{field_name}" must be a list of strings or integers.')
+
+                validated_request[field_name] = [str(field_entry) for field_entry in field_value]
+            elif field_name in SERVER_REQUEST_TEXT_FIELDS:
+                if not isinstance(field_value, str):
+                    raise ValueError(f'"{field_name}" must be a string.')
+
+                validated_request[field_name] = field_value
+            elif field_name in SERVER_REQUEST_FLAG_FIELDS:
+                if not isinstance(field_value, bool):
+                    raise ValueError(f'"{field_name}" must be true or false.')
+
+                validated_request[field_name] = field_value
+            else:
+                raise ValueError(f'Unknown field "{field_name}".')
+
+        return validated_request
+
+    def render_reports(self, report_request):
+        """
+        Render the requested reports exactly as the CLI prints them.
+
+        Args:
+            report_request (dict): Requested periods per report type, and an optional
+                "cache_stats" flag to append the report cache summary.
+
+        Returns:
+            str: The rendered reports.
+        """
+        file_snapshot, station_shards, period_data_versions = self.loaded_data
+        report_queries = self.weather_man.query_planner.plan(
+            report_request.get("yearly"),
+            report_request.get("monthly"),
+            report_request.get("chart"),
+            report_request.get("hchart"),
+            (report_request.get("from"), report_request.get("to")),
+            report_request.get("rolling"),
+            bool(report_request.get("climatology")),
+            report_request.get("anomaly"),
+            report_request.get("quantiles")
+        )
+        selected_stations = list(dict.fromkeys(report_request.get("station") or [ALL_STATIONS]))
+        unknown_stations = set(selected_stations) - {ALL_STATIONS, *station_shards.station_shards}
+
+        if unknown_stations:
+            return f"Unknown station(s): {', '.join(sorted(unknown_stations))}\n"
+
+        rendered_reports = []
+
+        for station in selected_stations:
+            station_shard = station_shards.get_shard(station)
+
+            if len(selected_stations) > 1:
+                rendered_reports.append(f"Station: {station}\n")
+
+            rendered_reports.extend(
+                self.weather_man.render_report_query(
+                    report_query,
+                    station_shard.weather_rollups,
+                    station_shard.weather_readings,
+                    data_version=None if report_query.error else self.get_period_data_version(
+                        station, report_query, file_snapshot, period_data_versions
+                    ),
+                    station=station
+                )
+                for report_query in report_queries
+            )
+
+        if report_request.get("cache_stats"):
+            rendered_reports.append(f"{self.weather_man.report_cache.format_summary()}\n")
+
+        return "".join(rendered_reports)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Answer the report request of one client connection.
+
+        Args:
+            reader (asyncio.StreamReader): Stream the request line is read from.
+            writer (asyncio.StreamWriter): Stream the rendered reports are written to.
+        """
+        try:
+            report_request = self.validate_report_request(json.loads(await reader.readline()))
+            response = self.render_reports(report_request)
+        except ValueError as request_error:
+            response = f"Invalid report request: {request_error}\n"
+
+        writer.write(response.encode(SERVER_REQUEST_ENCODING))
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve(self, host=DEFAULT_SERVER_HOST, port=DEFAULT_SERVER_PORT):
+        """
+        Load the weather directory and answer report requests until cancelled.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on.
+        """
+        await asyncio.to_thread(self.load)
+
+        report_server = await asyncio.start_server(self.handle_connection, host, port)
+        reload_task = asyncio.create_task(self.reload_changed_files())
+
+        print(f"Serving weather reports on {host}:{port}", flush=True)
+
+        try:
+            async with report_server:
+                await report_server.serve_forever()
+        finally:
+            reload_task.cancel()
+
+
+class WeatherReportClient:
+    """Thin client sending a report request to a WeatherReportServer."""
+    def __init__(self, host=DEFAULT_SERVER_HOST, port=DEFAULT_SERVER_PORT):
+        self.host = host
+        self.port = port
+
+    async def request_reports(self, report_request):
+        """
+        Send a report request and read the rendered reports.
+
+        Args:
+            report_request (dict): Requested periods per report type.
+
+        Returns:
+            str: The rendered reports.
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+
+        try:
+            writer.write(json.dumps(report_request).encode(SERVER_REQUEST_ENCODING) + b"\n")
+            await writer.drain()
+
+            return (await reader.read()).decode(SERVER_REQUEST_ENCODING)
+        finally:
+            writer.close()
+            await writer.wait_closed()